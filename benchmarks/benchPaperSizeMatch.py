@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+'''
+Benchmark: match floating paper dimensions (as returned by QPrinter.paperSize(Millimeter)) to a paper enum.
+
+Compares:
+- legacy: round to integral mm, build QSize copies, probe inverse dictionary (formerly Paper.enumForPageSizeByMatchDimensions)
+- matcher: PaperSizeMatcher (now behind Paper.enumForPageSizeByMatchDimensions)
+
+Run from the repository root:
+>python benchmarks/benchPaperSizeMatch.py
+'''
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QSizeF
+from PyQt5.QtGui import QPageLayout, QPageSize
+
+from qtPrintFramework.orientedSize import OrientedSize
+from qtPrintFramework.pageLayout.model.pageEnumToSize import pageEnumToSize, pageSizeToEnum
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.pageLayout.model.paperSizeMatcher import paperSizeMatcher
+
+
+def legacyEnumForPageSize(paperSizeMM, orientationEnum):
+  '''
+  Copy of former Paper.enumForPageSizeByMatchDimensions.
+  A miss formerly went to alertLog (syslog); here a miss is not logged, so legacy misses are flattered.
+  '''
+  roundedSize = OrientedSize.roundedSize(sizeF=paperSizeMM)
+  if roundedSize is None:
+    return None
+  definedRoundedSize = OrientedSize.portraitSizeMM(roundedSize, orientationEnum)
+  hashedDefinedRoundedSize = (definedRoundedSize.width(), definedRoundedSize.height())
+  return pageSizeToEnum.get(hashedDefinedRoundedSize)
+
+
+def matcherEnumForPageSize(paperSizeMM, orientationEnum):
+  return paperSizeMatcher.match(paperSizeMM.width(), paperSizeMM.height(), orientationEnum)
+
+
+def sampleSizes():
+  '''
+  Oriented sizes of papers in the legacy table (exact, from the catalog)
+  with the sub-millimeter error Qt introduces, both orientations, plus Custom (misses.)
+  '''
+  catalog = pageSizeCatalog()
+  hits = []
+  for enum in pageEnumToSize.keys():
+    width, height = catalog.size(enum, QPageSize.Millimeter)
+    hits.append((QSizeF(width + 0.3, height - 0.2), QPageLayout.Portrait))
+    hits.append((QSizeF(height - 0.1, width + 0.4), QPageLayout.Landscape))
+  misses = [(QSizeF(123.4, 456.7), QPageLayout.Portrait), (QSizeF(640, 480), QPageLayout.Landscape)]
+  return hits, misses
+
+
+def lookupsPerSecond(function, samples, repeat=5, number=200):
+  def run():
+    for size, orientation in samples:
+      function(size, orientation)
+  best = min(timeit.repeat(run, repeat=repeat, number=number))
+  return len(samples) * number / best
+
+
+def main():
+  hits, misses = sampleSizes()
+
+  for size, orientation in hits:
+    legacyEnum = legacyEnumForPageSize(size, orientation)
+    assert legacyEnum is None or legacyEnum == matcherEnumForPageSize(size, orientation)
+
+  print("{:<10} {:>16} {:>16}".format("", "hits/s", "misses/s"))
+  for name, function in (("legacy", legacyEnumForPageSize), ("matcher", matcherEnumForPageSize)):
+    print("{:<10} {:>16,.0f} {:>16,.0f}".format(name,
+                                                lookupsPerSecond(function, hits),
+                                                lookupsPerSecond(function, misses)))
+
+
+if __name__=="__main__":
+    main()
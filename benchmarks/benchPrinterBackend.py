@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+'''
+Benchmark: printer discovery, capability and propagation costs, on stand-in printers.
+
+Needs no print system: printers come from StandInPrinterBackend, with injected latencies,
+and Qt runs under the offscreen QPA (unless QT_QPA_PLATFORM is already set.)
+
+Measures:
+- discovery: PrinterSet, first (blocking) query versus later calls on the cached snapshot
+- capability: PrinterCapabilityCache, cold (driver queried), warm (same session), new session (validated from file),
+  and PrinterCapabilityProber (cold, concurrent)
+- propagation: AdaptorFromPageLayoutToPrinterAdaptor.toPrinterAdaptor(), by kind of change
+
+Run from the repository root:
+>python benchmarks/benchPrinterBackend.py --printers 20 --capability-latency 0.05
+'''
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtGui import QPageLayout, QPagedPaintDevice
+from PyQt5.QtWidgets import QApplication
+
+from qtPrintFramework.printer.printerBackend import setPrinterBackend
+from qtPrintFramework.printer.standInPrinterBackend import StandInPrinterBackend
+from qtPrintFramework.printer.printerSet import PrinterSet
+from qtPrintFramework.printer.capabilityCache import PrinterCapabilityCache
+from qtPrintFramework.printer.capabilityProber import PrinterCapabilityProber
+from qtPrintFramework.adaptPageLayoutToPrinter import AdaptorFromPageLayoutToPrinterAdaptor
+from qtPrintFramework.pageLayout.pageLayout import PageLayout
+
+
+def elapsed(function):
+  ''' tuple (seconds, result) '''
+  start = time.perf_counter()
+  result = function()
+  return time.perf_counter() - start, result
+
+
+def report(name, seconds, count=1, note=""):
+  print("{:<34} {:>12.3f} ms {}".format(name, seconds / count * 1e3, note))
+
+
+def benchDiscovery(backend):
+  printerSet = PrinterSet()
+  seconds, printers = elapsed(printerSet.availablePrinters)
+  report("discovery, first (blocking)", seconds, note="{} printers".format(len(printers)))
+  count = 1000
+  seconds, _ = elapsed(lambda: [printerSet.availablePrinters() for _ in range(count)])
+  report("discovery, cached", seconds, count)
+  return printerSet
+
+
+def benchCapabilities(backend, printerSet, directory):
+  names = printerSet.availablePrinterNames()
+  path = os.path.join(directory, "capabilities.json")
+
+  cache = PrinterCapabilityCache(path=path)
+  queriesBefore = backend.capabilityQueryCount
+  seconds, _ = elapsed(lambda: [cache.capabilities(name, save=False) for name in names])
+  cache.save()
+  report("capabilities, cold (sequential)", seconds, note="{} driver queries".format(backend.capabilityQueryCount - queriesBefore))
+  seconds, _ = elapsed(lambda: [cache.capabilities(name) for name in names])
+  report("capabilities, warm", seconds)
+
+  newSessionCache = PrinterCapabilityCache(path=path)
+  queriesBefore = backend.capabilityQueryCount
+  seconds, _ = elapsed(lambda: [newSessionCache.capabilities(name) for name in names])
+  report("capabilities, new session", seconds, note="{} driver queries".format(backend.capabilityQueryCount - queriesBefore))
+
+  prober = PrinterCapabilityProber(printerSet=printerSet, cache=PrinterCapabilityCache(path=path + ".probed"))
+  def probe():
+    prober.probe()
+    prober.wait()
+  seconds, _ = elapsed(probe)
+  report("capabilities, cold (prober)", seconds, note="{} probed".format(len(prober.results)))
+
+
+def benchPropagation(backend):
+  printerAdaptor = backend.newPrinterAdaptor()
+  pageLayout = PageLayout()
+  adaptor = AdaptorFromPageLayoutToPrinterAdaptor()
+  adaptor.toPrinterAdaptor(pageLayout, printerAdaptor)
+
+  papers = (QPagedPaintDevice.A4, QPagedPaintDevice.Letter)
+  orientations = (QPageLayout.Portrait, QPageLayout.Landscape)
+  def unchanged(index):
+    pass
+  def paper(index):
+    pageLayout.paper.value = papers[index % 2]
+  def orientation(index):
+    pageLayout.orientation.value = orientations[index % 2]
+
+  count = 200
+  for name, change in (("unchanged", unchanged), ("paper", paper), ("orientation", orientation)):
+    qtCallsBefore = printerAdaptor.qtCallCount
+    def run():
+      for index in range(count):
+        change(index)
+        adaptor.toPrinterAdaptor(pageLayout, printerAdaptor)
+    seconds, _ = elapsed(run)
+    report("propagation, " + name, seconds, count,
+           note="{:.1f} Qt calls".format((printerAdaptor.qtCallCount - qtCallsBefore) / count))
+
+
+def main():
+  parser = argparse.ArgumentParser(description="Benchmark printer costs on stand-in printers.")
+  parser.add_argument("--printers", type=int, default=20)
+  parser.add_argument("--discovery-latency", type=float, default=0.2, help="seconds")
+  parser.add_argument("--capability-latency", type=float, default=0.05, help="seconds, per printer")
+  parser.add_argument("--call-latency", type=float, default=0.0005, help="seconds, per Qt call")
+  args = parser.parse_args()
+
+  app = QApplication(sys.argv)
+  app.setOrganizationName("qtPrintFrameworkBenchmark")
+  app.setApplicationName("benchPrinterBackend")
+
+  backend = StandInPrinterBackend(printerCount=args.printers,
+                                  discoveryLatency=args.discovery_latency,
+                                  capabilityLatency=args.capability_latency,
+                                  callLatency=args.call_latency)
+  setPrinterBackend(backend)
+
+  printerSet = benchDiscovery(backend)
+  with tempfile.TemporaryDirectory() as directory:
+    benchCapabilities(backend, printerSet, directory)
+  benchPropagation(backend)
+
+
+if __name__=="__main__":
+    main()
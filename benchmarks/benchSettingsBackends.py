@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+'''
+Benchmark: load and save latency of settings backends.
+
+For each backend (QSettings, memory, JSON profile), in a temporary directory:
+- save: SettingsBackend.write() of a page layout record, synchronous (as SettingsWriter does when it flushes)
+- load: SettingsBackend.read() of its group
+- round trip: PageLayout.toSettings() then fromSettings() (a new PageLayout), through SettingsWriter
+
+Memory is the floor: the cost of Settingsable itself, apart from storage.
+
+Run from the repository root:
+>python benchmarks/benchSettingsBackends.py
+'''
+
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication
+
+from qtPrintFramework.settings.settingsBackend import (QSettingsBackend, MemorySettingsBackend, JSONSettingsBackend,
+                                                       setSettingsBackend)
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+from qtPrintFramework.pageLayout.pageLayout import PageLayout
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+
+
+COUNT = 200
+GROUP = "paperlessPrinter"
+
+
+def microseconds(function, number=COUNT):
+  ''' Best of 3, per call. '''
+  return min(timeit.repeat(function, repeat=3, number=number)) / number * 1e6
+
+
+def measure(backend):
+  setSettingsBackend(backend)
+  values = {"pageLayoutRecord" : PageLayoutRecord(0, 0, (210, 297)).encode()}
+  save = microseconds(lambda: backend.write(GROUP, values))
+  load = microseconds(lambda: backend.read(GROUP))
+
+  pageLayout = PageLayout()
+  def roundTrip():
+    pageLayout.toSettings()
+    PageLayout()  # fromSettings() flushes first
+  trip = microseconds(roundTrip)
+  return save, load, trip
+
+
+def main():
+  app = QApplication(sys.argv)
+  app.setOrganizationName("qtPrintFrameworkBenchmark")
+  app.setApplicationName("benchSettingsBackends")
+
+  with tempfile.TemporaryDirectory() as directory:
+    # Not the user's settings
+    QSettings.setDefaultFormat(QSettings.IniFormat)
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, directory)
+
+    backends = (("QSettings", QSettingsBackend()),
+                ("memory", MemorySettingsBackend()),
+                ("JSON", JSONSettingsBackend(path=os.path.join(directory, "profile.json"))))
+    print("{:<10} {:>12} {:>12} {:>14}".format("", "save us", "load us", "round trip us"))
+    for name, backend in backends:
+      print("{:<10} {:>12.1f} {:>12.1f} {:>14.1f}".format(name, *measure(backend)))
+    setSettingsBackend(None)
+
+  print("SettingsWriter: {} writes requested, {} performed".format(settingsWriter.writesRequested,
+                                                                  settingsWriter.writesPerformed))
+
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+'''
+Benchmark: cost of paper and orientation objects.
+
+Compares, for the same sequence of enums:
+- QObject: a new StandardPaper / Orientation per use (what PrinterAdaptor.paper() and orientation() return)
+- value: PaperValue / OrientationValue (interned, what paperValue() and orientationValue() return)
+
+Reports time per object, memory retained while objects are alive, and count of allocated blocks (tracemalloc.)
+Allocations inside Qt (C++) are not seen by tracemalloc, so QObject costs are understated.
+
+Run from the repository root:
+>python benchmarks/benchValueTypes.py
+'''
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtGui import QPageLayout
+
+from qtPrintFramework.pageLayout.model.pageEnumToSize import pageEnumToSize
+from qtPrintFramework.pageLayout.components.paper.standard import StandardPaper
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
+from qtPrintFramework.pageLayout.components.orientation import Orientation
+from qtPrintFramework.pageLayout.components.orientationValue import OrientationValue
+
+
+COUNT = 10000
+
+
+def enums():
+  paperEnums = list(pageEnumToSize.keys())
+  orientationEnums = (QPageLayout.Portrait, QPageLayout.Landscape)
+  return [(paperEnums[i % len(paperEnums)], orientationEnums[i % 2]) for i in range(COUNT)]
+
+
+def createQObjects(pairs):
+  return [(StandardPaper(paper), Orientation(orientation)) for paper, orientation in pairs]
+
+
+def createValues(pairs):
+  return [(PaperValue.standard(paper), OrientationValue.forEnum(orientation)) for paper, orientation in pairs]
+
+
+def measureMemory(function, pairs):
+  '''
+  tuple (bytes retained, blocks retained) while the created objects are alive
+  '''
+  tracemalloc.start()
+  before = tracemalloc.take_snapshot()
+  created = function(pairs)
+  after = tracemalloc.take_snapshot()
+  tracemalloc.stop()
+  statistics = after.compare_to(before, 'filename')
+  sizeDiff = sum(statistic.size_diff for statistic in statistics)
+  countDiff = sum(statistic.count_diff for statistic in statistics)
+  del created
+  return sizeDiff, countDiff
+
+
+def main():
+  pairs = enums()
+  print("{:<10} {:>14} {:>16} {:>16}".format("", "us/object", "bytes retained", "blocks retained"))
+  for name, function in (("QObject", createQObjects), ("value", createValues)):
+    seconds = min(timeit.repeat(lambda: function(pairs), repeat=3, number=1))
+    size, count = measureMemory(function, pairs)
+    print("{:<10} {:>14.3f} {:>16,} {:>16,}".format(name, seconds / COUNT * 1e6, size, count))
+
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+'''
+Import-time budget: the cost of importing qtPrintFramework's entry points.
+
+Measures, with 'python -X importtime' in a fresh process, the self time (excluding PyQt5 and the standard library)
+of every qtPrintFramework module imported by:
+- qtPrintFramework.converser.unprintered
+- qtPrintFramework.converser.printered
+
+Also checks that importing does not build the lazy tables (page size catalog, matcher, name and size dictionaries.)
+Those are built on first access: see qtPrintFramework.lazyModule.
+
+Exits non-zero if a budget is exceeded or a table was built at import.
+Run from the repository root (a display is not needed):
+>python benchmarks/importTimeBudget.py
+'''
+
+import os
+import subprocess
+import sys
+
+repositoryRoot = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Microseconds of self time in qtPrintFramework modules.  About three times the measured cost (~10 ms.)
+budgets = {'qtPrintFramework.converser.unprintered' : 30000,
+           'qtPrintFramework.converser.printered' : 30000 }
+
+# Best of repeats, since the first run may compile .pyc files
+repeats = 5
+
+# Statement run after import, in the same process, prints names of lazy tables that were built
+lazyCheck = '''
+import sys
+import qtPrintFramework.pageLayout.model.pageSizeCatalog as catalog
+built = []
+if catalog._pageSizeCatalog is not None:
+  built.append('pageSizeCatalog')
+for moduleName, names in (('qtPrintFramework.pageLayout.model.paperSizeMatcher', ('paperSizeMatcher', )),
+                          ('qtPrintFramework.pageLayout.model.pageNameToEnum', ('pageNameToEnumModel', 'pageNameToEnum', 'pageEnumToName')),
+                          ('qtPrintFramework.pageLayout.model.pageEnumToSize', ('pageEnumToSize', 'pageSizeToEnum'))):
+  module = sys.modules.get(moduleName)
+  if module is not None:
+    built.extend(name for name in names if name in vars(module))
+print(','.join(built))
+'''
+
+
+def environment():
+  result = dict(os.environ)
+  result.setdefault('QT_QPA_PLATFORM', 'offscreen')
+  result['PYTHONPATH'] = os.pathsep.join(filter(None, (repositoryRoot, result.get('PYTHONPATH'))))
+  return result
+
+
+def importOnce(moduleName):
+  '''
+  tuple (microseconds of self time in qtPrintFramework modules, list of names of lazy tables built at import)
+  '''
+  completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + moduleName + '\n' + lazyCheck],
+                             cwd=repositoryRoot, env=environment(),
+                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+  selfTime = 0
+  for line in completed.stderr.splitlines():
+    # Format: 'import time: self [us] | cumulative | imported package'
+    if not line.startswith('import time:'):
+      continue
+    fields = line[len('import time:'):].split('|')
+    if len(fields) != 3 or not fields[2].strip().startswith('qtPrintFramework'):
+      continue
+    selfTime += int(fields[0])
+  built = [name for name in completed.stdout.strip().split(',') if name]
+  return selfTime, built
+
+
+def main():
+  failed = False
+  print("{:<42} {:>10} {:>10}  {}".format("module", "self us", "budget us", "built at import"))
+  for moduleName, budget in budgets.items():
+    results = [importOnce(moduleName) for _ in range(repeats)]
+    selfTime = min(result[0] for result in results)
+    built = results[-1][1]
+    print("{:<42} {:>10,} {:>10,}  {}".format(moduleName, selfTime, budget, ', '.join(built) or '-'))
+    if selfTime > budget or built:
+      failed = True
+  if failed:
+    print("FAILED: import-time budget exceeded, or a lazy table was built at import")
+    sys.exit(1)
+
+
+if __name__=="__main__":
+  main()
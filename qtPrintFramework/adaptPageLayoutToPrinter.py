@@ -3,7 +3,7 @@ from PyQt5.QtCore import QSizeF
 from PyQt5.QtGui import QPageLayout # , QPageSize
 
 from qtPrintFramework.orientedSize import OrientedSize
-from qtPrintFramework.alertLog import alertLog
+from qtPrintFramework.alertLog import alertLog, debugLog
 
 from qtPrintFramework.pageLayout.components.orientation import Orientation
 from qtPrintFramework.pageLayout.components.paper.paper import Paper
@@ -24,6 +24,9 @@ class AdaptorFromPageLayoutToPrinterAdaptor():
     for attribute in self:
       attribute.toPrinterAdaptor(printerAdaptor)
   '''
+  
+  # Count of Qt calls by last toPrinterAdaptor()
+  lastPropagationQtCallCount = 0
 
   def fromPrinterAdaptor(self, pageLayout, printerAdaptor):
     '''
@@ -31,15 +34,18 @@ class AdaptorFromPageLayoutToPrinterAdaptor():
     And update controls (which are not visible, and are in parallel with native dialog controls.)
     '''
     " !!! just change value, don't replace paper instance because QML is bound to the instance. "
-    print("Printer: ", printerAdaptor.description)  # ,"has paper:", printerAdaptor.paper())
-    pageLayout.paper.value = printerAdaptor.paper().value # new instance
-    pageLayout.orientation.value = printerAdaptor.orientation().value
-    if pageLayout.paper.isCustom:
-      # capture size chosen by user, say in native Print dialog
-      integralOrientedSizeMM = OrientedSize.roundedSize(sizeF=printerAdaptor.paperSizeMM)
-      pageLayout.paper.setSize(integralOrientedSizeMM = integralOrientedSizeMM, 
-                         orientation=pageLayout.orientation)
-    # else size of paper is standard.
+    debugLog("Printer: " + printerAdaptor.description)
+    snapshot = printerAdaptor.snapshot()
+    # One layoutChanged, after all are set (not one per attribute, nor with Custom paper of a stale size.)
+    with pageLayout.batchUpdate():
+      pageLayout.paper.value = snapshot.paperValue.value
+      pageLayout.orientation.value = snapshot.orientationValue.value
+      if pageLayout.paper.isCustom:
+        # capture size chosen by user, say in native Print dialog
+        integralOrientedSizeMM = OrientedSize.roundedSize(sizeF=QSizeF(*snapshot.paperSizeMM))
+        pageLayout.paper.setSize(integralOrientedSizeMM = integralOrientedSizeMM,
+                           orientation=pageLayout.orientation.value)
+      # else size of paper is standard.
     
     # editor and settings are not updated                    
     assert isinstance(pageLayout.paper, Paper)
@@ -50,106 +56,93 @@ class AdaptorFromPageLayoutToPrinterAdaptor():
     '''
     Set my values on printerAdaptor (and whatever printer it is adapting.)
     
-    1. !!! setPaperSize,  setPageSize() is Qt obsolete
-    2. printerAdaptor wants oriented size
-    
-    !!! setPaperSize is overloaded.
-    # TODO should this be orientedPaperSizeDevicePixels ?
+    1. !!! Sets paper by QPageSize (exact definition), not by enum nor QSizeF (see _toPrinterAdaptorByDefinition)
+    2. QPrinter wants defined (portrait) size: Qt applies orientation separately.
     
     Qt docs for setPaperSize() say: "Sets the printer paper size to newPaperSize if that size is supported. 
     The result is undefined if newPaperSize is not supported."
-    The same applies here; this may not have the intended effect.
-    '''
-    
-    # !!! Requires Qt 5.3 setPageO instead of setOrientation
-    #print(type(pageLayout.orientation.value))
-    printerAdaptor.setPageOrientation(pageLayout.orientation.value)
+    The same applies to setPageSize(); this may not have the intended effect.
     
-    # Formerly we called _toPrinterAdaptorByIntegralMMSize() here
+    Minimal: compares pageLayout to printerAdaptor's snapshot (its last known state)
+    and calls only the setters for attributes that differ.
+    Verifies once, only if anything was set.
     
+    Returns count of Qt calls made (setters and queries), also in lastPropagationQtCallCount.
     '''
-    Set paper by enum where possible.  Why do we need this is additon to the above?
-    Because floating point errors in some versions of Qt, 
-    setting paperSize by a QSizeF does not always have the intended effect on enum.
-    '''
-    ##WAS if pageLayout.paper.isCustom :
-    if pageLayout.paperIsCustom() :
-      # Illegal to call setPaperSize(QPrinter.Custom)
-      pageLayout._toPrinterAdaptorByIntegralMMSize(printerAdaptor)
-    else:
-      printerAdaptor.setPaperSize(pageLayout.paper.value)
-      ##WAS printerAdaptor.setPaperSize(pageLayout.paper)
+    qtCallCountBefore = printerAdaptor.qtCallCount
+    snapshot = printerAdaptor.snapshot()
+    orientationEnum = pageLayout.orientation.value
+    isChanged = False
+    
+    if orientationEnum != snapshot.orientationValue.value:
+      isChanged = True
+      # !!! Requires Qt 5.3 setPageO instead of setOrientation
+      printerAdaptor.setPageOrientation(orientationEnum)
+    
+    # Also when only Qt's enum disagrees (Qt bug): setting fixes it
+    if not snapshot.hasPaper(pageLayout.paper.paperValue):
+      isChanged = True
+      '''
+      Set by exact definition, once.
+      WAS: set by enum (or rounded mm for Custom), verify, and on failure retry by rounded mm size and verify again.
+      '''
+      self._toPrinterAdaptorByDefinition(pageLayout, printerAdaptor)
     
     '''
     Strong assertion might not hold: Qt might be showing paper dimensions QSizeF(0,0) for Custom
     (Which is bad programming.  None or Null should represent unknown.)
     
     Or, despite trying to set QPrinter consistent, Qt bugs still don't meet strong assertion.
-    '''
-    if not self.isEqualPrinterAdaptor(pageLayout, printerAdaptor):
-      '''
-      Setting by enum (non-custom) has failed.  (Typically on OSX?)
-      Fallback: attempt to set by size.
-      '''
-      pageLayout._toPrinterAdaptorByIntegralMMSize(printerAdaptor)
     
-    """
-    Tried this for OSX, but it did not succeed in getting native dialog to agree with pageLayout.
-    So Qt versions < 5.3 have a bug that cannot be worked around by this framework.
-    if not self.isEqualPrinterAdaptor(pageLayout, printerAdaptor):
-      pageLayout._toPrinterAdaptorByFloatInchSize(printerAdaptor)
-    """
-      
-    self.warnIfDisagreesWithPrinterAdaptor(pageLayout, printerAdaptor)
+    Verify once, only if something was set: else the snapshot already agrees.
+    '''
+    if isChanged:
+      self.warnIfDisagreesWithPrinterAdaptor(pageLayout, printerAdaptor)
+
     # Ideally (if Qt was bug free) these assertions should hold
     #assert self.isStronglyEqualPrinterAdaptor(pageLayout, printerAdaptor)
     #assert self.isEqualPrinterAdaptor(pageLayout, printerAdaptor)
     
+    self.lastPropagationQtCallCount = printerAdaptor.qtCallCount - qtCallCountBefore
+    debugLog("toPrinterAdaptor Qt calls: " + str(self.lastPropagationQtCallCount))
+    return self.lastPropagationQtCallCount
     
-  def _toPrinterAdaptorByIntegralMMSize(self, pageLayout, printerAdaptor):
-    '''
-    Set my values on printerAdaptor (and whatever printer it is adapting) by setting size.
     
-    Take integral size, convert to float.
+
+  def _toPrinterAdaptorByDefinition(self, pageLayout, printerAdaptor):
     '''
-    # Even a Custom paper has a size, even if it is defaulted.
-    newPaperSizeMM = QSizeF(pageLayout.paper.integralOrientedSizeMM(pageLayout.orientation))
-    assert newPaperSizeMM.isValid()
-    # use overload QPrinter.setPaperSize(QPagedPaintDevice.PageSize, Units)
-    printerAdaptor.setPaperSize(newPaperSizeMM, QPageLayout.Millimeter)
+    Set paper on printerAdaptor (and whatever printer it is adapting) by its exact definition:
+    one call, QPrinter.setPageSize(QPageSize).
     
+    A standard paper is defined in its own unit (e.g. Letter 8.5x11 inch, A4 210x297 mm) from the page size catalog,
+    and by id, so Qt does not round through mm nor match by size (A4Small is not A4.)
+    A Custom paper is defined by integral mm.
     
-  def _toPrinterAdaptorByFloatInchSize(self, pageLayout, printerAdaptor):
+    Generalizes former _toPrinterAdaptorByFloatInchSize (Letter and Legal only)
+    and _toPrinterAdaptorByIntegralMMSize (rounded mm, then a retry by enum.)
     '''
-    Set my values on printerAdaptor (and whatever printer it is adapting) by setting size.
-    
-    Floating inch size.
-    '''
-    # TODO oriented, other inch unit sizes
-    if pageLayout.paper.value == QPageLayout.Legal:
-      newPaperSizeInch = QSizeF(8.5, 14)
-    elif pageLayout.paper.value == QPageLayout.Letter:
-      newPaperSizeInch = QSizeF(8.5, 11)
-    else:
-      return
-      
-    assert newPaperSizeInch.isValid()
-    # use overload QPrinter.setPaperSize(QPagedPaintDevice.PageSize, Units)
-    #print("setPaperSize(Inch)", newPaperSizeInch)
-    printerAdaptor.setPaperSize(newPaperSizeInch, QPageLayout.Inch)
-    
+    # Even a Custom paper has a size, even if it is defaulted.
+    pageSize = pageLayout.paper.paperValue.pageSize()
+    assert pageSize.isValid()
+    # Defined (portrait) size: Qt applies orientation separately.
+    printerAdaptor.setPageSize(pageSize)
+
     
     
   '''
   Support assertions about relations between pageLayout and printerAdaptor.
+  
+  Compare against printerAdaptor.snapshot(): repeated comparisons do not query Qt again.
   '''
 
   def isEqualPrinterAdaptor(self, pageLayout, printerAdaptor):
     '''
-    Weak comparison: computed printerAdaptor.paper() equal pageLayout.paper
+    Weak comparison: computed printerAdaptor.paperValue() equal pageLayout.paper
+    (or the standard paper Qt makes of a Custom paper of standard size, see PaperValue.qtPageSizeId())
     printerAdaptor.paperSize() might still not equal pageLayout.value
     '''
-    result = pageLayout.paper.value == printerAdaptor.paper().value and pageLayout.orientation.value == printerAdaptor.orientation().value
+    snapshot = printerAdaptor.snapshot()
+    result = pageLayout.paper.paperValue.qtPageSizeId() == snapshot.paperValue.value and pageLayout.orientation.value == snapshot.orientationValue.value
     if not result:
       alertLog("pageSetup differs")
       self.dumpDisagreement(pageLayout, printerAdaptor)
@@ -163,18 +156,20 @@ class AdaptorFromPageLayoutToPrinterAdaptor():
     Comparison of dimensions is unoriented (usually, width < height, but not always, Tabloid/Ledger).
     '''
     # partialResult: enums and orientation
-    # paperSize() is QPrinter.paperSize()
-    partialResult = pageLayout.paper.value == printerAdaptor.paperSize() \
-          and pageLayout.orientation.value == printerAdaptor.orientation().value
+    # qtPaperEnum is QPrinter.paperSize()
+    snapshot = printerAdaptor.snapshot()
+    partialResult = pageLayout.paper.value == snapshot.qtPaperEnum \
+          and pageLayout.orientation.value == snapshot.orientationValue.value
     
     # Compare sizes.  All Paper including Custom has a size.
-    sizeResult = partialResult and pageLayout.paper.isOrientedSizeEpsilonEqual(pageLayout.orientation.value, printerAdaptor.paperSizeMM)
+    sizeResult = partialResult and pageLayout.paper.isOrientedSizeEpsilonEqual(pageLayout.orientation.value,
+                                                                              QSizeF(*snapshot.paperSizeMM))
     
     result = partialResult and sizeResult
       
     if not result:
       alertLog('isStronglyEqualPrinterAdaptor returns False')
-      self.dumpDisagreement(printerAdaptor)
+      self.dumpDisagreement(pageLayout, printerAdaptor)
       
     return result
   
@@ -191,7 +186,7 @@ class AdaptorFromPageLayoutToPrinterAdaptor():
       alertLog("PrinterAdaptor pageLayout disagrees.")
   
   
-  def dumpDisagreement(self, printerAdaptor):
+  def dumpDisagreement(self, pageLayout, printerAdaptor):
     '''
     For debugging, show disagreement.
     '''
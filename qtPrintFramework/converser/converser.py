@@ -1,10 +1,12 @@
 
 from PyQt5.QtCore import QObject, QSizeF, pyqtSlot  # QSize, 
 from PyQt5.QtCore import pyqtSignal as Signal
+from PyQt5.QtGui import QPageLayout
 
 # !!! This does not depend on QtPrintSupport, but certain subclasses do
 
 from qtPrintFramework.pageLayout.pageLayout import PageLayout
+from qtPrintFramework.pageLayout.layoutChangeSet import LayoutChangeSet
 from qtPrintFramework.exceptions import InvalidPageSize
 from qtPrintFramework.warn import Warn
 from qtPrintFramework.alertLog import debugLog # alertLog, 
@@ -40,6 +42,10 @@ class Converser(QObject):
   -------------------
   userChangedLayout: user changed attribute of layout (any of paper, orientation, ...).  May occur more than once per page stetup dialog
   
+  userChangedLayoutChanges: same occasions as userChangedLayout, carrying a LayoutChangeSet:
+     which attributes changed, old and new values, and printable rect in unit layoutChangeUnit.
+     E.g. a receiver need not repaginate unless changeSet.isGeometryChanged.
+  
   userAcceptedFoo: user pushed OK button on a dialog
   
   userCanceledPrintRelatedConversation: user pushed Cancel button on dialog.  
@@ -57,7 +63,11 @@ class Converser(QObject):
   
   userAcceptedFoo and userCanceledPrintRelatedConversation are mutually exclusive
   '''
-  userChangedLayout = Signal(int)
+  userChangedLayout = Signal(int)  # Unused arg.  See userChangedLayoutChanges
+  userChangedLayoutChanges = Signal(object) # LayoutChangeSet
+  
+  # Unit of printable rects in LayoutChangeSet, a QPageLayout.Unit.  An app may set it, on class or instance.
+  layoutChangeUnit = LayoutChangeSet.defaultUnit
   
   userAcceptedPrint = Signal()
   userAcceptedPageSetup = Signal()
@@ -96,11 +106,14 @@ class Converser(QObject):
    
     '''
     Layout changes whenever one of its component changes.
-    Connect both component signals (reduce) to one signal out of the framework.
-    Note the signals from components have a parameter: so must userChangedLayout
+    PageLayout reduces its components' signals to one, once per batch of changes (see PageLayout.batchUpdate()),
+    so a change of several components is one propagation, one userChangedLayout, one settings write.
     '''
-    self.pageLayout.orientation.valueChanged[int].connect(self._userTouchedNonNativePageLayoutSlot)
-    self.pageLayout.paper.valueChanged[int].connect(self._userTouchedNonNativePageLayoutSlot)
+    self.pageLayout.layoutChanged.connect(self._userTouchedNonNativePageLayoutSlot)
+    
+    # Layout as of last userChangedLayout: old values of the next LayoutChangeSet
+    self._lastLayoutRecord = self.pageLayout.toRecord()
+    self._lastPrintableRectInch = self.printableRectInch()
     
     
     
@@ -258,8 +271,13 @@ class Converser(QObject):
     - appropriate for platform (window-modal)
     - appropriate for document-related actions (sheets on OSX.)
     '''
-    dialog.accepted.connect(acceptSlot)
-    dialog.rejected.connect(self._cancelSlot)
+    # A dialog may be shown again (static, or cached per printer): connect once, not once per showing
+    for signal, slot in ((dialog.accepted, acceptSlot), (dialog.rejected, self._cancelSlot)):
+      try:
+        signal.disconnect(slot)
+      except TypeError:
+        pass  # Not connected
+      signal.connect(slot)
     dialog.open() # window modal
     
   
@@ -338,7 +356,7 @@ class Converser(QObject):
     OLD Formerly we optimized by checking that pageLayout had actually changed.
     And we did not propagate signals to userChangedLayout if nothing had changed.
     
-    NEW connect paperChanged and orientationChanged to _userTouchedNonNativePageLayoutSlot
+    NEW connect pageLayout.layoutChanged to _userTouchedNonNativePageLayoutSlot
     Thus the dialog is live: a change to any control signals the app even without closing the dialog.
     """
     self.dump("accept nonnative page setup, printerAdaptor after setting it")
@@ -349,12 +367,10 @@ class Converser(QObject):
     self.pageLayout.toSettings()
     
     
-  @pyqtSlot(int)
-  def _userTouchedNonNativePageLayoutSlot(self, value): 
+  @pyqtSlot()
+  def _userTouchedNonNativePageLayoutSlot(self):
     '''
-    User touched an attribute of PageLayout.
-    
-    Do not relay value from property change: receiver can't interpret it properly since doesn't know which property
+    User touched attributes of PageLayout (one, or several in a batch.)
     '''
     self._propagateChangedPageSetup() # deferred to subclass, typically propagate to printer
     self._emitUserChangedLayout()
@@ -382,6 +398,7 @@ class Converser(QObject):
     '''
     # Tell the app
     self.userChangedLayout.emit(0)  # Unused arg to signal
+    self.userChangedLayoutChanges.emit(self._layoutChangeSet())
     debugLog("Emit userChangedLayout")
     # Persist
     self.pageLayout.toSettings()
@@ -428,6 +445,31 @@ class Converser(QObject):
     raise NotImplementedError('Deferred')
     
     
+  def printableRectInch(self):
+    '''
+    Tuple (x, y, width, height) of printable rect on page, units Inch, or None if unknown.
+    
+    Default: whole page of my PageLayout (no margins.)  Specialized by subclasses having a printer.
+    '''
+    width, height = self.pageLayout.toRecord().integralOrientedSizeMM
+    return LayoutChangeSet.convertedRect((0, 0, width, height), QPageLayout.Millimeter, QPageLayout.Inch)
+  
+  
+  def _layoutChangeSet(self):
+    '''
+    LayoutChangeSet from layout as of last call, to current layout.
+    '''
+    record = self.pageLayout.toRecord()
+    printableRectInch = self.printableRectInch()
+    result = LayoutChangeSet(self._lastLayoutRecord, record,
+                             oldPrintableRect=LayoutChangeSet.convertedRect(self._lastPrintableRectInch, QPageLayout.Inch, self.layoutChangeUnit),
+                             newPrintableRect=LayoutChangeSet.convertedRect(printableRectInch, QPageLayout.Inch, self.layoutChangeUnit),
+                             unit=self.layoutChangeUnit)
+    self._lastLayoutRecord = record
+    self._lastPrintableRectInch = printableRectInch
+    return result
+  
+  
   def _checkPrintablePageSizeInch(self, result):
     if result.isEmpty():
       raise InvalidPageSize
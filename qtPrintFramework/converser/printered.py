@@ -1,10 +1,12 @@
 
 # !!! Depends on QtPrintSupport printing subsystem
-from PyQt5.QtPrintSupport import QPageSetupDialog, QPrintDialog
+from PyQt5.QtCore import pyqtSlot, QTimer
+from PyQt5.QtPrintSupport import QPageSetupDialog, QPrintDialog, QPrinter
 
 from qtPrintFramework.converser.converser import Converser
-from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+from qtPrintFramework.printer.printerAdaptorPool import printerAdaptorPool, PrinterAdaptorPool
 from qtPrintFramework.adaptPageLayoutToPrinter import AdaptorFromPageLayoutToPrinterAdaptor
+from qtPrintFramework.syncVerifier import SyncVerifier
 from qtPrintFramework.alertLog import debugLog, alertLog
 import qtPrintFramework.config as config
 
@@ -24,9 +26,17 @@ class PrinteredConverser(Converser):
     
     PrinteredConverser has-a PrinterAdaptor (unidirectional link.)
     See below, this is used in signal handlers.
+    
+    Borrowed from the shared pool (see usePrinter() and releasePrinter().)
     '''
-    self.printerAdaptor = PrinterAdaptor(parentWidget=parentWidget)
+    self.printerAdaptor = printerAdaptorPool.borrow(parentWidget=parentWidget)
+    self._releasedPrinterKey = None  # Printer to borrow again after releasePrinter()
     self.adaptorFromPageLayoutToPrinterAdaptor = AdaptorFromPageLayoutToPrinterAdaptor()
+    # Exported: checksSkipped and checksPerformed by checkInvariantAndFix()
+    self.syncVerifier = SyncVerifier()
+    # Dialogs for real printers, created on first use (see setCurrentFrameworkPageSetupDialog())
+    self.pageSetupDialogCache = None
+    self._prewarmTimer = None
     
     result = super().getPageLayoutAndDialog(parentWidget, printerAdaptor=self.printerAdaptor)
     
@@ -42,11 +52,57 @@ class PrinteredConverser(Converser):
     return result
   
   
+  def usePrinter(self, printerName=None, outputFormat=QPrinter.NativeFormat):
+    '''
+    Switch to printer printerName (None means: system default printer) in outputFormat.
+    
+    Gives back my PrinterAdaptor to the pool and borrows one for the other printer:
+    a recently used printer comes back warm (already configured by its driver.)
+    My PageLayout is then propagated to it (only what differs, see toPrinterAdaptor().)
+    
+    Also borrows again after releasePrinter().
+    '''
+    if self.printerAdaptor is None:
+      self.pageLayout.layoutChanged.connect(self._userTouchedNonNativePageLayoutSlot)
+    elif PrinterAdaptorPool.keyOf(self.printerAdaptor) == PrinterAdaptorPool.keyFor(printerName, outputFormat):
+      return
+    else:
+      printerAdaptorPool.giveBack(self.printerAdaptor)
+    self.printerAdaptor = printerAdaptorPool.borrow(printerName, outputFormat, parentWidget=self.parentWidget)
+    self._propagateChangedPageSetup()
+    
+    
+  def releasePrinter(self):
+    '''
+    Give back my PrinterAdaptor to the pool, e.g. when my window closes.
+    If I am used again (converse, printablePageSizeInch(), etc.), I borrow the same printer again
+    (see _borrowedPrinterAdaptor()), as would usePrinter().
+    
+    My PageLayout may still change (e.g. pageLayoutPresetLibrary.apply(), fromDocument()):
+    with no printer to propagate to, I no longer react to it.
+    '''
+    if self.printerAdaptor is not None:
+      self.pageLayout.layoutChanged.disconnect(self._userTouchedNonNativePageLayoutSlot)
+      self._releasedPrinterKey = PrinterAdaptorPool.keyOf(self.printerAdaptor)
+      printerAdaptorPool.giveBack(self.printerAdaptor)
+      self.printerAdaptor = None
+  
+  
+  def _borrowedPrinterAdaptor(self):
+    '''
+    My PrinterAdaptor.  After releasePrinter(), borrowed again for the released printer
+    (and my PageLayout propagated to it, see usePrinter().)
+    '''
+    if self.printerAdaptor is None:
+      self.usePrinter(*self._releasedPrinterKey)
+    return self.printerAdaptor
+  
+  
   def conversePageSetup(self):
     '''
     Implement deferred.
     '''
-    if self.printerAdaptor.isAdaptingNative():
+    if self._borrowedPrinterAdaptor().isAdaptingNative():
       self._conversePageSetupNative()
     else:
       self.conversePageSetupNonNative() # superclass method
@@ -76,6 +132,7 @@ class PrinteredConverser(Converser):
     On Win, print to PDF requires using non-native print and page setup dialogs.
     (Implemented by this framework TODO.)
     '''
+    self._borrowedPrinterAdaptor()
     self._conversePrintNative()
   
   
@@ -87,15 +144,15 @@ class PrinteredConverser(Converser):
     if self.printerAdaptor.isAdaptingNative():
       '''
       The adapted printer is a native printer: real printer or to-file printer
-      Create new dialog having title and papersizemodel from printerAdaptor.
+      Dialog having title and papersizemodel from printerAdaptor: cached per printer (built once, or prewarmed.)
       '''
       if not config.useQML:
         '''
         Platform is a desktop and we are using QWidget implementation of framework defined PageSetup dialog.
         '''
-        from qtPrintFramework.userInterface.widget.dialog.realPrinterPageSetup import RealPrinterPageSetupDialog
-        
-        self.currentFrameworkPageSetupDialog = RealPrinterPageSetupDialog(parentWidget=self.parentWidget, printerAdaptor=self.printerAdaptor)
+        self.currentFrameworkPageSetupDialog = self._pageSetupDialogCache().dialogFor(self.printerAdaptor)
+        # Cached: may have been canceled with other choices
+        self.currentFrameworkPageSetupDialog.setValuesFromPageLayout(self.pageLayout)
       else:
         '''
         Platform is mobile (QtPrintFramework and QPageSetupDialog not defined.)
@@ -114,6 +171,38 @@ class PrinteredConverser(Converser):
 
     
   
+  def prewarmPageSetupDialog(self):
+    '''
+    Build, in idle time, the framework's page setup dialog for the current printer,
+    so that conversePageSetupNonNative() does not wait on building it.
+    
+    Returns immediately.  The dialog is built when the event loop has no other events (a zero timer),
+    for whatever printer is current then.
+    An app might call this after showing its window, and after the user changes printers.
+    '''
+    if self._prewarmTimer is None:
+      self._prewarmTimer = QTimer(self)
+      self._prewarmTimer.setSingleShot(True)
+      self._prewarmTimer.setInterval(0)
+      self._prewarmTimer.timeout.connect(self._prewarmPageSetupDialogSlot)
+    self._prewarmTimer.start()
+  
+  
+  @pyqtSlot()
+  def _prewarmPageSetupDialogSlot(self):
+    # Only the dialogs that setCurrentFrameworkPageSetupDialog() would build (others are static)
+    if self.printerAdaptor is not None and self.printerAdaptor.isAdaptingNative() and not config.useQML:
+      self._pageSetupDialogCache().prewarm(self.printerAdaptor)
+  
+  
+  def _pageSetupDialogCache(self):
+    if self.pageSetupDialogCache is None:
+      from qtPrintFramework.userInterface.widget.dialog.pageSetupDialogCache import PageSetupDialogCache
+      
+      self.pageSetupDialogCache = PageSetupDialogCache(parentWidget=self.parentWidget)
+    return self.pageSetupDialogCache
+  
+  
   def printablePageSizeInch(self):
     '''
     QSizeF that is:
@@ -126,16 +215,23 @@ class PrinteredConverser(Converser):
     
     Exported because app may wish to know page size even if not printing.
     '''
-    result = self.printerAdaptor.printablePageSizeInch()
+    result = self._borrowedPrinterAdaptor().printablePageSizeInch()
     self._checkPrintablePageSizeInch(result)
     return result
   
   
+  def printableRectInch(self):
+    '''
+    Specialize: printer's printable rect (from its snapshot, see PrinterAdaptor.snapshot().)
+    '''
+    return self._borrowedPrinterAdaptor().snapshot().printableRectInch
+  
+  
   def paper(self):
     '''
     Specialize: delegate to printerAdaptor.
     '''
-    return self.printerAdaptor.paper()
+    return self._borrowedPrinterAdaptor().paper()
   
   
   def _conversePageSetupNative(self):
@@ -186,24 +282,39 @@ class PrinteredConverser(Converser):
   
     self.pageLayout.toSettings()
     
+    
+  @pyqtSlot()
+  def _acceptNativePrintSlot(self):
+    '''
+    Specialize: the app typically prints in its handler of userAcceptedPrint.
+    Printing may change the printer out of band (on OSX it loses its page setup.)
+    So the next checkInvariantAndFix() must not skip.
+    '''
+    super()._acceptNativePrintSlot()
+    self.printerAdaptor.invalidateSnapshot()
+    
   
   '''
   Implement deferred methods.  See comments in super().
   '''
   def transferPageLayoutFromPrinterToFramework(self):
-    self.adaptorFromPageLayoutToPrinterAdaptor.fromPrinterAdaptor(self.pageLayout, self.printerAdaptor)
+    # A native dialog changed the printer in C++, not via PrinterAdaptor's setters
+    self.printerAdaptor.invalidateSnapshot()
     '''
+    fromPrinterAdaptor() sets all attributes, in one batch:
+    pageLayout emits layoutChanged once, which propagates (a no-op, printer already agrees) and emits userChangedLayout.
+
     OLD optimization to forego signal when nothing changed.
     if not oldPageSetup == self.pageLayout:
       self._emitUserChangedPaper()
     '''
-    self._emitUserChangedLayout()
+    self.adaptorFromPageLayoutToPrinterAdaptor.fromPrinterAdaptor(self.pageLayout, self.printerAdaptor)
     self.adaptorFromPageLayoutToPrinterAdaptor.warnIfDisagreesWithPrinterAdaptor(self.pageLayout, self.printerAdaptor)
 
 
   def _propagateChangedPageSetup(self):
+    # toPrinterAdaptor() verifies and warns: not compare again here
     self.adaptorFromPageLayoutToPrinterAdaptor.toPrinterAdaptor(self.pageLayout, self.printerAdaptor)
-    self.adaptorFromPageLayoutToPrinterAdaptor.warnIfDisagreesWithPrinterAdaptor(self.pageLayout, self.printerAdaptor)
     
 
 
@@ -218,7 +329,14 @@ class PrinteredConverser(Converser):
     
     This ameliorates another bug on the OSX platform: PageSetup not persistent.
     (After one Print conversation, a printerAdaptor loses its page setup.)
+    
+    Skipped when neither pageLayout nor printerAdaptor changed since last check (see SyncVerifier.)
+    Whatever may change the printer out of band (native dialogs, printing) must invalidate printerAdaptor's snapshot,
+    which changes its version.
     '''
+    if self.syncVerifier.isSynced(self.pageLayout, self._borrowedPrinterAdaptor()):
+      debugLog("checkInvariantAndFix skipped, unchanged since last check")
+      return
     
     if not self.adaptorFromPageLayoutToPrinterAdaptor.isStronglyEqual(self.pageLayout, self.printerAdaptor):
       paper = self.pageLayout.paper
@@ -226,6 +344,11 @@ class PrinteredConverser(Converser):
       debugLog(str(paper))
       # self.setPaperSize(paper.value)
       self.adaptorFromPageLayoutToPrinterAdaptor.toPrinterAdaptor(self.pageLayout, printerAdaptor=self.printerAdaptor)
+    '''
+    Synced, or as synced as Qt allows: fixing again, with nothing changed, would have the same result.
+    Versions after the fix (which changed printerAdaptor.)
+    '''
+    self.syncVerifier.markSynced(self.pageLayout, self.printerAdaptor)
     
     """
     if sys.platform.startswith('darwin'):
@@ -0,0 +1,30 @@
+'''
+Support for module attributes that are built on first access, not at import (PEP 562.)
+
+Usage, at end of a module:
+__getattr__ = lazyAttributes(globals(), {'table' : _createTable})
+
+Then 'from module import table' or 'module.table' calls _createTable() once.
+The result is cached in the module's globals, so later accesses are ordinary attribute reads.
+'''
+
+
+def lazyAttributes(moduleGlobals, builders):
+  '''
+  Module __getattr__ that builds attributes named in builders (dict from name to function of no args.)
+
+  A builder may itself call the returned function to get another lazy attribute of the same module.
+  '''
+  def __getattr__(name):
+    try:
+      return moduleGlobals[name]
+    except KeyError:
+      pass
+    try:
+      builder = builders[name]
+    except KeyError:
+      raise AttributeError("module {!r} has no attribute {!r}".format(moduleGlobals['__name__'], name))
+    value = builder()
+    moduleGlobals[name] = value
+    return value
+  return __getattr__
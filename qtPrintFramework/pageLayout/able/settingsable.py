@@ -1,11 +1,16 @@
 
-from PyQt5.QtCore import QSettings, QSize # QObject, 
+from PyQt5.QtCore import QSize # QObject, 
 from PyQt5.QtGui import QPagedPaintDevice
 
 from qtPrintFramework.pageLayout.components.paper.paper import Paper
 from qtPrintFramework.pageLayout.components.paper.custom import CustomPaper
 from qtPrintFramework.pageLayout.components.paper.standard import StandardPaper
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
 from qtPrintFramework.pageLayout.components.orientation import Orientation
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+from qtPrintFramework.settings.settingsBackend import settingsBackend
+from qtPrintFramework.alertLog import alertLog
 
 
 
@@ -13,7 +18,7 @@ from qtPrintFramework.pageLayout.components.orientation import Orientation
 class Settingsable():
   '''
   Mixin behaviour for PageSetup.
-  Persists itself to/from Settings.
+  Persists itself to/from Settings, as one PageLayoutRecord.
   
   A NonNative printer (PDF 'printer') does not own a persistent page setup,
   i.e. the platform doesn't necessarily know of the printer, let alone know its page setup.
@@ -34,7 +39,7 @@ class Settingsable():
 
     
   '''
-  To/from settings.
+  To/from settings, in the current SettingsBackend (default QSettings.)
   
   Assert that QSettings have been established on client app startup:
   QCoreApplication.setOrganizationName("Foo")
@@ -42,8 +47,14 @@ class Settingsable():
   QCoreApplication.setApplicationName("Bar")
   
   toSettings is called in reaction to dialog accept see PrintRelatedConverser.
+  It is write-behind: see SettingsWriter.
+  
+  One key holds a binary PageLayoutRecord (bytes.)
+  Settings of former versions (one key per value) are still read, when the record key is absent.
   '''
   
+  recordKey = "pageLayoutRecord"
+  
   def fromSettings(self, getDefaultsFromPrinterAdaptor=None):
     '''
     Set my values from settings (that persist across app sessions.)
@@ -52,53 +63,137 @@ class Settingsable():
     AND a printerAdaptor is passed, default my values from printerAdaptor.
     
     '''
-    qsettings = QSettings()
-    qsettings.beginGroup( "paperlessPrinter" )  # TODO better name
+    # Not read values older than those written
+    settingsWriter.flush()
+    values = settingsBackend().read( "paperlessPrinter" )  # TODO better name
+    data = values.get(Settingsable.recordKey)
+    record = None
+    if data is not None:
+      try:
+        record = PageLayoutRecord.decode(data)
+      except (ValueError, TypeError):
+        alertLog("Unreadable page layout in settings.")
+    if record is None:
+      record = self._recordFromFormerSettings(values, getDefaultsFromPrinterAdaptor)
     
+    self.fromRecord(record)
+    ## This crashes on decode exception OSX
+    ##print("PageSetup from settings:", str(self))
+  
+  
+  def _recordFromFormerSettings(self, values, getDefaultsFromPrinterAdaptor):
+    '''
+    PageLayoutRecord from one key per value (settings of former versions), else from defaults.
+    '''
     # Prepare default values
     if getDefaultsFromPrinterAdaptor is not None:
-      defaultPaperEnum = getDefaultsFromPrinterAdaptor.paper().value
-      defaultOrientation = getDefaultsFromPrinterAdaptor.orientation()
+      defaultPaperEnum = getDefaultsFromPrinterAdaptor.paperValue().value
+      defaultOrientation = getDefaultsFromPrinterAdaptor.orientationValue().value
     else:
       defaultPaperEnum = 0  # Hack TODO PaperSizeModel.default()
       defaultOrientation = 0  # PageOrientationModel.default()
     defaultSize = CustomPaper.defaultSize()
     
     # Get settings
-    enumValue = qsettings.value( "paperEnum", defaultPaperEnum)
-    orientationValue = qsettings.value( "paperOrientation", defaultOrientation )
-    integralOrientedWidthValue = qsettings.value( "paperintegralOrientedWidth", defaultSize.width())
-    integralOrientedHeightValue = qsettings.value( "paperintegralOrientedHeight", defaultSize.height())
-    
-    # Copy settings to self
-    # Orientation first, needed for orienting paper size
-    self.orientation = Orientation(initialValue=self._intForSetting(orientationValue))
+    enumValue = values.get( "paperEnum", defaultPaperEnum)
+    orientationValue = values.get( "paperOrientation", defaultOrientation )
+    integralOrientedWidthValue = values.get( "paperintegralOrientedWidth", defaultSize.width())
+    integralOrientedHeightValue = values.get( "paperintegralOrientedHeight", defaultSize.height())
     
-    size = QSize(self._intForSetting(integralOrientedWidthValue),
-                self._intForSetting(integralOrientedHeightValue))
-    self.paper = self._paperFromSettings(paperEnum=self._intForSetting(enumValue),
-                                         integralOrientedPaperSize=size,
-                                         orientation=self.orientation)
-    qsettings.endGroup()
-    assert isinstance(self.paper, Paper)  # !!! Might be custom of unknown size
-    assert isinstance(self.orientation, Orientation)
-    ## This crashes on decode exception OSX
-    ##print("PageSetup from settings:", str(self))
+    return PageLayoutRecord(paperEnum=self._intForSetting(enumValue),
+                            orientation=self._intForSetting(orientationValue),
+                            integralOrientedSizeMM=(self._intForSetting(integralOrientedWidthValue),
+                                                    self._intForSetting(integralOrientedHeightValue)))
   
   
   def toSettings(self):
     '''
     Save my values to settings.
+    
+    Returns immediately: the write is coalesced with others soon after, and done on a worker thread.
+    '''
+    settingsWriter.write("paperlessPrinter", { Settingsable.recordKey : self.toRecord().encode() })
+  
+  
+  '''
+  To/from PageLayoutRecord: plain values, e.g. to ship to a worker process.
+  '''
+  def toRecord(self):
+    '''
+    PageLayoutRecord of my values.
+    Margins are default: a PageLayout does not yet have margins.
     '''
-    qsettings = QSettings()
-    qsettings.beginGroup( "paperlessPrinter" )
-    # Although Paper is pickleable, simplify to int.  QSettings stores objects correctly?
-    qsettings.setValue( "paperEnum", self.paper.value )
-    qsettings.setValue( "paperOrientation", self.orientation.value )
     integralOrientedSize = self.paper.integralOrientedSizeMM(self.orientation.value)
-    qsettings.setValue( "paperintegralOrientedWidth", integralOrientedSize.width())
-    qsettings.setValue( "paperintegralOrientedHeight", integralOrientedSize.height())
-    qsettings.endGroup()
+    return PageLayoutRecord(paperEnum=self.paper.value,
+                            orientation=self.orientation.value,
+                            integralOrientedSizeMM=(integralOrientedSize.width(), integralOrientedSize.height()))
+  
+  
+  def fromRecord(self, record):
+    '''
+    Set my values from a PageLayoutRecord.
+    
+    !!! Replaces my attribute instances (as from settings): connect to their signals after.
+    '''
+    assert isinstance(record, PageLayoutRecord)
+    # Orientation first, needed for orienting paper size
+    self.orientation = Orientation(initialValue=record.orientation)
+    self.paper = self._paperFromSettings(paperEnum=record.paperEnum,
+                                         integralOrientedPaperSize=QSize(*record.integralOrientedSizeMM),
+                                         orientation=self.orientation.value)
+    assert isinstance(self.paper, Paper)  # !!! Might be custom of unknown size
+    assert isinstance(self.orientation, Orientation)
+  
+  
+  def setValuesFromRecord(self, record):
+    '''
+    Set my values from a PageLayoutRecord, keeping my attribute instances (and so their connections.)
+    
+    Sets only attributes whose value changed, in one batch (see PageLayout.batchUpdate()):
+    a receiver (e.g. propagating to a printer) never sees a mix of old and new values.
+    '''
+    assert isinstance(record, PageLayoutRecord)
+    if record.paperEnum == QPagedPaintDevice.Custom:
+      paperValue = PaperValue.customFromOrientedSize(record.integralOrientedSizeMM, record.orientation)
+    else:
+      paperValue = PaperValue.standard(record.paperEnum)
+
+    with self.batchUpdate():
+      if self.orientation.value != record.orientation:
+        self.orientation.value = record.orientation
+      if self.paper.paperValue != paperValue:
+        self.paper.setPaperValue(paperValue)
+  
+  
+  '''
+  To/from a store of layouts per document.
+  '''
+  def toDocument(self, documentId, store=None):
+    '''
+    Save my values as the layout of a document (batched, see DocumentLayoutStore.)
+    '''
+    if store is None:
+      store = self._documentLayoutStore()
+    store.put(documentId, self.toRecord())
+  
+  
+  def fromDocument(self, documentId, store=None):
+    '''
+    Set my values from the layout of a document, if it has one.
+    Returns whether it had one.  If not, my values are unchanged.
+    '''
+    if store is None:
+      store = self._documentLayoutStore()
+    record = store.get(documentId)
+    if record is not None:
+      self.setValuesFromRecord(record)
+    return record is not None
+  
+  
+  def _documentLayoutStore(self):
+    # Import at use: most apps keep one layout, not one per document
+    from qtPrintFramework.settings.documentLayoutStore import documentLayoutStore
+    return documentLayoutStore
   
   
   def _intForSetting(self, value):
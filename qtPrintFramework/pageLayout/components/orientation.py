@@ -2,14 +2,21 @@
 from PyQt5.QtCore import QObject, pyqtProperty, pyqtSignal
 from PyQt5.QtGui import QPageLayout
 
+from qtPrintFramework.pageLayout.components.orientationValue import OrientationValue
+from qtPrintFramework.versioned import Versioned
 
-class Orientation(QObject):
+
+class Orientation(QObject, Versioned):
   '''
   Paper orientation.
   Wraps enumType=QPageLayout.Orientation
   
   Primarily for translation, name, and repr.
   
+  A QObject view (for QML and signals) on an interned OrientationValue.
+  Callers that only need a value (not a notifiable property) should use OrientationValue.
+  Versioned: touched whenever its value is set to another value.
+  
   Should be registered with QML if using QML.
   '''
   
@@ -21,10 +28,13 @@ class Orientation(QObject):
     
     if initialValue is None:
       #print("Defaulting orientation to Portrait.")
-      self._value = QPageLayout.Portrait
+      self._orientationValue = OrientationValue.forEnum(QPageLayout.Portrait)
+    elif isinstance(initialValue, OrientationValue):
+      self._orientationValue = initialValue
     else:
       assert initialValue == QPageLayout.Portrait or initialValue == QPageLayout.Landscape
-      self._value = initialValue
+      self._orientationValue = OrientationValue.forEnum(initialValue)
+    self.touch()
       
       
   def __repr__(self):
@@ -32,18 +42,22 @@ class Orientation(QObject):
     return self.name
   
   def __eq__(self, other):
-    return self._value == other._value
+    return self._orientationValue is other._orientationValue  # interned
   
   
   # value is a notifiable property (so QML can access)
   @pyqtProperty(int, notify=valueChanged)
   def value(self):
-    return self._value
+    return self._orientationValue.value
   
   @value.setter
   def value(self, newValue):
     assert isinstance(newValue, int)
-    self._value = newValue
+    orientationValue = OrientationValue.forEnum(newValue)
+    if orientationValue is self._orientationValue:  # interned
+      return
+    self._orientationValue = orientationValue
+    self.touch()
     #print("emitting valueChanged")
     self.valueChanged.emit(newValue)
   
@@ -52,17 +66,18 @@ class Orientation(QObject):
   '''
   Other properties
   '''
+  @property
+  def orientationValue(self):
+    '''
+    Immutable value that self currently views.
+    '''
+    return self._orientationValue
+  
   @property
   def name(self):
-    #print("orientation enum:", self.value)
-    if self.isPortrait:
-        result = self.tr('Portrait')
-    else:
-        result = self.tr('Landscape')
-    #print("Orientation.name", result)
-    return result
+    return self._orientationValue.name
   
   @property
   def isPortrait(self):
-    return self._value == QPageLayout.Portrait
+    return self._orientationValue.isPortrait
   
@@ -0,0 +1,88 @@
+
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtGui import QPageLayout
+
+
+
+class OrientationValue(object):
+  '''
+  Immutable paper orientation.
+  Wraps enumType=QPageLayout.Orientation
+
+  Not a QObject: cheap to pass around and compare.
+  Flyweight: only two instances exist, get them by forEnum(), never construct.
+
+  Orientation (a QObject, for QML and signals) is a view on one of these.
+  '''
+
+  __slots__ = ('_value', )
+
+  _interned = {}
+
+
+  @classmethod
+  def forEnum(cls, enum):
+    '''
+    Interned instance for enum from QPageLayout.Orientation.
+    Accepts QPrinter.Orientation too: same int values.
+    '''
+    return cls._interned[enum]
+
+
+  def __init__(self, enum):
+    object.__setattr__(self, '_value', QPageLayout.Orientation(enum))
+
+
+  def __setattr__(self, name, value):
+    raise AttributeError("OrientationValue is immutable")
+
+
+  def __repr__(self):
+    return self.name
+
+  def __eq__(self, other):
+    return isinstance(other, OrientationValue) and self._value == other._value
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash(self._value)
+
+  def __reduce__(self):
+    return (OrientationValue.forEnum, (int(self._value), ))
+
+
+  @property
+  def value(self):
+    return self._value
+
+  @property
+  def name(self):
+    '''
+    Translated.  Same translation context as Orientation.tr()
+    '''
+    if self.isPortrait:
+      result = QCoreApplication.translate('Orientation', 'Portrait')
+    else:
+      result = QCoreApplication.translate('Orientation', 'Landscape')
+    return result
+
+  @property
+  def isPortrait(self):
+    return self._value == QPageLayout.Portrait
+
+  @property
+  def transposed(self):
+    ''' The other orientation. '''
+    if self.isPortrait:
+      result = OrientationValue.forEnum(QPageLayout.Landscape)
+    else:
+      result = OrientationValue.forEnum(QPageLayout.Portrait)
+    return result
+
+
+
+for _enum in (QPageLayout.Portrait, QPageLayout.Landscape):
+  OrientationValue._interned[_enum] = OrientationValue(_enum)
+del _enum
@@ -1,9 +1,8 @@
 
 from PyQt5.QtCore import QSize
-from PyQt5.QtGui import QPagedPaintDevice  # !! Not in QtPrintSupport
 
-from qtPrintFramework.orientedSize import OrientedSize
 from qtPrintFramework.pageLayout.components.paper.paper import Paper
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
 ##from qtPrintFramework.pageLayout.components.orientation import Orientation
 
 
@@ -17,27 +16,18 @@ class CustomPaper(Paper):
   Inherited: 
    __repr__
    value
+   name, integralDefinedSizeMM, isStandard, setSize: delegated to PaperValue
   '''
   
   def __init__(self, integralOrientedSizeMM, orientation):
-    self.value = QPagedPaintDevice.Custom
-    
     '''
     !!! Keep portrait size.
     Is NOT an assertion that size is normalized.
     '''
     assert isinstance(integralOrientedSizeMM, QSize)
     assert isinstance(orientation, int) # WAS Orientation)
-    self.setSize(integralOrientedSizeMM, orientation)
-    ## WAS, EQUIVALENT: self._portraitSizeMM = OrientedSize.portraitSizeMM(integralOrientedSizeMM, orientation)
-
-  
-  @property
-  def name(self):
-    '''
-    Don't use model.  We might eliminate the enum from the model.  Always 'Custom'
-    '''
-    return  'Custom'
+    super().__init__(PaperValue.customFromOrientedSize((integralOrientedSizeMM.width(), integralOrientedSizeMM.height()),
+                                                       orientation))
   
   
   @classmethod
@@ -46,38 +36,4 @@ class CustomPaper(Paper):
     Size when user has chosen Custom but not specified dimensions
     (In non-native PageSetup dialog that doesn't have capability to specify dimensions.)
     '''
-    return QSize(640, 480)
-  
-
-  def setSize(self, integralOrientedSizeMM, orientation):
-    '''
-    Set self size by orientedIntegralSize, orientation.
-    
-    A user can set size of Custom paper via native Print dialog.
-    Also used to init a Custom paper when user uses non-native PageSetup dialog.
-    '''
-    self._portraitSizeMM = OrientedSize.portraitSizeMM(integralOrientedSizeMM, orientation)
-    
-  
-  @property
-  def integralDefinedSizeMM(self):
-    '''
-    Called by Paper.integralOrientedSizeMM()
-    '''
-    return self._portraitSizeMM
-  
-  
-  
-  @property
-  def isStandard(self):
-    '''
-    Reimplement super
-    '''
-    return False
-
-
-  def hasEqualSizeTo(self, other):
-    result = self.integralDefinedSizeMM == other.integralDefinedSizeMM
-    return result
-  
-  
+    return QSize(*PaperValue.defaultCustomSizeMM)
@@ -1,16 +1,18 @@
 
 from PyQt5.QtCore import QObject, QSize, QSizeF, pyqtSignal, pyqtProperty
+from PyQt5.QtGui import QPagedPaintDevice  # !! Not in QtPrintSupport
 
 
-from qtPrintFramework.pageLayout.model.pageNameToEnum import pageEnumToName
-from qtPrintFramework.pageLayout.model.pageEnumToSize import pageEnumToSize, pageSizeToEnum
+# Module, not its attribute: the matcher singleton is built on first access, not at import
+import qtPrintFramework.pageLayout.model.paperSizeMatcher as paperSizeMatcherModule
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
 
 from qtPrintFramework.orientedSize import OrientedSize
-from qtPrintFramework.alertLog import alertLog
+from qtPrintFramework.versioned import Versioned
 
 
 
-class Paper(QObject):
+class Paper(QObject, Versioned):
   '''
   Page??
   
@@ -20,6 +22,11 @@ class Paper(QObject):
   - CustomPaper: size defined by user (or a default)
   Future: NonStandardPaper: defined by a printer
   
+  A QObject view (for QML and signals) on an immutable PaperValue.
+  Changing value replaces the PaperValue, not this instance (QML is bound to this instance.)
+  Versioned: touched whenever its PaperValue changes (not when set to an equal value.)
+  Callers that only need a value (not a notifiable property) should use PaperValue.
+  
   Responsibilities:
   - name
   - enum, constant that Qt uses: QPagedPaintDevice.PageSize or QPageLayout.PageSize ??
@@ -35,55 +42,54 @@ class Paper(QObject):
   
   valueChanged = pyqtSignal(int)
   
-  " Dictionaries used as models. "
-  nameModel = pageEnumToName
-  sizeModel = pageEnumToSize
-  inverseSizeModel = pageSizeToEnum
+  " Model: names and sizes come from the page size catalog, via PaperValue, and paperSizeMatcher "
     
     
   @classmethod
   def enumForPageSizeByMatchDimensions(cls, paperSizeMM, orientationEnum):
     '''
-    Returns enum from type QPagedPaintDevice.PageSize using fuzzy match on paper dimensions.
-    
-    The fuzziness is: 0.5 mm
-    That is, we round mm fractional sizes to int.
+    Returns enum from type QPagedPaintDevice.PageSize using fuzzy match on paper dimensions, or None.
+
+    The fuzziness is: paperSizeMatcher.epsilon, default 0.5 mm
     This is the kind of floating point inaccuracy that the Qt bug introduces: off by less than 0.5.
-    
+
     !!! But note that Qt returns paperSizeMM that reflects orientation, i.e. width can be > height
+
+    Hot path: no Qt object is created, and a miss (None, i.e. Custom) is not logged.
+    Use paperSizeMatcher.nearest() to diagnose a miss.
     '''
     assert isinstance(orientationEnum, int)
-    roundedSize = OrientedSize.roundedSize(sizeF=paperSizeMM)
-    if roundedSize is None:
-      return None
-    
-    definedRoundedSize = OrientedSize.portraitSizeMM(roundedSize, orientationEnum)
-    hashedDefinedRoundedSize = (definedRoundedSize.width(), definedRoundedSize.height())
-    #print(hashedDefinedRoundedSize)
-    try:
-      result = cls.inverseSizeModel[hashedDefinedRoundedSize]
-    except KeyError:
-      alertLog("KeyError in enumForPageSizeByMatchDimensions: {} {}".format(paperSizeMM.width(),paperSizeMM.height()))
-      result = None
+    result = paperSizeMatcherModule.paperSizeMatcher.match(paperSizeMM.width(), paperSizeMM.height(), orientationEnum)
     return result
+  
+  
+  @classmethod
+  def isEnumEpsilonEqualToSize(cls, enum, paperSizeMM, orientationEnum):
+    '''
+    Is the defined size of paper enum epsilon equal to paperSizeMM (oriented, floating, as from Qt.)
+    
+    Hot path, like enumForPageSizeByMatchDimensions.
+    '''
+    assert isinstance(orientationEnum, int)
+    return paperSizeMatcherModule.paperSizeMatcher.isWithin(enum, paperSizeMM.width(), paperSizeMM.height(), orientationEnum)
     
    
   
   def __init__(self, initialValue):
     '''
-    Default: CustomPaper overrides: still has this attribute but is constant
+    initialValue is an enum, or a PaperValue, or None (meaning enum 0)
     '''
     super().__init__()  # init QObject
     
-    # this is the best assertion we can do?  Fragile?
-    if initialValue is not None:
+    if isinstance(initialValue, PaperValue):
+      self._paperValue = initialValue
+    elif initialValue is not None:
+      # this is the best assertion we can do?  Fragile?
       assert isinstance(initialValue, int), str(type(initialValue))
-      #assert str(type(value)) == "<type 'sip.enumtype'>"
-      #assert isinstance(value, QPagedPaintDevice.PageSize)
-      
-      self._value = initialValue
+      self._paperValue = self._paperValueForEnum(initialValue)
     else:
-      self._value = 0  # QPagedPaintDevice.A0 ?
+      self._paperValue = PaperValue.standard(0)  # QPagedPaintDevice.A4
+    self.touch()
   
   
   def __repr__(self):
@@ -92,7 +98,7 @@ class Paper(QObject):
     
     # !!! Not oriented.  A paper does not know its orientation.
     '''
-    return "Unoriented " + self.name + " " + self._definedSizeString  
+    return repr(self._paperValue)
   
   
   def __eq__(self, other):
@@ -107,12 +113,7 @@ class Paper(QObject):
     Usually caller already knows the orientation is equal.
     Used to determine whether pageSetup has changed.
     '''
-    if not self.isCustom:
-      result = self._value == other._value
-    else:
-      result = self._value == other._value \
-              and self.hasEqualSizeTo(other)
-    return result
+    return self._paperValue == other._paperValue
 
 
   '''
@@ -120,21 +121,95 @@ class Paper(QObject):
   '''
   @pyqtProperty(int, notify=valueChanged)
   def value(self):
-    return self._value
+    return self._paperValue.value
   
   @value.setter
   def value(self, newValue):
-    self._value = newValue
+    paperValue = self._paperValueForEnum(newValue)
+    # Standard values are interned.  Custom are not: compare (a Custom keeps its size, see _paperValueForEnum().)
+    if paperValue == self._paperValue:
+      return
+    self._paperValue = paperValue
+    self.touch()
     self.valueChanged.emit(newValue)
   
   
+  def setPaperValue(self, paperValue):
+    '''
+    Set value and (if Custom) size at once: one valueChanged.
+    '''
+    assert isinstance(paperValue, PaperValue)
+    if paperValue == self._paperValue:
+      return
+    self._paperValue = paperValue
+    self.touch()
+    self.valueChanged.emit(paperValue.value)
   
-  @property
-  def _definedSizeString(self):
-    " string for defined size  (not oriented.) "
-    size = self.integralDefinedSizeMM
-    return str(size.width()) + 'x' + str(size.height()) + 'mm'
   
+  def _paperValueForEnum(self, enum):
+    '''
+    PaperValue for enum.
+
+    Custom has no size from a model: keep my current size if any, else default size.
+    Caller may then setSize()
+    '''
+    if enum == QPagedPaintDevice.Custom:
+      currentValue = getattr(self, '_paperValue', None)
+      if currentValue is None:
+        size = PaperValue.defaultCustomSizeMM
+      else:
+        size = currentValue.integralDefinedSizeMM
+      result = PaperValue.custom(size)
+    else:
+      result = PaperValue.standard(enum)
+    return result
+
+
+  @property
+  def paperValue(self):
+    '''
+    Immutable value that self currently views.
+    '''
+    return self._paperValue
+
+  @property
+  def name(self):
+    return self._paperValue.name
+
+  @property
+  def integralDefinedSizeMM(self):
+    '''
+    QSize
+    - defined i.e. portrait orientation
+    - integral
+    - units mm
+    Not necessarily normalized (width < height)
+    '''
+    return QSize(*self._paperValue.integralDefinedSizeMM)
+
+
+  def setSize(self, integralOrientedSizeMM, orientation):
+    '''
+    Set size of a Custom paper by orientedIntegralSize (QSize), orientation (enum).
+
+    A user can set size of Custom paper via native Print dialog.
+    Also used to init a Custom paper when user uses non-native PageSetup dialog.
+
+    A standard paper has a size from a model: this has no effect.
+    '''
+    assert isinstance(integralOrientedSizeMM, QSize)
+    if self.isCustom:
+      paperValue = PaperValue.customFromOrientedSize((integralOrientedSizeMM.width(), integralOrientedSizeMM.height()),
+                                                     orientation)
+      if paperValue != self._paperValue:
+        self._paperValue = paperValue
+        self.touch()
+
+
+  def hasEqualSizeTo(self, other):
+    return self._paperValue.integralDefinedSizeMM == other._paperValue.integralDefinedSizeMM
+
+
   def orientedDescription(self, orientation):
     ''' Human readable description also oriented. '''
     return " ".join(( self.name, orientation.name, self._orientedSizeString(orientation)))
@@ -145,13 +220,6 @@ class Paper(QObject):
     return str(size.width()) + 'x' + str(size.height()) + 'mm'
   
   
-  '''
-  Deferred property
-  def name(self):
-    raise NotImplementedError('Deferred')
-  '''
-  
-
   @property
   def isStandard(self):
     '''
@@ -159,21 +227,20 @@ class Paper(QObject):
     Is standardized by some organization?
     Loosely, name is well-known and means the same thing around the world.
     See above, some really are not rigorously standardized, only loosely standardize.
-    
-    Deferred: subclasses must reimplement.
+
+    Delegated to value: a paper changes from standard to custom when its value changes.
     '''
-    raise NotImplementedError('Deferred')
-    
+    return self._paperValue.isStandard
+
   @property
   def isCustom(self):
     return not self.isStandard
-  
-  inverseSizeModel
+
+
   def integralOrientedSizeMM(self, orientation):
     '''
     QSize oriented.  Integer. Units mm
     '''
-    # integralDefinedSizeMM is property of subclass
     result = OrientedSize.orientedSize(self.integralDefinedSizeMM, orientation)
     assert isinstance(result, QSize)
     # Oriented does not imply normalized
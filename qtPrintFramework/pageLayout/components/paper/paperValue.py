@@ -0,0 +1,214 @@
+
+from PyQt5.QtCore import QSizeF
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout, QPageSize  # !! Not in QtPrintSupport
+
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+
+
+
+class PaperValue(object):
+  '''
+  Immutable paper: enum and defined (portrait) size in integral mm.
+
+  Not a QObject: cheap to pass around and compare.
+  Flyweight: a standard paper has one interned instance per enum, get it by standard() or forEnum().
+  A custom paper is a new instance per size, get it by custom() or customFromOrientedSize().
+
+  Paper (a QObject, for QML and signals) is a view on one of these.
+
+  !!! A PaperValue does not know its orientation (it is passed) but knows its oriented size.
+  '''
+
+  __slots__ = ('_value', '_definedSizeMM')
+
+  _interned = {}
+
+  # Size of Custom paper when user has chosen Custom but not specified dimensions
+  defaultCustomSizeMM = (640, 480)
+
+
+  @classmethod
+  def standard(cls, enum):
+    '''
+    Interned instance for a standard enum from QPagedPaintDevice.PageSize.
+
+    Interned on first request for enum, with size from the page size catalog.
+    '''
+    try:
+      result = cls._interned[enum]
+    except KeyError:
+      assert enum != QPagedPaintDevice.Custom
+      result = PaperValue(enum, pageSizeCatalog().integralSizeMM(enum))
+      cls._interned[enum] = result
+    return result
+
+
+  @classmethod
+  def custom(cls, integralDefinedSizeMM):
+    '''
+    Instance for Custom paper of defined (portrait) size, tuple (width, height) integral mm.
+    '''
+    return PaperValue(QPagedPaintDevice.Custom, integralDefinedSizeMM)
+
+
+  @classmethod
+  def customFromOrientedSize(cls, integralOrientedSizeMM, orientationEnum):
+    '''
+    Instance for Custom paper of oriented size, tuple (width, height) integral mm.
+
+    !!! Keep portrait size.
+    Is NOT an assertion that size is normalized.
+    '''
+    width, height = integralOrientedSizeMM
+    if orientationEnum == QPageLayout.Portrait:
+      result = cls.custom((width, height))
+    else:
+      result = cls.custom((height, width))
+    return result
+
+
+  @classmethod
+  def forEnum(cls, enum, integralDefinedSizeMM=None):
+    '''
+    Instance for any enum.
+    For Custom, integralDefinedSizeMM is required.
+    '''
+    if enum == QPagedPaintDevice.Custom:
+      assert integralDefinedSizeMM is not None
+      result = cls.custom(integralDefinedSizeMM)
+    else:
+      result = cls.standard(enum)
+    return result
+
+
+  def __init__(self, enum, integralDefinedSizeMM):
+    width, height = integralDefinedSizeMM
+    object.__setattr__(self, '_value', QPagedPaintDevice.PageSize(enum))
+    object.__setattr__(self, '_definedSizeMM', (int(width), int(height)))
+
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PaperValue is immutable")
+
+
+  def __repr__(self):
+    '''
+    Human readable description including name, dimensions in mm.
+
+    # !!! Not oriented.  A paper does not know its orientation.
+    '''
+    return "Unoriented " + self.name + " " + self._sizeString(self._definedSizeMM)
+
+
+  def __eq__(self, other):
+    '''
+    Equal if same enum AND if they are both custom, they also have equal portrait sizes.
+    '''
+    if not isinstance(other, PaperValue):
+      return False
+    if self.isStandard:
+      result = self._value == other._value
+    else:
+      result = self._value == other._value \
+              and self._definedSizeMM == other._definedSizeMM
+    return result
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash((self._value, self._definedSizeMM))
+
+  def __reduce__(self):
+    if self.isStandard:
+      result = (PaperValue.standard, (int(self._value), ))
+    else:
+      result = (PaperValue.custom, (self._definedSizeMM, ))
+    return result
+
+
+  @property
+  def value(self):
+    ''' enum from QPagedPaintDevice.PageSize '''
+    return self._value
+
+  @property
+  def name(self):
+    if self.isStandard:
+      result = pageSizeCatalog().name(self._value)
+    else:
+      result = 'Custom'
+    return result
+
+  @property
+  def isStandard(self):
+    return self._value != QPagedPaintDevice.Custom
+
+  @property
+  def isCustom(self):
+    return self._value == QPagedPaintDevice.Custom
+
+
+  @property
+  def integralDefinedSizeMM(self):
+    '''
+    Tuple (width, height), integral, units mm, defined i.e. portrait orientation.
+    Not necessarily normalized (width < height), see Ledger.
+    '''
+    return self._definedSizeMM
+
+  @property
+  def definition(self):
+    '''
+    Tuple (definedSize, unit): exact defined (portrait) size, in the unit (QPageSize.Unit) it is defined in.
+    E.G. Letter is ((8.5, 11.0), Inch), A4 is ((210.0, 297.0), Millimeter).
+    Custom is its integral mm size.
+    '''
+    if self.isStandard:
+      entry = pageSizeCatalog().entry(self._value)
+      result = (entry.definedSize, entry.definitionUnit)
+    else:
+      result = (self._definedSizeMM, QPageSize.Millimeter)
+    return result
+
+  def pageSize(self):
+    '''
+    New QPageSize with exact definition, for QPrinter.setPageSize().
+
+    Standard: by id, so Qt uses its exact definition, and distinguishes papers of equal size (e.g. A4 and A4Small.)
+    Custom: by size, matched exactly (ExactMatch), so Qt keeps it Custom even when it equals a standard size (e.g. 210x297.)
+    Qt's default (fuzzy) match would make it that standard paper, and the printer would never agree with a Custom paper.
+    '''
+    if self.isStandard:
+      result = QPageSize(QPageSize.PageSizeId(self._value))
+    else:
+      result = QPageSize(QSizeF(*self._definedSizeMM), QPageSize.Millimeter, "", QPageSize.ExactMatch)
+    return result
+
+  def qtPageSizeId(self):
+    '''
+    Enum Qt gives my pageSize(): my value,
+    except a Custom paper of exactly a standard paper's size, which Qt makes that standard paper (e.g. Custom 210x297 is A4.)
+    '''
+    if self.isStandard:
+      result = self._value
+    else:
+      result = QPagedPaintDevice.PageSize(self.pageSize().id())
+    return result
+
+  def integralOrientedSizeMM(self, orientationEnum):
+    ''' Tuple (width, height), integral, units mm, oriented. '''
+    if orientationEnum == QPageLayout.Portrait:
+      result = self._definedSizeMM
+    else:
+      result = (self._definedSizeMM[1], self._definedSizeMM[0])
+    return result
+
+  def orientedDescription(self, orientationValue):
+    ''' Human readable description also oriented. '''
+    return " ".join((self.name, orientationValue.name,
+                     self._sizeString(self.integralOrientedSizeMM(orientationValue.value))))
+
+  def _sizeString(self, size):
+    return str(size[0]) + 'x' + str(size[1]) + 'mm'
+
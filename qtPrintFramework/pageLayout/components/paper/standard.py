@@ -1,6 +1,4 @@
 
-from PyQt5.QtCore import QSize
-
 from qtPrintFramework.pageLayout.components.paper.paper import Paper
 
 
@@ -13,45 +11,10 @@ class StandardPaper(Paper):
   Inherited:
    -  __repr__
    - value
+   - name, integralDefinedSizeMM, isStandard: delegated to PaperValue (interned per enum.)
    
   Should be registered with QML if using QML.
   '''
   
   def __init__(self, initialValue):
     super().__init__(initialValue)
-    
-  
-  @property
-  def name(self):
-    '''
-    Implement deferred.
-    '''
-    return  Paper.nameModel[self.value]
-  
-  
-  @property
-  def integralDefinedSizeMM(self):
-    '''
-    Specialize Paper:  size is constant from a defining, standard model.
-    QSize
-    - 
-    - integral
-    - units mm
-    '''
-    result = Paper.sizeModel[self.value]
-    assert isinstance(result, QSize)
-    ## Not necessarily normalized (width < height)
-    ## assert result.width() <= result.height()
-    return result
-    
-    
-  @property
-  def isStandard(self):
-    '''
-    Implement deferred
-    '''
-    return True
-
-  
-  
-  
@@ -0,0 +1,101 @@
+
+from PyQt5.QtGui import QPageLayout
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import PageSizeCatalog
+
+
+
+class LayoutChangeSet(object):
+  '''
+  Immutable: what changed in a page layout, from one userChangedLayout to the next (see Converser.)
+
+  Values, each old and new:
+  - record: PageLayoutRecord (paperEnum, orientation, integralOrientedSizeMM.)  Old is None on first change.
+  - printableRect: tuple (x, y, width, height) in unit, or None if unknown
+
+  changedAttributes: frozenset of names of attributes that changed, of:
+  "paperEnum", "orientation", "integralOrientedSizeMM", "printableRect".
+  changes: dictionary of name of changed attribute to tuple (old, new).
+
+  So a receiver can skip work, e.g. not repaginate when only the paper's name changed
+  (A4 to a Custom paper of A4 size), see isGeometryChanged.
+  '''
+
+  __slots__ = ('oldRecord', 'newRecord', 'oldPrintableRect', 'newPrintableRect', 'unit', 'changes')
+
+  defaultUnit = QPageLayout.Inch  # as Converser.printablePageSizeInch()
+
+  # Printable rects closer than this (in unit) are equal: they come from floating conversions
+  epsilon = 0.001
+
+
+  def __init__(self, oldRecord, newRecord, oldPrintableRect, newPrintableRect, unit=None):
+    if unit is None:
+      unit = LayoutChangeSet.defaultUnit
+    assert oldRecord is None or isinstance(oldRecord, PageLayoutRecord)
+    assert isinstance(newRecord, PageLayoutRecord)
+    assert unit in PageSizeCatalog.pointsPerUnit
+    changes = {}
+    for name in ("paperEnum", "orientation", "integralOrientedSizeMM"):
+      oldValue = getattr(oldRecord, name) if oldRecord is not None else None
+      newValue = getattr(newRecord, name)
+      if oldValue != newValue:
+        changes[name] = (oldValue, newValue)
+    if not self._isRectEqual(oldPrintableRect, newPrintableRect):
+      changes["printableRect"] = (oldPrintableRect, newPrintableRect)
+
+    setSlot = object.__setattr__
+    setSlot(self, 'oldRecord', oldRecord)
+    setSlot(self, 'newRecord', newRecord)
+    setSlot(self, 'oldPrintableRect', oldPrintableRect)
+    setSlot(self, 'newPrintableRect', newPrintableRect)
+    setSlot(self, 'unit', unit)
+    setSlot(self, 'changes', changes)
+
+  def __setattr__(self, name, value):
+    raise AttributeError("LayoutChangeSet is immutable")
+
+  def __repr__(self):
+    return "LayoutChangeSet({})".format(", ".join(sorted(self.changes)))
+
+
+  @classmethod
+  def convertedRect(cls, rect, fromUnit, toUnit):
+    ''' rect (tuple (x, y, width, height)) in fromUnit, converted to toUnit.  None if rect is None. '''
+    if rect is None or fromUnit == toUnit:
+      return rect
+    factor = PageSizeCatalog.pointsPerUnit[fromUnit] / PageSizeCatalog.pointsPerUnit[toUnit]
+    return tuple(value * factor for value in rect)
+
+
+  def _isRectEqual(self, rect, otherRect):
+    if rect is None or otherRect is None:
+      return rect is otherRect
+    return all(abs(value - otherValue) < LayoutChangeSet.epsilon for value, otherValue in zip(rect, otherRect))
+
+
+  @property
+  def changedAttributes(self):
+    return frozenset(self.changes)
+
+  @property
+  def isChanged(self):
+    return bool(self.changes)
+
+  @property
+  def isPaperChanged(self):
+    ''' Paper's name (enum) changed, maybe not its size. '''
+    return "paperEnum" in self.changes
+
+  @property
+  def isOrientationChanged(self):
+    return "orientation" in self.changes
+
+  @property
+  def isGeometryChanged(self):
+    '''
+    Whether anything a page is laid out in changed: oriented paper size, or printable rect.
+    When not, a receiver need not repaginate.
+    '''
+    return "integralOrientedSizeMM" in self.changes or "printableRect" in self.changes
@@ -1,7 +1,11 @@
 
 
 
-from PyQt5.QtCore import QObject
+import re
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from qtPrintFramework.pageLayout.model.enumRegistry import enumRegistry
 
 class AdaptedModel(QObject):  # for i18n
   '''
@@ -21,14 +25,35 @@ class AdaptedModel(QObject):  # for i18n
   E.G. paper orientation is translated
   
   - some subclasses derive model from a printerAdaptor
+  
+  - views of values (items(), keys()) are memoized: built once per assignment to 'values'.
+  Replace 'values' (assign a new dictionary); do not mutate it in place, the views would be stale.
+  Emits valuesChanged when 'values' is replaced.
   '''
   
+  valuesChanged = pyqtSignal()
+  
   # Responsibility: have attribute 'values'
   def __init__(self, printerAdaptor=None):
     super(AdaptedModel, self).__init__()
+    self._values = {}
+    self._items = None
+    self._keys = None
     self._createValues(printerAdaptor)  # call subclass
     
     
+  @property
+  def values(self):
+    return self._values
+  
+  @values.setter
+  def values(self, newValues):
+    self._values = newValues
+    self._items = None
+    self._keys = None
+    self.valuesChanged.emit()
+    
+    
   def _createValues(self):
     raise NotImplementedError('Deferred')
   
@@ -36,45 +61,45 @@ class AdaptedModel(QObject):  # for i18n
   '''
   Assert class defining enum is a binary relation (one-to-one).
   Can extract dictionaries in both directions, they will be equal in size.
+  
+  The dictionaries are reflected once per process (see EnumRegistry) and are read-only:
+  a subclass that needs to modify one must copy it (cost is O(items of enum), not O(attributes of class).)
   '''
   
   @classmethod
   def _getAdaptedDictionary(cls, enumOwningClass, enumType):
     ''' 
-    Dictionary keyed by name of enum values.
+    Read-only dictionary keyed by name of enum values.
     i.e. dict[str]=int
     
     Enum values are ints.
     Enum names are class attributes in PyQt.
     An enum class is not defined in PyQt, only the type of the enum.
     
-    So this extracts a dictionary from the dictionary (dir) of the owningClass
+    So this extracts a dictionary from the dictionary (vars) of the owningClass, once.
     '''
     cls._checkEnumParameters(enumOwningClass, enumType)
-    
-    adaptedDictionary = {}
-    # use python vars() to get dictionary of class
-    for key, value in vars(enumOwningClass).items():  # Python2 iteritems():
-      if isinstance(value, enumType):
-        #print(key, value)
-        adaptedDictionary[key] = value
-    return adaptedDictionary
+    return enumRegistry.forward(enumOwningClass, enumType)
   
   @classmethod
   def _getAdaptedReverseDictionary(cls, enumOwningClass, enumType):
     ''' 
-    Dictionary keyed by enum values of names.
+    Read-only dictionary keyed by enum values of names.
     
     See forward dictionary above.
     '''
     cls._checkEnumParameters(enumOwningClass, enumType)
+    return enumRegistry.reverse(enumOwningClass, enumType)
+  
+  @classmethod
+  def _getAdaptedSortedItems(cls, enumOwningClass, enumType):
+    ''' 
+    Tuple of (name, value) sorted by name.
     
-    adaptedDictionary = {}
-    for key, value in vars(enumOwningClass).items():  # Python2 iteritems():
-      if isinstance(value, enumType):
-        #print(key, value)
-        adaptedDictionary[value] = key
-    return adaptedDictionary
+    See forward dictionary above.
+    '''
+    cls._checkEnumParameters(enumOwningClass, enumType)
+    return enumRegistry.sortedItems(enumOwningClass, enumType)
     
   @classmethod
   def _checkEnumParameters(cls, enumOwningClass, enumType):
@@ -107,28 +132,59 @@ class AdaptedModel(QObject):  # for i18n
     
   def items(self):
     '''
-    list of tuples (key, value)
+    tuple of tuples (key, value), in order of _orderedItems()
+    
+    Memoized: the same tuple until values is replaced.
     '''
-    return self.values.items()
+    if self._items is None:
+      self._items = tuple(self._orderedItems())
+    return self._items
   
   
   def keys(self):
     '''
-    list of keys
+    tuple of keys, in order of items()
     '''
-    result =[keyValue[0] for keyValue in self.items()]
+    if self._keys is None:
+      self._keys = tuple(keyValue[0] for keyValue in self.items())
     # print result, str(type(result))
-    return result
+    return self._keys
+  
+  
+  def _orderedItems(self):
+    '''
+    Iterable of (key, value) in order for display.
+    Base: order of values dictionary.
+    '''
+    return self.values.items()
     
     
     
 class AdaptedSortedModel(AdaptedModel):
   '''
-  Extra postcondition on items() : is sorted
+  Extra postcondition on items() : is sorted, in natural order.
+  
+  Natural order, for paper names:
+  - ISO series first: A0, A1, ... A9, A10, then B0 ... B10, then C5 ...
+  - then others (e.g. US names Executive, Legal, Letter), with embedded numbers compared as numbers
+  Lexical order would put A10 before A2, and Comm10E among the ISO series.
   '''
   
-  def items(self):
+  _isoSeriesName = re.compile(r'^[ABC]\d+$')
+  _digits = re.compile(r'(\d+)')
+  
+  @classmethod
+  def naturalKey(cls, name):
     '''
-    list of tuples (key, value)
+    Sort key for name.
+    
+    Parts of name alternate text and number (number at odd indexes), so parts compare with like types.
     '''
-    return sorted(self.values.items())
\ No newline at end of file
+    parts = cls._digits.split(name)
+    naturalParts = tuple(int(part) if i % 2 else part.lower() for i, part in enumerate(parts))
+    isIsoSeries = cls._isoSeriesName.match(name) is not None
+    return (not isIsoSeries, naturalParts, name)
+  
+  
+  def _orderedItems(self):
+    return sorted(self.values.items(), key=lambda item: self.naturalKey(str(item[0])))
\ No newline at end of file
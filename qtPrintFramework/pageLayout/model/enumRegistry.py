@@ -0,0 +1,76 @@
+
+from types import MappingProxyType
+
+
+
+class EnumReflection(object):
+  '''
+  Read-only views of one Qt enum type, reflected from the class that owns it.
+
+  - forward: dict[name]=value, includes aliases (two names for one value)
+  - reverse: dict[value]=name, one name per value (for aliases, the last name reflected)
+  - sortedItems: tuple of (name, value), sorted by name
+  '''
+
+  __slots__ = ('forward', 'reverse', 'sortedItems')
+
+  def __init__(self, enumOwningClass, enumType):
+    '''
+    Enum values are ints.
+    Enum names are class attributes in PyQt.
+    An enum class is not defined in PyQt, only the type of the enum.
+    So this extracts dictionaries from the dictionary (vars) of the owningClass.
+    '''
+    forward = {}
+    reverse = {}
+    for key, value in vars(enumOwningClass).items():
+      if isinstance(value, enumType):
+        forward[key] = value
+        reverse[value] = key
+    self.forward = MappingProxyType(forward)
+    self.reverse = MappingProxyType(reverse)
+    self.sortedItems = tuple(sorted(forward.items()))
+
+
+
+class EnumRegistry(object):
+  '''
+  Process-wide cache of reflected Qt enum types.
+
+  Each (enumOwningClass, enumType) is reflected once, on first request.
+  Reflection walks every attribute of the owning class (QPagedPaintDevice has hundreds);
+  afterwards a request is a dictionary read.
+
+  Hands out read-only mappings: callers that need to modify must copy.
+  '''
+
+  def __init__(self):
+    self._reflections = {}
+
+
+  def reflection(self, enumOwningClass, enumType):
+    key = (enumOwningClass, enumType)
+    try:
+      result = self._reflections[key]
+    except KeyError:
+      # Not locked: a race reflects twice, harmlessly
+      result = EnumReflection(enumOwningClass, enumType)
+      self._reflections[key] = result
+    return result
+
+
+  def forward(self, enumOwningClass, enumType):
+    ''' Read-only dict[name]=value '''
+    return self.reflection(enumOwningClass, enumType).forward
+
+  def reverse(self, enumOwningClass, enumType):
+    ''' Read-only dict[value]=name '''
+    return self.reflection(enumOwningClass, enumType).reverse
+
+  def sortedItems(self, enumOwningClass, enumType):
+    ''' tuple of (name, value) sorted by name '''
+    return self.reflection(enumOwningClass, enumType).sortedItems
+
+
+
+enumRegistry = EnumRegistry()  # singleton
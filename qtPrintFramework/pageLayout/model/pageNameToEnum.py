@@ -4,13 +4,15 @@
 from PyQt5.QtGui import QPagedPaintDevice # !! Not in QtPrintSupport
 
 from qtPrintFramework.pageLayout.model.adaptedModel import AdaptedModel, AdaptedSortedModel
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.lazyModule import lazyAttributes
 
 
 class AdaptedPageNameToEnumModel(AdaptedSortedModel):  # !!! Sorted
   '''
   Dictionary from name to page enum.
   
-  From Qt's enum.
+  From the page size catalog (Qt's enum.)
   Static, a fixed set for use with paperless printers (PDF) that can 'print' to any size you specify.
   '''
     
@@ -18,29 +20,39 @@ class AdaptedPageNameToEnumModel(AdaptedSortedModel):  # !!! Sorted
     ''' See super. '''
     '''
     Dictionary keyed by names of page sizes, of enum values.
-    For all page sizes in QPagedPaintDevice enum.
+    For all standard page sizes, from the page size catalog (see PageSizeCatalog):
+    one name per page size (no aliases e.g. both 'Comm10E' and 'Envelope10'),
+    and not the range markers of Qt's enum (LastPageSize, NPaperSize.)
     
     A current printer might support a different set.  Typically a subset.
     (Depends on physical paper loaded in physical trays.)
     
     !!! Alternate design: Custom is in model.
-    Here, we are excluding it from this model used only by the framework's Page Setup PDF dialog.
+    Here, Custom is excluded (the catalog excludes it): this model is used only by the framework's Page Setup PDF dialog.
     
     !!! No i18n for page names: assume names are internationally recognized.
     '''
-    self.value = AdaptedSortedModel._getAdaptedDictionary(enumOwningClass=QPagedPaintDevice, 
-                                                     enumType=QPagedPaintDevice.PageSize) # !!! Paper/Page confusion
-    assert isinstance(self.value, dict)
+    # Assign once, complete: assigning invalidates memoized views
+    self.values = {entry.name : entry.id for entry in pageSizeCatalog()}
 
-    self._deleteCustomPaper()
-    
-    print(self.value)
-    
-    
-  def _deleteCustomPaper(self):
-    self.value.pop("Custom", None)
 
 
-pageNameToEnum = AdaptedPageNameToEnumModel().value  # singleton
-pageEnumToName = AdaptedModel._getAdaptedReverseDictionary(enumOwningClass=QPagedPaintDevice, 
-                                                     enumType=QPagedPaintDevice.PageSize)
\ No newline at end of file
+'''
+Lazy module attributes, built on first access (not at import):
+pageNameToEnumModel  singleton AdaptedPageNameToEnumModel
+pageNameToEnum  its dictionary from name to page enum, excluding Custom
+pageEnumToName  read-only dictionary from page enum to name
+'''
+def _createPageNameToEnumModel():
+  return AdaptedPageNameToEnumModel()
+
+def _createPageNameToEnum():
+  return __getattr__('pageNameToEnumModel').values
+
+def _createPageEnumToName():
+  return AdaptedModel._getAdaptedReverseDictionary(enumOwningClass=QPagedPaintDevice, 
+                                                   enumType=QPagedPaintDevice.PageSize)
+
+__getattr__ = lazyAttributes(globals(), {'pageNameToEnumModel' : _createPageNameToEnumModel,
+                                         'pageNameToEnum' : _createPageNameToEnum,
+                                         'pageEnumToName' : _createPageEnumToName })
@@ -2,7 +2,7 @@
 from PyQt5.QtGui import QPageLayout
 
 from qtPrintFramework.pageLayout.model.adaptedModel import AdaptedModel
-from qtPrintFramework.pageLayout.components.orientation import Orientation
+from qtPrintFramework.pageLayout.components.orientationValue import OrientationValue
 
 class AdaptedPageOrientationModel(AdaptedModel):
   '''
@@ -25,8 +25,9 @@ class AdaptedPageOrientationModel(AdaptedModel):
     '''
     This is less flexible, doesn't capture Qt's values automatically.
     But is i18n
+    Interned values: no Orientation QObjects are created.
     '''
-    self.values = {Orientation(QPageLayout.Portrait).name : QPageLayout.Portrait,
-                   Orientation(QPageLayout.Landscape).name : QPageLayout.Landscape
+    self.values = {OrientationValue.forEnum(QPageLayout.Portrait).name : QPageLayout.Portrait,
+                   OrientationValue.forEnum(QPageLayout.Landscape).name : QPageLayout.Landscape
                    }
     
@@ -0,0 +1,203 @@
+
+from math import floor
+from types import MappingProxyType
+
+from PyQt5.QtGui import QPageSize  # !! Not in QtPrintSupport
+
+from qtPrintFramework.pageLayout.model.enumRegistry import enumRegistry
+
+
+
+class PageSizeCatalogEntry(object):
+  '''
+  Immutable definition of one standard page size from QPageSize.
+
+  Sizes are defined i.e. portrait orientation, tuples (width, height).
+  Not necessarily normalized (width < height), see Ledger.
+  '''
+
+  __slots__ = ('id', 'name', 'key', 'displayName', 'definitionUnit', 'sizes', 'integralSizeMM')
+
+  def __init__(self, pageSizeId, name, sizes):
+    setSlot = object.__setattr__
+    setSlot(self, 'id', pageSizeId)
+    setSlot(self, 'name', name)                         # name of enum, as in PyQt e.g. 'A4', 'EnvelopeC5'
+    setSlot(self, 'key', QPageSize.key(pageSizeId))     # PPD key e.g. 'EnvC5'
+    setSlot(self, 'displayName', QPageSize.name(pageSizeId))  # localized e.g. 'Envelope C5'
+    setSlot(self, 'definitionUnit', QPageSize.definitionUnits(pageSizeId))  # unit the standard is defined in
+    setSlot(self, 'sizes', MappingProxyType(sizes))    # dict unit to tuple
+    widthMM, heightMM = sizes[QPageSize.Millimeter]
+    # Round half up, as the former hand-made table did (Executive 190.5 is 191)
+    setSlot(self, 'integralSizeMM', (int(floor(widthMM + 0.5)), int(floor(heightMM + 0.5))))
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PageSizeCatalogEntry is immutable")
+
+  def __repr__(self):
+    return "{} {}x{}mm".format(self.name, *self.integralSizeMM)
+
+  def size(self, unit):
+    ''' tuple (width, height) defined size in unit, exact as Qt defines it. '''
+    return self.sizes[unit]
+
+  @property
+  def definedSize(self):
+    ''' tuple (width, height) in definitionUnit: the exact size of the standard. '''
+    return self.sizes[self.definitionUnit]
+
+
+
+class PageSizeCatalog(object):
+  '''
+  Every standard page size Qt knows (QPageSize.PageSizeId, 100+ ids, excluding Custom)
+  with dimensions in points, mm and inches.
+
+  Generated once at first use (see pageSizeCatalog()), then frozen: read-only mappings.
+  Lookups and unit conversions are table reads, not repeated QPageSize/QPrinter queries.
+
+  Ids are also values of QPagedPaintDevice.PageSize (Qt >= 5.3 the enums are the same.)
+
+  Responsibilities:
+  - entry for id
+  - name to id, id to name
+  - per-unit reverse index: exact defined size to id
+  - conversion between units
+  '''
+
+  units = (QPageSize.Millimeter, QPageSize.Point, QPageSize.Inch)
+
+  # Points per unit, as Qt converts (exact, except Didot and Cicero as Qt rounds them.)
+  # Every QPageSize.Unit (equal to QPageLayout.Unit), not only units of catalog.
+  pointsPerUnit = {QPageSize.Millimeter : 72 / 25.4,
+                   QPageSize.Point : 1.0,
+                   QPageSize.Inch : 72.0,
+                   QPageSize.Pica : 12.0,
+                   QPageSize.Didot : 1.065826771,
+                   QPageSize.Cicero : 12.789921252 }
+
+  # PyQt enum names that are not page sizes but range markers
+  _excludedNames = ('Custom', 'LastPageSize', 'NPaperSize')
+
+  # Decimal places of sizes in reverse indexes: Qt defines sizes to 0.01 in and 0.1 mm
+  _indexPrecision = 2
+
+
+  def __init__(self):
+    namesForId = self._reflectNames()
+    entries = {}
+    for pageSizeId in sorted(namesForId):
+      sizes = {}
+      for unit in PageSizeCatalog.units:
+        sizeF = QPageSize.size(pageSizeId, unit)
+        sizes[unit] = (sizeF.width(), sizeF.height())
+      entries[pageSizeId] = PageSizeCatalogEntry(pageSizeId,
+                                                 self._canonicalName(pageSizeId, namesForId[pageSizeId]),
+                                                 sizes)
+    self.entries = MappingProxyType(entries)
+
+    # Every name, including aliases e.g. both 'Comm10E' and 'Envelope10'
+    self.idForName = MappingProxyType({name : pageSizeId
+                                       for pageSizeId, names in namesForId.items()
+                                       for name in names})
+    self.nameForId = MappingProxyType({pageSizeId : entry.name for pageSizeId, entry in entries.items()})
+
+    reverseIndexes = {}
+    for unit in PageSizeCatalog.units:
+      index = {}
+      # !!! Ascending id: where two ids have same size (e.g. A4 and A4Small), first (more common) wins
+      for pageSizeId, entry in entries.items():
+        index.setdefault(self._indexKey(entry.sizes[unit]), pageSizeId)
+      reverseIndexes[unit] = MappingProxyType(index)
+    self._reverseIndexes = MappingProxyType(reverseIndexes)
+
+
+  @classmethod
+  def _reflectNames(cls):
+    '''
+    dict from id to list of PyQt enum names (aliases) for id
+    '''
+    result = {}
+    for name, value in enumRegistry.forward(QPageSize, QPageSize.PageSizeId).items():
+      if name not in cls._excludedNames:
+        result.setdefault(int(value), []).append(name)
+    return result
+
+
+  @classmethod
+  def _canonicalName(cls, pageSizeId, names):
+    '''
+    One name among aliases:
+    the one equal to Qt's key, else the longest (more descriptive, e.g. 'EnvelopeDL' not 'DLE'.)
+    '''
+    key = QPageSize.key(pageSizeId)
+    if key in names:
+      return key
+    return sorted(names, key=lambda name: (-len(name), name))[0]
+
+
+  @classmethod
+  def _indexKey(cls, size):
+    return (round(size[0], cls._indexPrecision), round(size[1], cls._indexPrecision))
+
+
+  def __len__(self):
+    return len(self.entries)
+
+  def __contains__(self, pageSizeId):
+    return pageSizeId in self.entries
+
+  def __iter__(self):
+    ''' Iterate entries, by ascending id. '''
+    return iter(self.entries.values())
+
+
+  def entry(self, pageSizeId):
+    return self.entries[pageSizeId]
+
+  def name(self, pageSizeId):
+    return self.nameForId[pageSizeId]
+
+  def size(self, pageSizeId, unit=QPageSize.Millimeter):
+    ''' tuple (width, height) defined size of id in unit. '''
+    return self.entries[pageSizeId].sizes[unit]
+
+  def integralSizeMM(self, pageSizeId):
+    ''' tuple (width, height) defined size of id, integral mm. '''
+    return self.entries[pageSizeId].integralSizeMM
+
+
+  def idForSize(self, width, height, unit=QPageSize.Millimeter):
+    '''
+    Id whose defined size equals (width, height) in unit (to 0.01 unit), or None.
+
+    Exact: for fuzzy match of sizes from a printer, see PaperSizeMatcher.
+    '''
+    return self._reverseIndexes[unit].get(self._indexKey((width, height)))
+
+
+  def sizeTable(self, unit=QPageSize.Millimeter):
+    '''
+    dict from id to defined size tuple in unit, by ascending id.
+    For building other indexes e.g. PaperSizeMatcher.
+    '''
+    return {pageSizeId : entry.sizes[unit] for pageSizeId, entry in self.entries.items()}
+
+
+  @classmethod
+  def convert(cls, size, fromUnit, toUnit):
+    ''' tuple (width, height) size converted between units of catalog. '''
+    factor = cls.pointsPerUnit[fromUnit] / cls.pointsPerUnit[toUnit]
+    return (size[0] * factor, size[1] * factor)
+
+
+
+_pageSizeCatalog = None
+
+def pageSizeCatalog():
+  '''
+  Singleton PageSizeCatalog, generated on first call.
+  '''
+  global _pageSizeCatalog
+  if _pageSizeCatalog is None:
+    _pageSizeCatalog = PageSizeCatalog()
+  return _pageSizeCatalog
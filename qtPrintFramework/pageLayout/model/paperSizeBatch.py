@@ -0,0 +1,124 @@
+
+'''
+Batch classification of many page sizes to paper enums, in one NumPy pass.
+
+For example, to label every page of a large scanned or PDF document with a standard paper.
+Same semantics as PaperSizeMatcher.match(), which is for one size at a time.
+
+!!! Requires NumPy, which the rest of qtPrintFramework does not (an optional dependency, see README.)
+Import this module only where batch classification is needed.
+'''
+
+try:
+  import numpy
+except ImportError:
+  raise ImportError("qtPrintFramework.pageLayout.model.paperSizeBatch requires NumPy, which is not installed.") from None
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout, QPageSize
+
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.pageLayout.model.paperSizeMatcher import PaperSizeMatcher
+
+
+
+class PaperSizeArrays(object):
+  '''
+  Struct-of-arrays copy of a table of defined paper sizes (dictionary enum to size in mm.)
+
+  enums, widths, heights are parallel 1-D arrays, one element per paper.
+  '''
+
+  def __init__(self, sizeTable):
+    enums = []
+    widths = []
+    heights = []
+    for enum, size in sizeTable.items():
+      if isinstance(size, tuple):
+        width, height = size
+      else:
+        width, height = size.width(), size.height()
+      enums.append(int(enum))
+      widths.append(width)
+      heights.append(height)
+    self.enums = numpy.array(enums, dtype=numpy.int32)
+    self.widths = numpy.array(widths, dtype=numpy.float64)
+    self.heights = numpy.array(heights, dtype=numpy.float64)
+
+
+  def __len__(self):
+    return len(self.enums)
+
+
+  def classify(self, sizesMM, orientations=None, epsilon=None):
+    '''
+    Classify oriented sizes.
+
+    sizesMM: array-like, shape (N, 2): width, height in mm, oriented (as returned by Qt.)
+    orientations: None (match in either orientation),
+                  or a QPageLayout.Orientation for all sizes,
+                  or array-like shape (N,) of QPageLayout.Orientation
+    epsilon: tolerance in mm, default PaperSizeMatcher.defaultEpsilon
+
+    Returns tuple of arrays, each shape (N,):
+    - enums: enum of nearest paper, or QPagedPaintDevice.Custom where no paper is within epsilon
+    - distances: distance to nearest paper (larger of width and height difference), even where Custom
+    - customMask: True where no paper is within epsilon
+    '''
+    if epsilon is None:
+      epsilon = PaperSizeMatcher.defaultEpsilon
+
+    sizes = numpy.asarray(sizesMM, dtype=numpy.float64).reshape(-1, 2)
+    widths = sizes[:, 0:1]  # shape (N, 1) broadcasts against (M,)
+    heights = sizes[:, 1:2]
+
+    if len(self.enums) == 0 or sizes.shape[0] == 0:
+      count = sizes.shape[0]
+      return (numpy.full(count, int(QPagedPaintDevice.Custom), dtype=numpy.int32),
+              numpy.full(count, numpy.inf),
+              numpy.ones(count, dtype=bool))
+
+    if orientations is None:
+      distances = numpy.minimum(self._distances(widths, heights),
+                                self._distances(heights, widths))
+    else:
+      isLandscape = (numpy.asarray(orientations) == QPageLayout.Landscape)
+      isLandscape = numpy.broadcast_to(isLandscape, (sizes.shape[0],)).reshape(-1, 1)
+      # Defined size is the oriented size, transposed if landscape
+      definedWidths = numpy.where(isLandscape, heights, widths)
+      definedHeights = numpy.where(isLandscape, widths, heights)
+      distances = self._distances(definedWidths, definedHeights)
+
+    nearestIndex = numpy.argmin(distances, axis=1)
+    nearestDistances = distances[numpy.arange(distances.shape[0]), nearestIndex]
+    # nan (unknown size from Qt) compares False, so is Custom
+    customMask = ~(nearestDistances < epsilon)
+    enums = numpy.where(customMask, int(QPagedPaintDevice.Custom), self.enums[nearestIndex]).astype(numpy.int32)
+    return enums, nearestDistances, customMask
+
+
+  def _distances(self, definedWidths, definedHeights):
+    '''
+    Array shape (N, M) of distance from each of N defined sizes to each of M papers.
+    '''
+    return numpy.maximum(numpy.abs(definedWidths - self.widths),
+                         numpy.abs(definedHeights - self.heights))
+
+
+
+_paperSizeArrays = None
+
+def paperSizeArrays():
+  '''
+  Singleton PaperSizeArrays over the page size catalog (exact mm), created on first use.
+  '''
+  global _paperSizeArrays
+  if _paperSizeArrays is None:
+    _paperSizeArrays = PaperSizeArrays(pageSizeCatalog().sizeTable(QPageSize.Millimeter))
+  return _paperSizeArrays
+
+
+def classifyPageSizes(sizesMM, orientations=None, epsilon=None):
+  '''
+  Classify many oriented page sizes (mm) to paper enums.  See PaperSizeArrays.classify()
+  '''
+  return paperSizeArrays().classify(sizesMM, orientations, epsilon)
@@ -1,10 +1,12 @@
 
 
 
-from PyQt5.QtPrintSupport import QPrinter, QPrinterInfo
-from PyQt5.QtGui import QPagedPaintDevice # !! Not in QtPrintSupport
+from PyQt5.QtGui import QPagedPaintDevice  # !! Not in QtPrintSupport
+from PyQt5.QtPrintSupport import QPrinter
 
 from qtPrintFramework.pageLayout.model.adaptedModel import AdaptedSortedModel
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.printer.capabilityCache import printerCapabilityCache
 from qtPrintFramework.alertLog import alertLog
 
 class PrinterPaperSizeModel(AdaptedSortedModel):  # !!! Sorted
@@ -23,7 +25,7 @@ class PrinterPaperSizeModel(AdaptedSortedModel):  # !!! Sorted
     ''' See super. '''
     '''
     Dictionary keyed by names of paper sizes, of enum values.
-    For all paper sizes reported by printer AND in QPagedPaintDevice enum AND not Custom.
+    For all paper sizes reported by printer AND in page size catalog (Qt's full QPageSize set) AND not Custom.
     So this is a subset of Qt's enum.
     
     !!! Alternate design: Custom is in model.
@@ -43,22 +45,25 @@ class PrinterPaperSizeModel(AdaptedSortedModel):  # !!! Sorted
     If adapted printer is a PDF printer, includes all values known to Qt?  TODO 
     
     Qt <5.3 reports multiple Custom sizes for letter sizes on many printers !!
+    
+    Paper sizes come from the printer capability cache: the driver is queried once, not per dialog.
     '''
     result = {}
     
-    qtModel = self._qtReverseModel()
+    catalog = pageSizeCatalog()
     
-    printerInfo = QPrinterInfo(printerAdaptor)
-    printerPaperSizes = printerInfo.supportedPaperSizes()
+    capabilities = printerCapabilityCache.capabilitiesForPrinter(printerAdaptor)
+    printerPaperSizes = capabilities.supportedPaperSizes if capabilities is not None else ()
     for paperSizeEnum in printerPaperSizes:
       # print paperSizeEnum
       
       if paperSizeEnum == QPrinter.Custom:
         # Omit custom.  Why? lazy implementation or impossible to reverse?
         continue
-      elif paperSizeEnum in qtModel:
+      elif paperSizeEnum in catalog:
         # paperSizeEnum known to Qt
-        result[qtModel[paperSizeEnum]] = paperSizeEnum
+        # Cache holds ints: restore the enum type that PyQt checks
+        result[catalog.name(paperSizeEnum)] = QPagedPaintDevice.PageSize(paperSizeEnum)
       else:
         alertLog("Printer reports paper size unknown to Qt.")
         # omit
@@ -70,6 +75,6 @@ class PrinterPaperSizeModel(AdaptedSortedModel):  # !!! Sorted
   def _qtReverseModel(self):
     '''
     Get dictionary of (enum, name) from Qt enumerated type.
+    Read-only, from page size catalog.
     '''
-    return AdaptedSortedModel._getAdaptedReverseDictionary(enumOwningClass=QPagedPaintDevice, 
-                                                     enumType=QPagedPaintDevice.PageSize)
\ No newline at end of file
+    return pageSizeCatalog().nameForId
\ No newline at end of file
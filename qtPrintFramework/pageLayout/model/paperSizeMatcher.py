@@ -0,0 +1,167 @@
+
+from math import floor
+
+from PyQt5.QtGui import QPageLayout, QPageSize
+
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.lazyModule import lazyAttributes
+
+
+
+class PaperSizeMatcher(object):
+  '''
+  Index over a table of defined paper sizes.
+  Answers: which paper enum has dimensions nearest some floating dimensions (from Qt, in mm.)
+
+  Replaces rounding to integral mm followed by exact probe of an inverse dictionary.
+
+  Responsibilities:
+  - match in either orientation (Qt returns oriented dimensions, the table holds defined, i.e. portrait, sizes)
+  - tolerance (epsilon) is configurable, default 0.5 mm (the imprecision that Qt bugs introduce)
+  - return nearest candidates with their distances
+
+  !!! Hot path: called on every PrinterAdaptor.paper() and every invariant check.
+  Takes and returns only Python numbers: no Qt object is allocated, and a miss is not logged.
+  A miss is not an error: it means the paper is Custom.
+
+  Distance is the larger of the differences in width and height (not Euclidean),
+  the same measure as OrientedSize.areSizesEpsilonEqual().
+
+  Implementation: buckets keyed by floor of defined width.
+  A lookup probes only the buckets that overlap width +/- epsilon.
+  '''
+
+  defaultEpsilon = 0.5
+
+
+  def __init__(self, sizeTable, epsilon=None):
+    '''
+    sizeTable is a dictionary from enum to defined size (QSize, QSizeF, or tuple (width, height)) in mm.
+    Where sizes tie, the first enum in sizeTable wins.
+    '''
+    if epsilon is None:
+      epsilon = PaperSizeMatcher.defaultEpsilon
+    assert epsilon >= 0
+    self.epsilon = epsilon
+
+    entries = []
+    for enum, size in sizeTable.items():
+      if isinstance(size, tuple):
+        width, height = size
+      else:
+        width, height = size.width(), size.height()
+      entries.append((enum, float(width), float(height)))
+    self._entries = tuple(entries)
+    self._sizes = {enum : (width, height) for enum, width, height in self._entries}
+
+    buckets = {}
+    for entry in self._entries:
+      buckets.setdefault(int(floor(entry[1])), []).append(entry)
+    self._buckets = {key : tuple(value) for key, value in buckets.items()}
+
+
+  def __len__(self):
+    return len(self._entries)
+
+
+  def match(self, widthMM, heightMM, orientationEnum=None, epsilon=None):
+    '''
+    Enum of paper whose defined size is nearest (widthMM, heightMM) and within epsilon, or None.
+
+    widthMM, heightMM are oriented (as returned by Qt.)
+    orientationEnum is a QPageLayout.Orientation, or None meaning: match in either orientation.
+    '''
+    if epsilon is None:
+      epsilon = self.epsilon
+
+    if orientationEnum is None:
+      result, distance = self._bestInBuckets(widthMM, heightMM, epsilon)
+      transposedResult, transposedDistance = self._bestInBuckets(heightMM, widthMM, epsilon)
+      if transposedResult is not None and (result is None or transposedDistance < distance):
+        result = transposedResult
+    elif orientationEnum == QPageLayout.Portrait:
+      result, _ = self._bestInBuckets(widthMM, heightMM, epsilon)
+    else:
+      # Landscape: defined size is transposed
+      result, _ = self._bestInBuckets(heightMM, widthMM, epsilon)
+    return result
+
+
+  def isWithin(self, enum, widthMM, heightMM, orientationEnum, epsilon=None):
+    '''
+    Is the defined size of enum within epsilon of oriented (widthMM, heightMM).
+    False if enum is not in table.
+    '''
+    if epsilon is None:
+      epsilon = self.epsilon
+    if orientationEnum != QPageLayout.Portrait:
+      widthMM, heightMM = heightMM, widthMM
+    try:
+      width, height = self._sizes[enum]
+    except KeyError:
+      return False
+    return max(abs(width - widthMM), abs(height - heightMM)) < epsilon
+
+
+  def nearest(self, widthMM, heightMM, orientationEnum=None, count=1, epsilon=None):
+    '''
+    List of tuples (enum, distance) for at most count papers, nearest first.
+
+    If epsilon is None, the candidates are not limited by distance (for diagnosing a miss.)
+    Else only candidates within epsilon.
+
+    Not on the hot path: considers every paper in the table.
+    '''
+    if orientationEnum is None:
+      probes = ((widthMM, heightMM), (heightMM, widthMM))
+    elif orientationEnum == QPageLayout.Portrait:
+      probes = ((widthMM, heightMM), )
+    else:
+      probes = ((heightMM, widthMM), )
+
+    distances = {}
+    for definedWidth, definedHeight in probes:
+      for enum, width, height in self._entries:
+        distance = max(abs(width - definedWidth), abs(height - definedHeight))
+        if epsilon is not None and not distance < epsilon:
+          continue
+        if enum not in distances or distance < distances[enum]:
+          distances[enum] = distance
+
+    result = sorted(distances.items(), key=lambda item: item[1])
+    return result[:count]
+
+
+  def _bestInBuckets(self, definedWidth, definedHeight, epsilon):
+    '''
+    tuple (enum, distance) of nearest paper within epsilon in defined orientation, or (None, None)
+    '''
+    result = None
+    bestDistance = None
+    try:
+      firstKey = int(floor(definedWidth - epsilon))
+      lastKey = int(floor(definedWidth + epsilon))
+    except (OverflowError, ValueError):
+      # Undocumented Qt behaviour: returns huge or nan paperSize for unknown
+      return None, None
+
+    buckets = self._buckets
+    for key in range(firstKey, lastKey + 1):
+      bucket = buckets.get(key)
+      if bucket is None:
+        continue
+      for enum, width, height in bucket:
+        distance = max(abs(width - definedWidth), abs(height - definedHeight))
+        if distance < epsilon and (bestDistance is None or distance < bestDistance):
+          result = enum
+          bestDistance = distance
+    return result, bestDistance
+
+
+
+def _createPaperSizeMatcher():
+  return PaperSizeMatcher(pageSizeCatalog().sizeTable(QPageSize.Millimeter))
+
+# Lazy singleton paperSizeMatcher, over exact (not rounded) mm sizes of every standard paper.
+# Built on first access (generating the catalog), not at import.
+__getattr__ = lazyAttributes(globals(), {'paperSizeMatcher' : _createPaperSizeMatcher})
@@ -1,4 +1,6 @@
 
+from contextlib import contextmanager
+
 from PyQt5.QtCore import pyqtProperty, QObject
 from PyQt5.QtCore import pyqtSignal as Signal
 from PyQt5.QtCore import pyqtSlot as Slot
@@ -15,6 +17,7 @@ from qtPrintFramework.pageLayout.components.orientation import Orientation
 
 # Mixins
 from qtPrintFramework.pageLayout.able.settingsable import Settingsable
+from qtPrintFramework.versioned import Versioned
 #from qtEmbeddedQmlFramework.qmlDelegate import QmlDelegate
 
 
@@ -25,7 +28,7 @@ PageSetup.py was flawed, it knew the view (editor.)  A model should not know any
 
 
 # WAS a object, no signals or tr(), and is copy()'d
-class PageLayout(QObject, Settingsable):  
+class PageLayout(QObject, Settingsable, Versioned):  
   '''
   Persistent user's choice of page layout attributes.
   Basically a QPageLayout (new to Qt5.3) that also persists in settings.
@@ -46,6 +49,8 @@ class PageLayout(QObject, Settingsable):
     (user can also edit a page layout using a native dialog, but that comes here via PrinterAdaptor 
   - save/restore self to settings, so self persists with app, not with a printer
   - apply/get self to/from PrinterAdaptor (via native dialogs.)
+  - version: changes whenever any attribute changes (see Versioned), so a sync need not be checked again
+  - layoutChanged: one signal when attributes change, once per batch (see batchUpdate())
   
   Almost a responsibility:
   - edit: a PageSetupDialog edits this, and knows this intimately by iterating over editable PageAttributes.
@@ -80,10 +85,19 @@ class PageLayout(QObject, Settingsable):
   openView = Signal() # to QML view
   accepted = Signal() # to model
   rejected = Signal() # to model
-  
-  
+
+  '''
+  Any attributes changed.  No parameter: receiver reads attributes.
+  Attributes' own valueChanged are for views (each bound to one attribute), this is for the business side.
+  '''
+  layoutChanged = Signal()
+
+
   def __init__(self, printerAdaptor=None):
-    super().__init__()  # Must init QObject 
+    super().__init__()  # Must init QObject
+
+    self._batchDepth = 0
+    self._isChangedInBatch = False
     
     '''
     A PageLayout is basically a structured model (a set of properties.)
@@ -138,6 +152,88 @@ class PageLayout(QObject, Settingsable):
     return 'Paper:' + str(self.paper) + ' Orientation:' +  str(self.orientation)
   
   
+  @property
+  def version(self):
+    '''
+    Newest of my own version (attribute instance replaced) and my attributes' versions (attribute value changed.)
+    '''
+    return max(self._version, self._paper.version, self._orientation.version)
+  
+  
+  '''
+  Batch update
+  '''
+  @contextmanager
+  def batchUpdate(self):
+    '''
+    Context in which attributes change together, e.g. paper and orientation from a record or a printer:
+
+      with pageLayout.batchUpdate():
+        pageLayout.orientation.value = ...
+        pageLayout.paper.value = ...
+
+    Attributes' valueChanged are deferred until the outermost batch ends,
+    then emitted once by each attribute that changed, followed by one layoutChanged.
+    So a receiver of layoutChanged (e.g. propagating to a printer, writing settings)
+    never sees a mix of old and new values, and acts once, not once per attribute.
+
+    Batches nest: only the outermost emits.
+
+    An attribute replaced in a batch (e.g. by fromRecord()) emits if its value differs from its predecessor's.
+    '''
+    if self._batchDepth == 0:
+      statesBefore = self._attributeStates()
+      wasBlocked = [attribute.blockSignals(True) for attribute, _, _ in statesBefore]
+    self._batchDepth += 1
+    try:
+      yield self
+    finally:
+      if self._batchDepth == 1:
+        statesAfter = self._attributeStates()
+        for (attribute, _, _), isBlocked in zip(statesBefore, wasBlocked):
+          attribute.blockSignals(isBlocked)
+        # Still in batch: these emits only mark it changed
+        for (attribute, versionBefore, valueBefore), (current, version, value) in zip(statesBefore, statesAfter):
+          if attribute is current:
+            isChanged = version != versionBefore
+          else:
+            current.blockSignals(False)  # Blocked when adopted, see _adoptAttribute()
+            isChanged = value != valueBefore
+          if isChanged:
+            current.valueChanged.emit(current.value)
+      self._batchDepth -= 1
+      if self._batchDepth == 0 and self._isChangedInBatch:
+        self._isChangedInBatch = False
+        self.layoutChanged.emit()
+
+
+  def _attributeStates(self):
+    ''' Tuple of (attribute, version, value) for my attributes. '''
+    return ((self._orientation, self._orientation.version, self._orientation.orientationValue),
+            (self._paper, self._paper.version, self._paper.paperValue))
+
+
+  @Slot(int)
+  def _attributeChangedSlot(self, value):
+    if self._batchDepth > 0:
+      self._isChangedInBatch = True
+    else:
+      self.layoutChanged.emit()
+
+
+  def _adoptAttribute(self, oldAttribute, newAttribute):
+    '''
+    Relay newAttribute's valueChanged as my layoutChanged.
+    Replacing an instance (see Settingsable.fromRecord()) is not itself a change,
+    except in a batch, whose end compares values (see batchUpdate().)
+    '''
+    if oldAttribute is not None:
+      oldAttribute.valueChanged.disconnect(self._attributeChangedSlot)
+    newAttribute.valueChanged.connect(self._attributeChangedSlot)
+    if self._batchDepth > 0:
+      newAttribute.blockSignals(True)
+
+
   def paperIsCustom(self):
     return self.paper.isCustom
   
@@ -186,7 +282,9 @@ class PageLayout(QObject, Settingsable):
   
   @orientation.setter
   def orientation(self, newValue):
+    self._adoptAttribute(getattr(self, '_orientation', None), newValue)
     self._orientation = newValue
+    self.touch()
   
   @pyqtProperty(StandardPaper)
   def paper(self):
@@ -194,7 +292,9 @@ class PageLayout(QObject, Settingsable):
   
   @paper.setter
   def paper(self, newValue):
+    self._adoptAttribute(getattr(self, '_paper', None), newValue)
     self._paper = newValue
+    self.touch()
     
     
   def emitOpenView(self):
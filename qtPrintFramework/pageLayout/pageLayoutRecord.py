@@ -0,0 +1,131 @@
+
+import json
+import struct
+
+
+
+class PageLayoutRecord(object):
+  '''
+  Immutable, compact, versioned record of a PageLayout's values.
+
+  Plain Python (no Qt): read and written in one operation,
+  for settings (one key, see Settingsable) and for shipping a layout to a worker process
+  (a PageLayout is a QObject, it does not pickle; this does.)
+
+  Values:
+  - paperEnum: int, QPagedPaintDevice.PageSize
+  - orientation: int, QPageLayout.Orientation
+  - integralOrientedSizeMM: tuple (width, height), integral mm, oriented (as in former settings keys)
+  - marginsMM: tuple (left, top, right, bottom), floating mm
+
+  Encodings (see encode(), decode()):
+  - binary: a fixed struct, led by its format version.  Compact, fast to parse.
+  - JSON: a dictionary with key "formatVersion".  For values a fixed struct cannot hold:
+    a newer version adds keys, an older reader ignores keys it does not know,
+    and a newer reader defaults keys an older writer did not write.
+  decode() accepts either.
+  '''
+
+  __slots__ = ('paperEnum', 'orientation', 'integralOrientedSizeMM', 'marginsMM')
+
+  formatVersion = 1
+
+  # Version, paperEnum, orientation, width, height, margins left, top, right, bottom.  Little endian, no padding.
+  _struct = struct.Struct('<BHBHH4f')
+
+  defaultMarginsMM = (0.0, 0.0, 0.0, 0.0)
+
+
+  def __init__(self, paperEnum, orientation, integralOrientedSizeMM, marginsMM=None):
+    if marginsMM is None:
+      marginsMM = PageLayoutRecord.defaultMarginsMM
+    width, height = integralOrientedSizeMM
+    left, top, right, bottom = marginsMM
+    setSlot = object.__setattr__
+    setSlot(self, 'paperEnum', int(paperEnum))
+    setSlot(self, 'orientation', int(orientation))
+    setSlot(self, 'integralOrientedSizeMM', (int(width), int(height)))
+    setSlot(self, 'marginsMM', (float(left), float(top), float(right), float(bottom)))
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PageLayoutRecord is immutable")
+
+  def __repr__(self):
+    return "PageLayoutRecord({}, {}, {}x{}mm)".format(self.paperEnum, self.orientation, *self.integralOrientedSizeMM)
+
+  def __eq__(self, other):
+    if not isinstance(other, PageLayoutRecord):
+      return False
+    return self._values() == other._values()
+
+  def __ne__(self, other):
+    return not self == other
+
+  def __hash__(self):
+    return hash(self._values())
+
+  def __reduce__(self):
+    ''' Pickle as the binary encoding. '''
+    return (PageLayoutRecord.decode, (self.encode(), ))
+
+  def _values(self):
+    return (self.paperEnum, self.orientation, self.integralOrientedSizeMM, self.marginsMM)
+
+
+  '''
+  Binary
+  '''
+  def encode(self):
+    '''
+    bytes, binary encoding of current format version.
+
+    Else (a value out of the struct's range, e.g. a negative or huge size) the JSON encoding, as bytes:
+    decode() accepts either.
+    '''
+    try:
+      return PageLayoutRecord._struct.pack(PageLayoutRecord.formatVersion, self.paperEnum, self.orientation,
+                                           *(self.integralOrientedSizeMM + self.marginsMM))
+    except (struct.error, OverflowError):
+      return self.toJSON().encode('utf-8')
+
+  @classmethod
+  def decode(cls, data):
+    '''
+    Record from bytes of either encoding.
+
+    Raises ValueError if data is not a record of a version this reads.
+    '''
+    data = bytes(data)
+    if data[:1] == b'{':
+      return cls.fromJSON(data.decode('utf-8'))
+    if len(data) != cls._struct.size or data[0] != cls.formatVersion:
+      raise ValueError("Not a binary PageLayoutRecord of format version {}".format(cls.formatVersion))
+    _, paperEnum, orientation, width, height, left, top, right, bottom = cls._struct.unpack(data)
+    return cls(paperEnum, orientation, (width, height), (left, top, right, bottom))
+
+
+  '''
+  JSON
+  '''
+  def toDict(self):
+    return {"formatVersion" : PageLayoutRecord.formatVersion,
+            "paperEnum" : self.paperEnum,
+            "orientation" : self.orientation,
+            "integralOrientedSizeMM" : list(self.integralOrientedSizeMM),
+            "marginsMM" : list(self.marginsMM)}
+
+  @classmethod
+  def fromDict(cls, dictionary):
+    ''' Raises ValueError if dictionary lacks a value this version requires. '''
+    try:
+      return cls(dictionary["paperEnum"], dictionary["orientation"], dictionary["integralOrientedSizeMM"],
+                 dictionary.get("marginsMM"))
+    except (KeyError, TypeError) as exception:
+      raise ValueError("Not a PageLayoutRecord: " + str(exception))
+
+  def toJSON(self):
+    return json.dumps(self.toDict(), separators=(',', ':'))
+
+  @classmethod
+  def fromJSON(cls, text):
+    return cls.fromDict(json.loads(text))
@@ -0,0 +1,225 @@
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
+from qtPrintFramework.pageLayout.components.orientationValue import OrientationValue
+from qtPrintFramework.settings.settingsBackend import settingsBackend
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+from qtPrintFramework.alertLog import alertLog
+
+
+
+class PageLayoutPreset(object):
+  '''
+  Immutable, named page layout, e.g. "Labels", "Report A4 landscape".
+
+  Validated once, when created: raises ValueError if record's paper or orientation is not one this framework knows.
+  Holds its values ready to apply: paperValue, orientationValue.
+  '''
+
+  __slots__ = ('name', 'record', 'paperValue', 'orientationValue')
+
+  def __init__(self, name, record):
+    assert isinstance(record, PageLayoutRecord)
+    if not name:
+      raise ValueError("Preset has no name.")
+    if record.orientation not in (QPageLayout.Portrait, QPageLayout.Landscape):
+      raise ValueError("Preset {!r} has unknown orientation {}.".format(name, record.orientation))
+    if record.paperEnum == QPagedPaintDevice.Custom:
+      if min(record.integralOrientedSizeMM) <= 0:
+        raise ValueError("Preset {!r} has empty Custom paper.".format(name))
+      paperValue = PaperValue.customFromOrientedSize(record.integralOrientedSizeMM, record.orientation)
+    elif record.paperEnum in pageSizeCatalog():
+      paperValue = PaperValue.standard(record.paperEnum)
+    else:
+      raise ValueError("Preset {!r} has unknown paper {}.".format(name, record.paperEnum))
+
+    setSlot = object.__setattr__
+    setSlot(self, 'name', name)
+    setSlot(self, 'record', record)
+    setSlot(self, 'paperValue', paperValue)
+    setSlot(self, 'orientationValue', OrientationValue.forEnum(record.orientation))
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PageLayoutPreset is immutable")
+
+  def __repr__(self):
+    return "PageLayoutPreset({!r}, {})".format(self.name, self.paperValue.orientedDescription(self.orientationValue))
+
+
+
+class PresetApplication(object):
+  '''
+  Immutable: how to apply one preset to one printer, precomputed.
+
+  - pageSize: QPageSize to set (by exact definition, see PaperValue.pageSize())
+  - orientationEnum
+  - isSupported: whether printer reports it supports the paper, None if unknown (e.g. a PDF printer)
+  '''
+
+  __slots__ = ('preset', 'pageSize', 'orientationEnum', 'isSupported')
+
+  def __init__(self, preset, capabilities):
+    '''
+    capabilities: PrinterCapabilities of the printer, or None if unknown
+    '''
+    if capabilities is None:
+      isSupported = None
+    elif preset.paperValue.isCustom:
+      isSupported = capabilities.supportsCustomPageSizes
+    else:
+      isSupported = int(preset.paperValue.value) in capabilities.supportedPaperSizes
+
+    setSlot = object.__setattr__
+    setSlot(self, 'preset', preset)
+    setSlot(self, 'pageSize', preset.paperValue.pageSize())
+    setSlot(self, 'orientationEnum', preset.orientationValue.value)
+    setSlot(self, 'isSupported', isSupported)
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PresetApplication is immutable")
+
+
+  def applyTo(self, printerAdaptor):
+    '''
+    Set on printerAdaptor only what differs from its snapshot.
+    Returns count of Qt calls made (see PrinterAdaptor.qtCallCount.)
+    '''
+    qtCallCountBefore = printerAdaptor.qtCallCount
+    snapshot = printerAdaptor.snapshot()
+    if snapshot.orientationValue.value != self.orientationEnum:
+      printerAdaptor.setPageOrientation(self.orientationEnum)
+    if not snapshot.hasPaper(self.preset.paperValue):
+      printerAdaptor.setPageSize(self.pageSize)
+    return printerAdaptor.qtCallCount - qtCallCountBefore
+
+
+
+class PageLayoutPresetLibrary(object):
+  '''
+  Named page layout presets, persisted in settings (one key per preset, in group settingsGroup.)
+
+  Applying a preset (see apply()) is:
+  - one lookup of the preset by name (validated when added or loaded, not when applied)
+  - one lookup of its application to the printer (precomputed on first use per printer and preset)
+  - only the printer setters whose values differ
+  instead of a conversation through dialogs.
+
+  Loaded on first use.  Changes are written behind, see SettingsWriter.
+  '''
+
+  settingsGroup = "pageLayoutPresets"
+
+
+  def __init__(self):
+    self._presets = None        # name to PageLayoutPreset, None until loaded
+    self._applications = {}     # (printer key, preset name) to PresetApplication
+
+
+  def _loadedPresets(self):
+    if self._presets is None:
+      # Not read values older than those written
+      settingsWriter.flush()
+      self._presets = {}
+      for name, data in settingsBackend().read(PageLayoutPresetLibrary.settingsGroup).items():
+        if not data:
+          continue  # removed
+        try:
+          self._presets[name] = PageLayoutPreset(name, PageLayoutRecord.decode(data))
+        except (ValueError, TypeError):
+          alertLog("Unreadable page layout preset.")
+    return self._presets
+
+
+  def __len__(self):
+    return len(self._loadedPresets())
+
+  def __contains__(self, name):
+    return name in self._loadedPresets()
+
+  def names(self):
+    ''' Sorted list of names, e.g. for a menu. '''
+    return sorted(self._loadedPresets())
+
+  def get(self, name):
+    ''' PageLayoutPreset named name, or None. '''
+    return self._loadedPresets().get(name)
+
+
+  def add(self, name, record):
+    '''
+    Add (or replace) a preset from a PageLayoutRecord (e.g. pageLayout.toRecord().)
+    Raises ValueError if record is not valid.
+    Returns the PageLayoutPreset.
+    '''
+    result = PageLayoutPreset(name, record)
+    self._loadedPresets()[name] = result
+    self._forgetApplications(name)
+    settingsWriter.write(PageLayoutPresetLibrary.settingsGroup, { name : record.encode() })
+    return result
+
+
+  def remove(self, name):
+    if self._loadedPresets().pop(name, None) is not None:
+      self._forgetApplications(name)
+      # Backends cannot delete a key: empty value means removed
+      settingsWriter.write(PageLayoutPresetLibrary.settingsGroup, { name : b"" })
+
+
+  def apply(self, name, pageLayout, printerAdaptor=None):
+    '''
+    Make preset named name the values of pageLayout, and of printerAdaptor if any.
+
+    Printer first, so that when pageLayout emits (and e.g. a converser propagates it to the printer)
+    the printer already agrees.
+    Raises KeyError if no such preset.
+    Returns the PageLayoutPreset.
+    '''
+    preset = self._loadedPresets()[name]
+    if printerAdaptor is not None:
+      application = self.application(preset, printerAdaptor)
+      if application.isSupported is False:
+        alertLog("Printer does not support paper of preset.")
+      application.applyTo(printerAdaptor)
+    pageLayout.setValuesFromRecord(preset.record)
+    return preset
+
+
+  def application(self, preset, printerAdaptor):
+    '''
+    PresetApplication of preset to printer adapted by printerAdaptor.  Precomputed on first use.
+    '''
+    key = ((printerAdaptor.printerName(), int(printerAdaptor.outputFormat())), preset.name)
+    try:
+      result = self._applications[key]
+    except KeyError:
+      result = PresetApplication(preset, self._capabilities(printerAdaptor))
+      self._applications[key] = result
+    return result
+
+
+  def invalidatePrinter(self, printerName=None):
+    '''
+    Forget applications to printerName (all printers if None), e.g. when its capabilities changed.
+    '''
+    for key in list(self._applications):
+      if printerName is None or key[0][0] == printerName:
+        del self._applications[key]
+
+
+  def _forgetApplications(self, presetName):
+    for key in list(self._applications):
+      if key[1] == presetName:
+        del self._applications[key]
+
+
+  def _capabilities(self, printerAdaptor):
+    # Import at use: the printer package depends on QtPrintSupport, this package does not
+    from qtPrintFramework.printer.capabilityCache import printerCapabilityCache
+    return printerCapabilityCache.capabilitiesForPrinter(printerAdaptor)
+
+
+
+pageLayoutPresetLibrary = PageLayoutPresetLibrary()  # singleton
@@ -0,0 +1,272 @@
+
+import hashlib
+import json
+import os
+import threading
+
+from PyQt5.QtCore import QStandardPaths
+
+from qtPrintFramework.printer.printerBackend import printerBackend
+from qtPrintFramework.alertLog import alertLog, debugLog
+
+
+
+class PrinterCapabilities(object):
+  '''
+  Immutable capabilities of one printer, as its driver reports them.
+
+  Plain Python values (ints, bools, strings), so they persist as JSON:
+  - supportedPaperSizes: tuple of QPagedPaintDevice.PageSize values, as ints
+  - supportsCustomPageSizes: bool
+  - supportedResolutions: tuple of ints, dpi
+  - defaultPaperSize: QPageSize.PageSizeId value of driver's default paper, as int
+  - fingerprint: string, see PrinterCapabilityCache.fingerprint()
+  '''
+
+  __slots__ = ('printerName', 'fingerprint', 'supportedPaperSizes', 'supportsCustomPageSizes',
+               'supportedResolutions', 'defaultPaperSize')
+
+  def __init__(self, printerName, fingerprint, supportedPaperSizes, supportsCustomPageSizes,
+               supportedResolutions, defaultPaperSize):
+    setSlot = object.__setattr__
+    setSlot(self, 'printerName', printerName)
+    setSlot(self, 'fingerprint', fingerprint)
+    setSlot(self, 'supportedPaperSizes', tuple(int(paperSize) for paperSize in supportedPaperSizes))
+    setSlot(self, 'supportsCustomPageSizes', bool(supportsCustomPageSizes))
+    setSlot(self, 'supportedResolutions', tuple(int(resolution) for resolution in supportedResolutions))
+    setSlot(self, 'defaultPaperSize', int(defaultPaperSize))
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PrinterCapabilities is immutable")
+
+  def __repr__(self):
+    return "PrinterCapabilities({!r}, {} paper sizes)".format(self.printerName, len(self.supportedPaperSizes))
+
+
+  @classmethod
+  def fromPrinterInfo(cls, printerInfo, fingerprint):
+    '''
+    Query the driver.  Slow: this is what the cache avoids.
+    '''
+    return cls(printerName=printerInfo.printerName(),
+               fingerprint=fingerprint,
+               supportedPaperSizes=printerInfo.supportedPaperSizes(),
+               supportsCustomPageSizes=printerInfo.supportsCustomPageSizes(),
+               supportedResolutions=printerInfo.supportedResolutions(),
+               defaultPaperSize=printerInfo.defaultPageSize().id())
+
+
+  def toDict(self):
+    return {name : getattr(self, name) for name in PrinterCapabilities.__slots__}
+
+  @classmethod
+  def fromDict(cls, dictionary):
+    ''' Raises KeyError or TypeError or ValueError if dictionary is not from toDict() '''
+    return cls(**{name : dictionary[name] for name in PrinterCapabilities.__slots__})
+
+
+
+class PrinterCapabilityCache(object):
+  '''
+  Capabilities of printers, by printer name, persisted between sessions.
+
+  Querying a driver for its capabilities (e.g. QPrinterInfo.supportedPaperSizes()) is a slow round trip
+  (e.g. CUPS reads a PPD.)  This cache queries a printer's driver at most once
+  until the printer's fingerprint changes.
+
+  Validation is lazy: a cached entry is checked against the printer's fingerprint
+  on first use in a session, not when the cache is loaded.
+
+  Persisted as a JSON file in QStandardPaths.CacheLocation.
+  Loaded on first use, saved when an entry changes.
+  A file that cannot be read is treated as empty (it is only a cache.)
+
+  Thread-safe: may be filled from worker threads.
+  '''
+
+  formatVersion = 1
+
+  fileName = "printerCapabilities.json"
+
+
+  def __init__(self, path=None):
+    '''
+    path of file, default in app's cache location
+    '''
+    self._path = path
+    self._lock = threading.RLock()
+    self._entries = None   # dict from printer name to PrinterCapabilities, None until loaded
+    self._validatedNames = set()  # Names whose entry was checked against fingerprint this session
+
+
+  @classmethod
+  def fingerprint(cls, printerInfo):
+    '''
+    Cheap identity of a printer's configuration: attributes Qt has without querying the driver.
+    If a printer is replaced or reconfigured (e.g. new PPD) under the same name, fingerprint changes.
+    '''
+    terms = (printerInfo.printerName(),
+             printerInfo.makeAndModel(),
+             printerInfo.description(),
+             printerInfo.location(),
+             str(printerInfo.isRemote()))
+    return hashlib.sha1('\x1f'.join(terms).encode('utf-8')).hexdigest()
+
+
+  def capabilities(self, printerName, save=True):
+    '''
+    PrinterCapabilities of printer named printerName, or None if there is no such printer.
+
+    Queries the driver only if not cached or cached entry is stale (fingerprint differs.)
+    If not save, a queried entry is not persisted until save() (e.g. when filling many entries.)
+    '''
+    result = self._validatedEntry(printerName)
+    if result is None:
+      result = self.capabilitiesForPrinterInfo(printerBackend().printerInfo(printerName), save)
+    return result
+
+
+  def capabilitiesForPrinter(self, printer):
+    '''
+    PrinterCapabilities of a QPrinter's current printer, or None.
+
+    Looks up by printer's name first: a printer info (QPrinterInfo(printer), which on CUPS opens the device and its PPD)
+    is made only when the entry is missing or not yet validated this session.
+    '''
+    result = self._validatedEntry(printer.printerName())
+    if result is None:
+      result = self.capabilitiesForPrinterInfo(printerBackend().printerInfoForPrinter(printer))
+    return result
+
+
+  def capabilitiesForPrinterInfo(self, printerInfo, save=True):
+    if printerInfo.isNull():
+      return None
+    printerName = printerInfo.printerName()
+
+    result = self._validatedEntry(printerName)
+    if result is not None:
+      return result
+    with self._lock:
+      result = self._loadedEntries().get(printerName)
+
+    # Not holding lock while querying
+    fingerprint = self.fingerprint(printerInfo)
+    if result is not None and result.fingerprint == fingerprint:
+      debugLog("Printer capabilities from cache.")
+      with self._lock:
+        self._validatedNames.add(printerName)
+      return result
+
+    debugLog("Querying printer driver for capabilities.")
+    result = PrinterCapabilities.fromPrinterInfo(printerInfo, fingerprint)
+    self.update(result, save)
+    return result
+
+
+  def _validatedEntry(self, printerName):
+    ''' Cached PrinterCapabilities of printerName if already validated this session, else None. '''
+    with self._lock:
+      if printerName in self._validatedNames:
+        return self._loadedEntries().get(printerName)
+    return None
+
+
+  def cachedCapabilities(self, printerName):
+    '''
+    PrinterCapabilities of printerName from cache, not validated, or None.
+    Never queries the driver.
+    '''
+    with self._lock:
+      return self._loadedEntries().get(printerName)
+
+
+  def update(self, capabilities, save=True):
+    '''
+    Store (validated) capabilities, and persist if save.
+    '''
+    assert isinstance(capabilities, PrinterCapabilities)
+    with self._lock:
+      self._loadedEntries()[capabilities.printerName] = capabilities
+      self._validatedNames.add(capabilities.printerName)
+      if save:
+        self._save()
+
+
+  def save(self):
+    ''' Persist all entries. '''
+    with self._lock:
+      self._loadedEntries()
+      self._save()
+
+
+  def invalidate(self, printerName=None):
+    '''
+    Forget cached capabilities of printerName, or of all printers if printerName is None.
+    '''
+    with self._lock:
+      entries = self._loadedEntries()
+      if printerName is None:
+        entries.clear()
+        self._validatedNames.clear()
+      else:
+        entries.pop(printerName, None)
+        self._validatedNames.discard(printerName)
+      self._save()
+
+
+  '''
+  Persistence
+  '''
+  @property
+  def path(self):
+    if self._path is None:
+      location = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+      self._path = os.path.join(location, "qtPrintFramework", PrinterCapabilityCache.fileName)
+    return self._path
+
+
+  def _loadedEntries(self):
+    ''' Caller holds lock. '''
+    if self._entries is None:
+      self._entries = self._load()
+    return self._entries
+
+
+  def _load(self):
+    result = {}
+    try:
+      with open(self.path, 'r') as file:
+        document = json.load(file)
+      if document.get('version') != PrinterCapabilityCache.formatVersion:
+        return result
+      for dictionary in document['printers']:
+        capabilities = PrinterCapabilities.fromDict(dictionary)
+        result[capabilities.printerName] = capabilities
+    except FileNotFoundError:
+      pass
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+      alertLog("Ignoring unreadable printer capability cache.")
+      result = {}
+    return result
+
+
+  def _save(self):
+    '''
+    Caller holds lock.
+    Write whole file to temporary, then rename: readers never see a partial file.
+    '''
+    document = {'version' : PrinterCapabilityCache.formatVersion,
+                'printers' : [capabilities.toDict() for capabilities in self._entries.values()] }
+    temporaryPath = self.path + ".tmp"
+    try:
+      os.makedirs(os.path.dirname(self.path), exist_ok=True)
+      with open(temporaryPath, 'w') as file:
+        json.dump(document, file)
+      os.replace(temporaryPath, self.path)
+    except OSError:
+      alertLog("Failed to save printer capability cache.")
+
+
+
+printerCapabilityCache = PrinterCapabilityCache()  # singleton
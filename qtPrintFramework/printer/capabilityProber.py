@@ -0,0 +1,187 @@
+
+from collections import deque
+import queue
+import threading
+import time
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from qtPrintFramework.printer.printerSet import printerSet
+from qtPrintFramework.printer.capabilityCache import printerCapabilityCache
+from qtPrintFramework.alertLog import alertLog
+
+
+
+class PrinterCapabilityProber(QObject):
+  '''
+  Fills the printer capability cache for every printer in a PrinterSet, concurrently.
+
+  Probing one printer after another takes the sum of their latencies;
+  this takes about the latency of the slowest (up to timeout), on at most maxWorkers threads at once.
+
+  Starts and returns immediately (see probe().)  As each printer answers:
+  - its capabilities go into the cache (persisted once, when probing finishes)
+  - they are in results (readable from any thread)
+  - capabilitiesProbed(printerName) is emitted
+  so a GUI can show partial results while slow printers are still answering.
+
+  A printer that does not answer within timeout seconds (from when its query started)
+  is reported by printerTimedOut(printerName) and no longer awaited, and frees its worker slot.
+  A printer still queued when all could have been probed (timeout per round of maxWorkers, from probe())
+  is also reported timed out: finished is always emitted.
+  (A blocked driver call cannot be cancelled: its daemon thread finishes, and fills the cache, whenever it returns,
+  or ends with the app.)
+  A printer whose worker (of an earlier probe) is still in flight is not queried again, and is reported timed out:
+  repeated probes of a hung printer do not pile up threads.
+
+  Signals are emitted in the thread of this object (usually the GUI thread), when its event loop runs.
+  '''
+
+  capabilitiesProbed = pyqtSignal(str)
+  printerTimedOut = pyqtSignal(str)
+  finished = pyqtSignal()
+
+  # Internal: monitor thread to thread of self
+  _probed = pyqtSignal(str)
+  _timedOut = pyqtSignal(str)
+  _finished = pyqtSignal()
+
+  defaultMaxWorkers = 8
+  defaultTimeout = 10.0   # seconds per printer
+
+  # Seconds between checks for timed out printers
+  _pollInterval = 0.1
+
+
+  def __init__(self, printerSet=printerSet, cache=printerCapabilityCache, maxWorkers=None, timeout=None):
+    super(PrinterCapabilityProber, self).__init__()
+    self.printerSet = printerSet
+    self.cache = cache
+    self.maxWorkers = maxWorkers if maxWorkers is not None else PrinterCapabilityProber.defaultMaxWorkers
+    self.timeout = timeout if timeout is not None else PrinterCapabilityProber.defaultTimeout
+
+    self._lock = threading.Lock()
+    self.results = {}         # dict from printer name to PrinterCapabilities, of this probe
+    self.timedOutNames = set()
+    self._monitorThread = None
+    self._inFlightNames = set()   # printers with a worker running, of any probe
+
+    self._probed.connect(self.capabilitiesProbed, Qt.QueuedConnection)
+    self._timedOut.connect(self.printerTimedOut, Qt.QueuedConnection)
+    self._finished.connect(self.finished, Qt.QueuedConnection)
+
+
+  @property
+  def isProbing(self):
+    return self._monitorThread is not None and self._monitorThread.is_alive()
+
+
+  def probe(self, printerNames=None):
+    '''
+    Start probing printers named printerNames, default all in printerSet.
+    Returns immediately.  Does nothing if already probing.
+    '''
+    if self.isProbing:
+      return
+    if printerNames is None:
+      printerNames = self.printerSet.availablePrinterNames()
+
+    with self._lock:
+      self.results = {}
+      self.timedOutNames = set()
+
+    self._monitorThread = threading.Thread(target=self._monitor, args=(list(printerNames), time.monotonic()),
+                                           name="PrinterCapabilityProber")
+    self._monitorThread.daemon = True
+    self._monitorThread.start()
+
+
+  def wait(self, timeout=None):
+    '''
+    Block until probing finished (for scripts, without an event loop.)
+    '''
+    if self._monitorThread is not None:
+      self._monitorThread.join(timeout)
+
+
+  def _probeOne(self, printerName, answers):
+    ''' In worker thread. '''
+    try:
+      # Do not persist per printer: persist once, when all finished
+      answers.put((printerName, self.cache.capabilities(printerName, save=False), None))
+    except Exception as exception:   # Driver failure for one printer should not stop the others
+      answers.put((printerName, None, exception))
+    finally:
+      with self._lock:
+        self._inFlightNames.discard(printerName)
+
+
+  def _monitor(self, printerNames, probeTime):
+    '''
+    In monitor thread.
+
+    Starts a worker (a daemon thread: a hung driver call does not block app quit) per printer,
+    at most maxWorkers at once.
+    A timed out worker is abandoned: it no longer counts against maxWorkers, so the queue moves on.
+    So all printers are done or timed out by deadline, counted from probe():
+    timeout for each round of maxWorkers printers.
+    '''
+    queued = deque(printerNames)
+    running = {}              # printer name to time.monotonic() when its query started
+    answers = queue.Queue()   # (printer name, PrinterCapabilities or None, exception or None), from workers
+    rounds = -(-len(queued) // max(self.maxWorkers, 1))
+    deadline = probeTime + self.timeout * rounds
+
+    while queued or running:
+      while queued and len(running) < self.maxWorkers:
+        printerName = queued.popleft()
+        with self._lock:
+          isInFlight = printerName in self._inFlightNames
+          self._inFlightNames.add(printerName)
+        if isInFlight:
+          # Abandoned by an earlier probe, still hung
+          self._onTimedOut(printerName)
+          continue
+        running[printerName] = time.monotonic()
+        worker = threading.Thread(target=self._probeOne, args=(printerName, answers),
+                                  name="PrinterCapabilityProber worker")
+        worker.daemon = True
+        worker.start()
+
+      try:
+        printerName, capabilities, exception = answers.get(timeout=PrinterCapabilityProber._pollInterval)
+        # Answer of a timed out printer is not awaited (but it filled the cache)
+        if running.pop(printerName, None) is not None:
+          self._onDone(printerName, capabilities, exception)
+      except queue.Empty:
+        pass
+
+      now = time.monotonic()
+      for printerName, startTime in list(running.items()):
+        if now - startTime > self.timeout or now > deadline:
+          del running[printerName]
+          self._onTimedOut(printerName)
+      if now > deadline:
+        while queued:
+          self._onTimedOut(queued.popleft())
+
+    self.cache.save()
+    self._finished.emit()
+
+
+  def _onTimedOut(self, printerName):
+    with self._lock:
+      self.timedOutNames.add(printerName)
+    self._timedOut.emit(printerName)
+
+
+  def _onDone(self, printerName, capabilities, exception):
+    if exception is not None:
+      alertLog("Failed to probe printer capabilities: " + str(exception))
+      return
+    if capabilities is None:
+      # Printer vanished since printerSet snapshot
+      return
+    with self._lock:
+      self.results[printerName] = capabilities
+    self._probed.emit(printerName)
@@ -1,7 +1,7 @@
 
 import sys
 
-from PyQt5.QtCore import QSizeF # , QSize, QRect
+from PyQt5.QtCore import QSize, QSizeF # , QRect
 from PyQt5.QtPrintSupport import QPrinter
 from PyQt5.QtGui import QPagedPaintDevice  # !! Not in QtPrintSupport
 from PyQt5.QtGui import QPageLayout
@@ -10,12 +10,16 @@ from qtPrintFramework.orientedSize import OrientedSize
 from qtPrintFramework.pageLayout.components.paper.paper import Paper
 from qtPrintFramework.pageLayout.components.paper.standard import StandardPaper
 from qtPrintFramework.pageLayout.components.paper.custom import CustomPaper
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
 from qtPrintFramework.pageLayout.components.orientation import Orientation
+from qtPrintFramework.pageLayout.components.orientationValue import OrientationValue
+from qtPrintFramework.printer.printerAdaptorSnapshot import PrinterAdaptorSnapshot
+from qtPrintFramework.versioned import Versioned
 from qtPrintFramework.alertLog import alertLog
 
 
 
-class PrinterAdaptor(QPrinter):
+class PrinterAdaptor(QPrinter, Versioned):
   '''
   A thin wrapper around QPrinter:
   - hides Qt's native/nonnative printer distinction
@@ -31,11 +35,109 @@ class PrinterAdaptor(QPrinter):
   - know user's choice of file (for paperless print)
   - emit signals when user accepts/cancels
   - emit signals when user chooses a different paper
+  
+  Page state (paper, orientation, sizes) is read from Qt into an immutable snapshot, see snapshot().
+  Versioned: touched whenever the snapshot is invalidated (page state may have changed.)
   '''
   
   
   def __init__(self, parentWidget):
     super(PrinterAdaptor, self).__init__()
+    self._snapshot = None
+    self.touch()
+    # Count of page state calls to Qt (setters, and queries taking snapshot), for measuring propagation
+    self.qtCallCount = 0
+    
+    
+  '''
+  Snapshot of page state.
+  
+  Retaken on first use after invalidation.
+  Invalidated by the QPrinter setters overridden below, when called from Python.
+  
+  !!! A native dialog changes the QPrinter in C++, not through these overrides.
+  After a native dialog (or anything else that may change the printer out of band) call invalidateSnapshot().
+  '''
+  def snapshot(self):
+    '''
+    PrinterAdaptorSnapshot of current page state.
+    '''
+    if self._snapshot is None:
+      self._snapshot = self._takeSnapshot()
+    return self._snapshot
+  
+  
+  def invalidateSnapshot(self):
+    self._snapshot = None
+    self.touch()
+    
+    
+  def _pageStateSet(self):
+    '''
+    A setter below was called: one Qt call, page state may have changed.
+    '''
+    self.invalidateSnapshot()
+    self.qtCallCount += 1
+    
+  def setPaperSize(self, *args):
+    super().setPaperSize(*args)
+    self._pageStateSet()
+  
+  def setPageSize(self, *args):
+    result = super().setPageSize(*args)
+    self._pageStateSet()
+    return result
+  
+  def setPageOrientation(self, *args):
+    result = super().setPageOrientation(*args)
+    self._pageStateSet()
+    return result
+  
+  def setOrientation(self, *args):
+    super().setOrientation(*args)
+    self._pageStateSet()
+  
+  def setPageLayout(self, *args):
+    result = super().setPageLayout(*args)
+    self._pageStateSet()
+    return result
+  
+  def setPageMargins(self, *args):
+    result = super().setPageMargins(*args)
+    self._pageStateSet()
+    return result
+  
+  def setFullPage(self, *args):
+    super().setFullPage(*args)
+    self._pageStateSet()
+  
+  def setOutputFormat(self, *args):
+    super().setOutputFormat(*args)
+    self._pageStateSet()
+  
+  def setPrinterName(self, *args):
+    super().setPrinterName(*args)
+    self._pageStateSet()
+  
+  
+  # Queries of QPrinter by _takeSnapshot()
+  snapshotQtCallCount = 4
+  
+  def _takeSnapshot(self):
+    '''
+    Read page state from Qt.  The only place that queries QPrinter for it.
+    '''
+    self.qtCallCount += PrinterAdaptor.snapshotQtCallCount
+    floatPaperDimensionsMM = self.paperSize(QPrinter.Millimeter)
+    orientationValue = self._qtOrientationValue()
+    printableRect = self.pageRect(QPrinter.Inch)
+    qtPaperEnum = self.paperSize()
+    return PrinterAdaptorSnapshot(qtPaperEnum=qtPaperEnum,
+                                  paperValue=self._matchedPaperValue(floatPaperDimensionsMM, orientationValue.value, qtPaperEnum),
+                                  paperSizeMM=(floatPaperDimensionsMM.width(), floatPaperDimensionsMM.height()),
+                                  orientationValue=orientationValue,
+                                  printableRectInch=(printableRect.x(), printableRect.y(),
+                                                     printableRect.width(), printableRect.height()))
     
     
     
@@ -80,7 +182,7 @@ class PrinterAdaptor(QPrinter):
     # self.paperSize() calls QPrinter.paperSize(), wrong in Qt < 5.3 returns Custom when it shouldn't
     terms = ( "Name:" + self.printerName(),
               "isNative:"+ str(self.isAdaptingNative()),
-              "Qt paper enum:"+ str(self.paperSize()),
+              "Qt paper enum:"+ str(self.snapshot().qtPaperEnum),
               # "qtPFramework setup:"+ str(self.printConverser.pageSetup),
               # "printable rect:"+ str(self.printablePageRect()),
               "paper size MM:"+ str(self.paperSizeMM),
@@ -105,58 +207,95 @@ class PrinterAdaptor(QPrinter):
     '''
     New Paper instance representing user's choice of paper.
     
+    A QObject view on paperValue().  Callers that only need the value should call paperValue(), which is cheaper.
+    '''
+    paperValue = self.paperValue()
+    if paperValue.isStandard:
+      result = StandardPaper(paperValue)
+    else:
+      result = CustomPaper(QSize(*paperValue.integralDefinedSizeMM), orientation=QPageLayout.Portrait)
+    assert isinstance(result, (StandardPaper, CustomPaper))
+    return result
+  
+  
+  def paperValue(self):
+    '''
+    PaperValue (immutable, interned if standard) representing user's choice of paper.
+    From snapshot.
+    
     !!! Ameliorates a bug in Qt, whereby a QPrinter.paperSize() returns value that does not match dimensions i.e. paperSize(Millimeter).
     e.g. paperSize() returns Custom, paperSize(Millimeter) dimensions of Letter when in fact user chose 'Letter'
     
     Also, returns a more capable object than QPrinter.paperSize(), which is only an enum value (a feeble subclass of int.)
     '''
-    
+    return self.snapshot().paperValue
+  
+  
+  def _matchedPaperValue(self, floatPaperDimensionsMM, orientationEnum, qtPaperEnum):
     '''
     fix Qt bug.
-    Create a Paper object by calling class method of Paper that returns proper enum that matches my floating page dimensions
+    Get proper enum by class method of Paper that matches my floating page dimensions
     Using a dialog on QPrinter returns paperSize that is floating but not stable across platforms and doesn't compare exactly to integral Paper
+    
+    But trust Qt's enum when its definition agrees with the dimensions:
+    it distinguishes papers of equal size (e.g. A4Small from A4), which a match by dimensions cannot.
     '''
+    if qtPaperEnum != QPagedPaintDevice.Custom \
+        and Paper.isEnumEpsilonEqualToSize(qtPaperEnum, floatPaperDimensionsMM, orientationEnum):
+      return PaperValue.standard(qtPaperEnum)
     
     # !!! Not call deprecated self.pageSize(), it is in error also.
     # The overloaded paperSize(MM) returns an epsilon correct (except for floating precision) correct result
-    floatPaperDimensionsMM = self.paperSizeMM
-    correctPaperEnum = Paper.enumForPageSizeByMatchDimensions(floatPaperDimensionsMM, self.orientation().value)
+    correctPaperEnum = Paper.enumForPageSizeByMatchDimensions(floatPaperDimensionsMM, orientationEnum)
     if correctPaperEnum is None:
       # self's paperSize(Millimeter) doesn't match any StandardPaper therefore self.paperSize() should be Custom
-      assert self.paperSize() == QPagedPaintDevice.Custom
+      assert qtPaperEnum == QPagedPaintDevice.Custom  # From the snapshot: no query of Qt
       size = OrientedSize.roundedSize(floatPaperDimensionsMM)
       if size is None:
         # Rounding failed: Qt passed a long
         # TODO Better to set to some non-zero default, or to emulate Qt's large size?
         alertLog("Rounding failed, setting CustomPaper to default size.")
-        result = CustomPaper(CustomPaper.defaultSize(), orientation=self.paperOrientation)
+        result = PaperValue.custom(PaperValue.defaultCustomSizeMM)
       else:
-        result = CustomPaper(integralOrientedSizeMM=size, orientation=self.paperOrientation)
+        result = PaperValue.customFromOrientedSize((size.width(), size.height()), orientationEnum)
     else:
-      result = StandardPaper(correctPaperEnum)  
-    assert isinstance(result, (StandardPaper, CustomPaper))
+      result = PaperValue.standard(correctPaperEnum)
     '''
-    !!! result.paperEnum might not agree with self.paperSize() because of the Qt bug.
+    !!! result.value might not agree with self.paperSize() because of the Qt bug.
     '''
     return result
   
   
   def orientation(self):
     '''
-    Orientation from self, a printer.
+    New Orientation instance from self, a printer.
     
     Obscures QPrinter.orientation()
+    A QObject view on orientationValue().  Callers that only need the value should call orientationValue(), which is cheaper.
     '''
+    result = Orientation(self.orientationValue())
+    assert isinstance(result, Orientation)  # Not an int, a full-fledged object
+    return result
+  
+  
+  def orientationValue(self):
+    '''
+    OrientationValue (immutable, interned) from self, a printer.
+    From snapshot.
+    '''
+    return self.snapshot().orientationValue
+  
+  
+  def _qtOrientationValue(self):
     printerOrientation = super().orientation()  # Call QPrinter.orientation
     '''
     !!! convert from QPrinter.Orientation enum to QPageLayout.Orientation enum
     They have the same int values but PyQt checks types later.
     '''
     if printerOrientation == QPrinter.Portrait:
-      result = Orientation(QPageLayout.Portrait)
+      result = OrientationValue.forEnum(QPageLayout.Portrait)
     else:
-      result = Orientation(QPageLayout.Landscape)
-    assert isinstance(result, Orientation)  # Not an int, a full-fledged object
+      result = OrientationValue.forEnum(QPageLayout.Landscape)
     return result
   
   
@@ -176,7 +315,9 @@ class PrinterAdaptor(QPrinter):
     or in some cases, a default size (this framework punts.)
     Qt may be punting in other situations.
     '''
-    result = self.pageRect(QPrinter.Inch).size()  # Delegate to QPrinter
+    # WAS self.pageRect(QPrinter.Inch).size(), now from snapshot
+    _, _, width, height = self.snapshot().printableRectInch
+    result = QSizeF(width, height)
     assert isinstance(result, QSizeF)
     # !!! not ensuring it isValid() and not isEmpty()
     return result
@@ -186,9 +327,9 @@ class PrinterAdaptor(QPrinter):
     '''
     QSizeF of oriented paper (usually larger than printablePageRect.)
     Units mm.
-    Implementation: call an overloaded QPrinter method.
+    From snapshot (WAS call overloaded QPrinter.paperSize(Millimeter) each time.)
     '''
-    return self.paperSize(QPrinter.Millimeter)
+    return QSizeF(*self.snapshot().paperSizeMM)
     
     
   def ensureReadyForNativeDialog(self):
@@ -0,0 +1,118 @@
+
+from collections import OrderedDict
+
+from PyQt5.QtPrintSupport import QPrinter
+
+from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+from qtPrintFramework.printer.printerBackend import printerBackend
+from qtPrintFramework.alertLog import debugLog
+
+
+
+class PrinterAdaptorPool(object):
+  '''
+  Pool of PrinterAdaptor (each a QPrinter), keyed by (printerName, outputFormat).
+
+  Conversers borrow() and giveBack().
+  A borrowed PrinterAdaptor belongs to its borrower alone: it is never lent twice.
+  A returned (idle) PrinterAdaptor keeps whatever state its driver set up (and its snapshot.)
+  So switching back to a recent printer reuses a warm, already configured QPrinter,
+  instead of mutating one QPrinter back and forth between printers.
+
+  At most maxSize idle PrinterAdaptors, one per key; the least recently returned is evicted (and destroyed.)
+
+  Not thread safe: use from the GUI thread, as for any QPrinter.
+  '''
+
+  defaultMaxSize = 4
+
+
+  def __init__(self, maxSize=None):
+    if maxSize is None:
+      maxSize = PrinterAdaptorPool.defaultMaxSize
+    assert maxSize >= 0
+    self.maxSize = maxSize
+    self._idle = OrderedDict()  # key -> PrinterAdaptor, least recently returned first
+    # For measuring
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+
+  def __len__(self):
+    ''' Count of idle PrinterAdaptors. '''
+    return len(self._idle)
+
+
+  @classmethod
+  def keyOf(cls, printerAdaptor):
+    '''
+    Key of the printer that printerAdaptor currently adapts.
+    (A native dialog may have switched it to another printer while borrowed.)
+    '''
+    return (printerAdaptor.printerName(), int(printerAdaptor.outputFormat()))
+
+
+  @classmethod
+  def keyFor(cls, printerName, outputFormat):
+    '''
+    Key of a PrinterAdaptor borrowed for printerName (None means: system default printer) and outputFormat.
+    
+    Empty printerName means: no native printer, and Qt then prints to file (PDF) whatever format was asked.
+    '''
+    if printerName is None:
+      printerName = printerBackend().defaultPrinterName()
+    if not printerName:
+      outputFormat = QPrinter.PdfFormat
+    return (printerName, int(outputFormat))
+
+
+  def borrow(self, printerName=None, outputFormat=QPrinter.NativeFormat, parentWidget=None):
+    '''
+    PrinterAdaptor adapting printerName (None means: system default printer) in outputFormat.
+    An idle one if any, else new.
+    '''
+    key = PrinterAdaptorPool.keyFor(printerName, outputFormat)
+    try:
+      result = self._idle.pop(key)
+      self.hits += 1
+    except KeyError:
+      result = self._newPrinterAdaptor(*key, parentWidget=parentWidget)
+      self.misses += 1
+    return result
+
+
+  def giveBack(self, printerAdaptor):
+    '''
+    Borrower is done with printerAdaptor.  Caller must not use it again.
+    '''
+    assert isinstance(printerAdaptor, PrinterAdaptor)
+    key = PrinterAdaptorPool.keyOf(printerAdaptor)
+    # At most one idle per key: a previously returned one is older, drop it.
+    self._idle.pop(key, None)
+    self._idle[key] = printerAdaptor
+    while len(self._idle) > self.maxSize:
+      evictedKey, _ = self._idle.popitem(last=False)
+      self.evictions += 1
+      debugLog("PrinterAdaptorPool evicts " + str(evictedKey))
+
+
+  def clear(self):
+    '''
+    Drop all idle PrinterAdaptors, e.g. when the system's set of printers changed.
+    '''
+    self._idle.clear()
+
+
+  def _newPrinterAdaptor(self, printerName, outputFormat, parentWidget):
+    result = printerBackend().newPrinterAdaptor(parentWidget=parentWidget)
+    if outputFormat != result.outputFormat():
+      result.setOutputFormat(outputFormat)
+    # Format first: setting a format resets the printer name.  Empty name means: to file.
+    if printerName and printerName != result.printerName():
+      result.setPrinterName(printerName)
+    return result
+
+
+
+printerAdaptorPool = PrinterAdaptorPool()  # singleton
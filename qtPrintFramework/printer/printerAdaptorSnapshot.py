@@ -0,0 +1,48 @@
+
+
+class PrinterAdaptorSnapshot(object):
+  '''
+  Immutable record of a PrinterAdaptor's page state, as read from Qt at one time.
+
+  - qtPaperEnum: QPrinter.paperSize(), as Qt reports it (may be wrong, see PrinterAdaptor.paperValue())
+  - paperValue: PaperValue, corrected by matching dimensions
+  - paperSizeMM: tuple (width, height), oriented, floating mm, QPrinter.paperSize(Millimeter)
+  - orientationValue: OrientationValue
+  - printableRectInch: tuple (x, y, width, height), floating inch, QPrinter.pageRect(Inch)
+
+  Plain Python values: comparing against a snapshot makes no Qt call and allocates no Qt object.
+  See PrinterAdaptor.snapshot() for when a snapshot is retaken.
+  '''
+
+  __slots__ = ('qtPaperEnum', 'paperValue', 'paperSizeMM', 'orientationValue', 'printableRectInch')
+
+  def __init__(self, qtPaperEnum, paperValue, paperSizeMM, orientationValue, printableRectInch):
+    setSlot = object.__setattr__
+    setSlot(self, 'qtPaperEnum', qtPaperEnum)
+    setSlot(self, 'paperValue', paperValue)
+    setSlot(self, 'paperSizeMM', paperSizeMM)
+    setSlot(self, 'orientationValue', orientationValue)
+    setSlot(self, 'printableRectInch', printableRectInch)
+
+  def __setattr__(self, name, value):
+    raise AttributeError("PrinterAdaptorSnapshot is immutable")
+
+  def hasPaper(self, paperValue):
+    '''
+    Whether printer has paper of paperValue.
+    
+    Custom: printer's paper is Custom of same integral size,
+    or the standard paper that Qt makes of it (see PaperValue.qtPageSizeId().)
+    Standard: both corrected paperValue and Qt's enum are the same (setting paper again fixes Qt's enum, see Qt bug.)
+    '''
+    if paperValue.isCustom and self.paperValue.isCustom:
+      result = self.paperValue.integralDefinedSizeMM == paperValue.integralDefinedSizeMM
+    else:
+      pageSizeId = paperValue.qtPageSizeId()
+      result = pageSizeId == self.paperValue.value and pageSizeId == self.qtPaperEnum
+    return result
+
+  def __repr__(self):
+    return "PrinterAdaptorSnapshot({}, {}, {:.1f}x{:.1f}mm)".format(self.paperValue.name,
+                                                                   self.orientationValue.name,
+                                                                   *self.paperSizeMM)
@@ -0,0 +1,89 @@
+
+from PyQt5.QtPrintSupport import QPrinterInfo
+
+
+
+class PrinterBackend(object):
+  '''
+  Where printers come from: discovery, capabilities, and the QPrinter that adapts one.
+
+  ABC.  Implemented by:
+  - QtPrinterBackend: the system's print system, via QPrinterInfo and QPrinter (the default)
+  - StandInPrinterBackend: scripted printers, in process, for benchmarks and machines without a print system
+
+  A printer info is an object with the API of QPrinterInfo that this framework uses:
+  printerName(), isNull(), makeAndModel(), description(), location(), isRemote(),
+  supportedPaperSizes(), supportsCustomPageSizes(), supportedResolutions(), defaultPageSize()
+
+  Users (PrinterSet, PrinterCapabilityCache, PrinterAdaptorPool) get the current backend when they need it,
+  see printerBackend().
+  '''
+
+  def availablePrinters(self):
+    ''' Sequence of printer infos.  Slow, from any thread. '''
+    raise NotImplementedError('Deferred')
+
+  def defaultPrinterName(self):
+    raise NotImplementedError('Deferred')
+
+  def printerInfo(self, printerName):
+    ''' Printer info for printerName, isNull() if no such printer. '''
+    raise NotImplementedError('Deferred')
+
+  def printerInfoForPrinter(self, printer):
+    ''' Printer info for the printer a QPrinter (e.g. a PrinterAdaptor) adapts. '''
+    raise NotImplementedError('Deferred')
+
+  def newPrinterAdaptor(self, parentWidget=None):
+    ''' New PrinterAdaptor, adapting the default printer. '''
+    raise NotImplementedError('Deferred')
+
+
+
+class QtPrinterBackend(PrinterBackend):
+  '''
+  The system's print system (CUPS, Windows spooler, OSX), via Qt.
+  '''
+
+  def availablePrinters(self):
+    return tuple(QPrinterInfo.availablePrinters())
+
+  def defaultPrinterName(self):
+    return QPrinterInfo.defaultPrinterName()
+
+  def printerInfo(self, printerName):
+    return QPrinterInfo.printerInfo(printerName)
+
+  def printerInfoForPrinter(self, printer):
+    return QPrinterInfo(printer)
+
+  def newPrinterAdaptor(self, parentWidget=None):
+    # Import at use: printerAdaptor imports much of the framework
+    from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+    return PrinterAdaptor(parentWidget=parentWidget)
+
+
+
+_printerBackend = None
+
+
+def printerBackend():
+  '''
+  The current PrinterBackend, default QtPrinterBackend (created on first use.)
+  '''
+  global _printerBackend
+  if _printerBackend is None:
+    _printerBackend = QtPrinterBackend()
+  return _printerBackend
+
+
+def setPrinterBackend(backend):
+  '''
+  Make backend current.  None restores the default.
+
+  Call before using printers: state already derived from the former backend
+  (a PrinterSet snapshot, cached capabilities, pooled PrinterAdaptors) is not discarded here.
+  '''
+  global _printerBackend
+  assert backend is None or isinstance(backend, PrinterBackend)
+  _printerBackend = backend
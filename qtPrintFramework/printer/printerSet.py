@@ -1,38 +1,99 @@
 
-from PyQt5.QtPrintSupport import QPrinterInfo
+from itertools import count
+import threading
+import time
 
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+from qtPrintFramework.printer.printerBackend import printerBackend
 
 
-class PrinterSet(object):
+
+class PrinterSet(QObject):
   '''
   Set of printers on user's system.
-  
-  Wrapper on QPrinterInfo
+
+  Wrapper on QPrinterInfo (or rather, the current printer backend), with a cache.
+
+  Querying the system (CUPS etc.) can block for a long time when there are many print queues.
+  So the printer list is a snapshot, at most timeToLive seconds old when fresh:
+  - the first call queries synchronously (there is nothing to return yet)
+  - later calls return the last snapshot immediately
+  - a call on a stale snapshot starts a refresh on a worker thread, and still returns the (stale) snapshot
+
+  Emits printersChanged (in the thread of this object, i.e. the GUI thread, when its event loop runs)
+  when a refresh finds a different set of printer names.
+
+  Refreshes (synchronous, and on the worker) can overlap.  Each has a generation, in order of start:
+  a result older than the snapshot (or than invalidate()) is dropped, so a slow query never overwrites a newer one.
   '''
-  
+
+  printersChanged = pyqtSignal()
+
+  # Internal: worker thread to thread of self
+  _refreshed = pyqtSignal(bool)
+
+  defaultTimeToLive = 30.0  # seconds
+
+
+  def __init__(self, timeToLive=None):
+    super(PrinterSet, self).__init__()
+    if timeToLive is None:
+      timeToLive = PrinterSet.defaultTimeToLive
+    self.timeToLive = timeToLive
+
+    self._lock = threading.Lock()
+    self._snapshot = None     # tuple of QPrinterInfo, None until first query
+    self._snapshotTime = None # time.monotonic() of query
+    self._refreshThread = None
+    self._generations = count(1)  # of refreshes, in order of start
+    self._snapshotGeneration = 0  # of refresh whose result is the snapshot (or of invalidate())
+
+    # Queued: emit printersChanged in thread of self, not in worker thread
+    self._refreshed.connect(self._onRefreshed, Qt.QueuedConnection)
+
+
   def isPhysicalPrinterConfigured(self):
     '''
     AKA is printer installed.
-    
+
     This does NOT return True if the OS would only allow printing to a file.
     The print dialog should still open in that case on most platforms.
-    
+
     But a bug in Qt refuses to open the native print dialog on OSX in that case.
     So typical use of this method:
     if it returns false and platform is OSX, disable print action that would open a Print dialog
     (or to give a message 'Please configure a physical printer.')
     so the user doesn't see the Qt bug.
+
+    From the snapshot, see availablePrinters().
     '''
     # not available until Qt5.3
     # printerNames = QPrinterInfo.availablePrinterNames()
-    
+
     return len(self.availablePrinters()) > 0
-    
-    
+
+
   def availablePrinters(self):
-    return QPrinterInfo.availablePrinters()
-  
-    
+    '''
+    list of QPrinterInfo, from the last snapshot.
+
+    Blocks only on first call (or after invalidate().)
+    '''
+    with self._lock:
+      snapshot = self._snapshot
+      isStale = snapshot is not None and self._isStale()
+    if snapshot is None:
+      snapshot = self.refresh(wait=True)
+    elif isStale:
+      self.refresh(wait=False)
+    return list(snapshot)
+
+
+  def availablePrinterNames(self):
+    ''' list of names of printers, from the last snapshot. '''
+    return [printerInfo.printerName() for printerInfo in self.availablePrinters()]
+
+
   def dumpAvailablePrinters(self):
     printerList = self.availablePrinters()
     print("Available printers:")
@@ -40,4 +101,91 @@ class PrinterSet(object):
       print(printerInfo.printerName())
 
 
+  '''
+  Cache control
+  '''
+  def refresh(self, wait=False):
+    '''
+    Query the system for printers.
+
+    If wait, query in the calling thread and return the new snapshot.
+    Else query on a worker thread (unless one is already running) and return None.
+    '''
+    with self._lock:
+      generation = next(self._generations)
+      if not wait:
+        if self._refreshThread is not None:
+          return None
+        self._refreshThread = threading.Thread(target=self._refreshNow, args=(generation, ), name="PrinterSet refresh")
+        self._refreshThread.daemon = True  # Do not delay exit of app
+        thread = self._refreshThread
+    if wait:
+      return self._refreshNow(generation)
+    thread.start()
+    return None
+
+
+  def invalidate(self):
+    '''
+    Forget snapshot: next availablePrinters() queries synchronously.
+    E.g. when app knows the user just installed a printer.
+    '''
+    with self._lock:
+      self._snapshot = None
+      self._snapshotTime = None
+      # Refreshes started before are stale
+      self._snapshotGeneration = next(self._generations)
+
+
+  def _isStale(self):
+    ''' Caller holds lock. '''
+    return time.monotonic() - self._snapshotTime > self.timeToLive
+
+
+  def _queryPrinters(self):
+    '''
+    tuple of QPrinterInfo: the system query.  Slow, from any thread.
+    '''
+    return tuple(printerBackend().availablePrinters())
+
+
+  def _refreshNow(self, generation):
+    '''
+    Query, replace snapshot (unless a newer refresh already did), signal if names differ.
+    Returns the snapshot.
+    '''
+    try:
+      printers = self._queryPrinters()
+      with self._lock:
+        isNewer = generation > self._snapshotGeneration
+        oldSnapshot = self._snapshot
+        if isNewer:
+          self._snapshot = printers
+          self._snapshotTime = time.monotonic()
+          self._snapshotGeneration = generation
+    finally:
+      with self._lock:
+        if self._refreshThread is threading.current_thread():
+          self._refreshThread = None
+
+    if not isNewer:
+      # Stale: dropped.  Unless there is no snapshot at all (invalidated since), then it is the best known.
+      return oldSnapshot if oldSnapshot is not None else printers
+    # First snapshot is not a change
+    isChanged = oldSnapshot is not None and self._namesOf(oldSnapshot) != self._namesOf(printers)
+    self._refreshed.emit(isChanged)
+    return printers
+
+
+  @classmethod
+  def _namesOf(cls, printers):
+    return frozenset(printerInfo.printerName() for printerInfo in printers)
+
+
+  def _onRefreshed(self, isChanged):
+    if isChanged:
+      self.printersChanged.emit()
+
+
+
 printerSet = PrinterSet()
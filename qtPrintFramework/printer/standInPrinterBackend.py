@@ -0,0 +1,205 @@
+
+from collections import OrderedDict
+import threading
+import time
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageSize
+from PyQt5.QtPrintSupport import QPrinter
+
+from qtPrintFramework.printer.printerBackend import PrinterBackend
+from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+
+
+
+def _delay(seconds):
+  if seconds:
+    time.sleep(seconds)
+
+
+
+class StandInPrinterInfo(object):
+  '''
+  A scripted printer, with the API of QPrinterInfo (see PrinterBackend.)
+
+  capabilityLatency: seconds a capability query (supportedPaperSizes()) takes, as a driver reading a PPD.
+  None means: the backend's.
+  '''
+
+  def __init__(self, backend, printerName, paperSizes, supportsCustomPageSizes, resolutions,
+               defaultPaperSize=QPagedPaintDevice.A4, makeAndModel="Stand-in", location="", isRemote=False,
+               capabilityLatency=None):
+    self.backend = backend
+    self._printerName = printerName
+    self._paperSizes = tuple(paperSizes)
+    self._supportsCustomPageSizes = supportsCustomPageSizes
+    self._resolutions = tuple(resolutions)
+    self._defaultPaperSize = defaultPaperSize
+    self._makeAndModel = makeAndModel
+    self._location = location
+    self._isRemote = isRemote
+    self.capabilityLatency = capabilityLatency
+
+  def __repr__(self):
+    return "StandInPrinterInfo({!r})".format(self._printerName)
+
+  def isNull(self):
+    return self._printerName == ""
+
+  def printerName(self):
+    return self._printerName
+
+  def makeAndModel(self):
+    return self._makeAndModel
+
+  def description(self):
+    return self._printerName
+
+  def location(self):
+    return self._location
+
+  def isRemote(self):
+    return self._isRemote
+
+  def supportedPaperSizes(self):
+    self.backend._countCapabilityQuery()
+    latency = self.capabilityLatency if self.capabilityLatency is not None else self.backend.capabilityLatency
+    _delay(latency)
+    return list(self._paperSizes)
+
+  def supportsCustomPageSizes(self):
+    return self._supportsCustomPageSizes
+
+  def supportedResolutions(self):
+    return list(self._resolutions)
+
+  def defaultPageSize(self):
+    return QPageSize(QPageSize.PageSizeId(self._defaultPaperSize))
+
+
+
+class StandInPrinterAdaptor(PrinterAdaptor):
+  '''
+  PrinterAdaptor on a scripted printer.
+
+  Underneath, a Qt PDF printer: needs no print system, and page state behaves as Qt's.
+  Printer name and output format are scripted (Qt would reset a PDF printer's name.)
+  Each Qt call (see PrinterAdaptor.qtCallCount) takes the backend's callLatency.
+  '''
+
+  def __init__(self, backend, parentWidget=None):
+    super(StandInPrinterAdaptor, self).__init__(parentWidget=parentWidget)
+    self.backend = backend
+    QPrinter.setOutputFormat(self, QPrinter.PdfFormat)  # Not counted: not a page state change of the stand-in
+    self._printerName = backend.defaultPrinterName()
+    self._outputFormat = QPrinter.NativeFormat
+
+  def printerName(self):
+    return self._printerName
+
+  def setPrinterName(self, printerName):
+    self._printerName = printerName
+    self._pageStateSet()
+
+  def outputFormat(self):
+    return self._outputFormat
+
+  def setOutputFormat(self, outputFormat):
+    self._outputFormat = outputFormat
+    self._pageStateSet()
+
+  def _pageStateSet(self):
+    _delay(self.backend.callLatency)
+    super(StandInPrinterAdaptor, self)._pageStateSet()
+
+  def _takeSnapshot(self):
+    _delay(self.backend.callLatency * PrinterAdaptor.snapshotQtCallCount)
+    return super(StandInPrinterAdaptor, self)._takeSnapshot()
+
+
+
+class StandInPrinterBackend(PrinterBackend):
+  '''
+  Scripted, in process printers: for benchmarks, and for machines without a print system (e.g. under the offscreen QPA.)
+
+  Script:
+  - printerCount printers named namePrefix + index, all with paperSizes etc., default printer is the first
+  - addPrinter(), removePrinter(), defaultName: change the set of printers (e.g. to test PrinterSet.printersChanged)
+  - latencies, in seconds, may be changed any time:
+    - discoveryLatency: per availablePrinters() (as a print system enumerating queues)
+    - capabilityLatency: per capability query, default for each printer (see StandInPrinterInfo)
+    - callLatency: per Qt call on a StandInPrinterAdaptor
+
+  Counts discoveries and capability queries (thread safe: the capability prober queries from worker threads.)
+  '''
+
+  defaultPaperSizes = (QPagedPaintDevice.A3, QPagedPaintDevice.A4, QPagedPaintDevice.A5,
+                       QPagedPaintDevice.B5, QPagedPaintDevice.Letter, QPagedPaintDevice.Legal,
+                       QPagedPaintDevice.Executive, QPagedPaintDevice.Tabloid, QPagedPaintDevice.Custom)
+
+
+  def __init__(self, printerCount=4, paperSizes=None, supportsCustomPageSizes=True, resolutions=(300, 600),
+               discoveryLatency=0.0, capabilityLatency=0.0, callLatency=0.0, namePrefix="Stand-in printer "):
+    if paperSizes is None:
+      paperSizes = StandInPrinterBackend.defaultPaperSizes
+    self.discoveryLatency = discoveryLatency
+    self.capabilityLatency = capabilityLatency
+    self.callLatency = callLatency
+
+    self._lock = threading.Lock()
+    self.discoveryCount = 0
+    self.capabilityQueryCount = 0
+
+    self._printers = OrderedDict()  # name to StandInPrinterInfo
+    for index in range(printerCount):
+      self.addPrinter(namePrefix + str(index), paperSizes=paperSizes,
+                      supportsCustomPageSizes=supportsCustomPageSizes, resolutions=resolutions)
+    self.defaultName = namePrefix + "0" if printerCount > 0 else ""
+
+
+  def addPrinter(self, printerName, paperSizes=None, supportsCustomPageSizes=True, resolutions=(300, 600), **kwargs):
+    '''
+    Add (or replace) a printer.  kwargs as for StandInPrinterInfo.
+    Returns its StandInPrinterInfo.
+    '''
+    if paperSizes is None:
+      paperSizes = StandInPrinterBackend.defaultPaperSizes
+    result = StandInPrinterInfo(self, printerName, paperSizes, supportsCustomPageSizes, resolutions, **kwargs)
+    with self._lock:
+      self._printers[printerName] = result
+    return result
+
+
+  def removePrinter(self, printerName):
+    with self._lock:
+      self._printers.pop(printerName, None)
+
+
+  def _countCapabilityQuery(self):
+    with self._lock:
+      self.capabilityQueryCount += 1
+
+
+  '''
+  Implement PrinterBackend
+  '''
+  def availablePrinters(self):
+    _delay(self.discoveryLatency)
+    with self._lock:
+      self.discoveryCount += 1
+      return tuple(self._printers.values())
+
+  def defaultPrinterName(self):
+    return self.defaultName
+
+  def printerInfo(self, printerName):
+    with self._lock:
+      result = self._printers.get(printerName)
+    if result is None:
+      result = StandInPrinterInfo(self, "", (), False, ())  # null, as QPrinterInfo for unknown name
+    return result
+
+  def printerInfoForPrinter(self, printer):
+    return self.printerInfo(printer.printerName())
+
+  def newPrinterAdaptor(self, parentWidget=None):
+    return StandInPrinterAdaptor(self, parentWidget=parentWidget)
@@ -0,0 +1,246 @@
+
+import atexit
+from collections import OrderedDict
+import os
+import sqlite3
+
+from PyQt5.QtCore import QCoreApplication, QStandardPaths
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.alertLog import alertLog, debugLog
+
+
+
+class DocumentLayoutStore(object):
+  '''
+  Page layouts of documents, by document id, persisted between sessions.
+
+  For apps where a page layout is an attribute of a document (see PageLayout),
+  but the document format has no place for it.
+  A document id is any string the app chooses, typically a document's path.
+
+  Persisted in a SQLite file (default in app's data location), one row per document,
+  the layout as a binary PageLayoutRecord.  Indexed by document id (the primary key.)
+
+  Fast on document open:
+  - an LRU cache of cacheSize recently used layouts (also remembers documents that have no layout)
+  - prefetch() and prefetchFolder() load many layouts in one query, e.g. when app lists a folder
+  Fast on change:
+  - put() is batched: written when batchSize puts are pending, on flush(), on app quit, and at interpreter exit.
+  get() sees pending puts.
+
+  Metrics: hits (from cache), misses (queried), puts, batchesWritten.
+
+  Not thread safe: use from one thread (the GUI thread.)
+  '''
+
+  fileName = "documentLayouts.sqlite"
+
+  defaultCacheSize = 1000
+  defaultBatchSize = 100
+
+  # SQLite limits count of parameters in a query
+  _queryChunkSize = 500
+
+
+  def __init__(self, path=None, cacheSize=None, batchSize=None):
+    self._path = path
+    self.cacheSize = cacheSize if cacheSize is not None else DocumentLayoutStore.defaultCacheSize
+    self.batchSize = batchSize if batchSize is not None else DocumentLayoutStore.defaultBatchSize
+    self._connection = None
+    self._isUnavailable = False  # file could not be opened: not retried
+    self._isFailing = False      # last write failed: alerted once, until a write succeeds
+    self._cache = OrderedDict()   # document id to PageLayoutRecord or None (no layout), least recently used first
+    self._pending = OrderedDict() # document id to PageLayoutRecord or None (remove), not yet written
+    self._isQuitConnected = False
+
+    self.hits = 0
+    self.misses = 0
+    self.puts = 0
+    self.batchesWritten = 0
+
+    atexit.register(self.flush)
+
+
+  @property
+  def path(self):
+    if self._path is None:
+      location = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+      self._path = os.path.join(location, "qtPrintFramework", DocumentLayoutStore.fileName)
+    return self._path
+
+
+  def get(self, documentId, default=None):
+    '''
+    PageLayoutRecord of document, or default if it has none.
+    '''
+    try:
+      result = self._cache[documentId]
+      self._cache.move_to_end(documentId)
+      self.hits += 1
+    except KeyError:
+      self.misses += 1
+      if documentId in self._pending:
+        result = self._pending[documentId]
+      else:
+        result = self._query((documentId, )).get(documentId)
+      self._remember(documentId, result)
+    return result if result is not None else default
+
+
+  def put(self, documentId, record):
+    '''
+    Set layout of document.  Written later, in a batch.
+    '''
+    assert isinstance(record, PageLayoutRecord)
+    self.puts += 1
+    self._remember(documentId, record)
+    self._pend(documentId, record)
+
+
+  def remove(self, documentId):
+    self._remember(documentId, None)
+    self._pend(documentId, None)
+
+
+  def prefetch(self, documentIds):
+    '''
+    Load layouts of many documents into cache, in few queries.
+    Documents already cached are not queried.
+    '''
+    documentIds = [documentId for documentId in documentIds
+                   if documentId not in self._cache and documentId not in self._pending]
+    found = self._query(documentIds)
+    for documentId in documentIds:
+      self._remember(documentId, found.get(documentId))
+
+
+  def prefetchFolder(self, folderPath):
+    '''
+    Load into cache the layouts of documents whose id is a path in folderPath (or its subfolders.)
+    One range scan of the index.
+    '''
+    prefix = os.path.join(folderPath, "")
+    # Ids starting with prefix sort below prefix with its last character incremented (whatever their characters.)
+    # prefix ends in a separator, not the last code point.
+    upperBound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    connection = self._openConnection()
+    if connection is None:
+      return
+    rows = connection.execute("SELECT documentId, record FROM documentLayout WHERE documentId >= ? AND documentId < ?",
+                              (prefix, upperBound)).fetchall()
+    for documentId, data in rows:
+      if documentId not in self._pending:
+        self._remember(documentId, self._decoded(data))
+
+
+  def flush(self):
+    '''
+    Write pending puts, in one transaction.
+    If writing fails, they stay pending (alerted once, until a write succeeds), so a flush at quit does not raise.
+    '''
+    if not self._pending:
+      return
+    connection = self._openConnection()
+    if connection is None:
+      self._pending.clear()
+      return
+    pending = self._pending
+    self._pending = OrderedDict()
+    try:
+      with connection:
+        connection.executemany("INSERT OR REPLACE INTO documentLayout (documentId, record) VALUES (?, ?)",
+                               [(documentId, record.encode()) for documentId, record in pending.items() if record is not None])
+        connection.executemany("DELETE FROM documentLayout WHERE documentId = ?",
+                               [(documentId, ) for documentId, record in pending.items() if record is None])
+    except sqlite3.Error:
+      # E.g. database locked (by another instance of app) or disk full.  Transaction was rolled back: retry on next flush.
+      # Puts made since are newer: they win.
+      pending.update(self._pending)
+      self._pending = pending
+      if not self._isFailing:
+        self._isFailing = True
+        alertLog("Failed to write document page layouts.")
+      return
+    self._isFailing = False
+    self.batchesWritten += 1
+    debugLog("Document layouts written: " + str(len(pending)))
+
+
+  def close(self):
+    self.flush()
+    if self._connection is not None:
+      self._connection.close()
+      self._connection = None
+
+
+  def _remember(self, documentId, record):
+    ''' Put in LRU cache, evict least recently used. '''
+    self._cache[documentId] = record
+    self._cache.move_to_end(documentId)
+    while len(self._cache) > self.cacheSize:
+      self._cache.popitem(last=False)
+
+
+  def _pend(self, documentId, record):
+    self._pending[documentId] = record
+    self._connectQuit()
+    if len(self._pending) >= self.batchSize:
+      self.flush()
+
+
+  def _query(self, documentIds):
+    ''' dictionary of document id to PageLayoutRecord, for those of documentIds that have one. '''
+    result = {}
+    connection = self._openConnection()
+    if connection is None or not documentIds:
+      return result
+    documentIds = list(documentIds)
+    for start in range(0, len(documentIds), DocumentLayoutStore._queryChunkSize):
+      chunk = documentIds[start:start + DocumentLayoutStore._queryChunkSize]
+      query = "SELECT documentId, record FROM documentLayout WHERE documentId IN ({})".format(",".join("?" * len(chunk)))
+      for documentId, data in connection.execute(query, chunk):
+        result[documentId] = self._decoded(data)
+    return result
+
+
+  def _decoded(self, data):
+    try:
+      return PageLayoutRecord.decode(data)
+    except ValueError:
+      alertLog("Unreadable document page layout.")
+      return None
+
+
+  def _openConnection(self):
+    '''
+    Connection, opened (and schema created) on first use, or None if the file cannot be opened.
+    Without a file, the store still works for this session (cache only.)
+    '''
+    if self._connection is None and not self._isUnavailable:
+      try:
+        directory = os.path.dirname(self.path)
+        if directory:
+          os.makedirs(directory, exist_ok=True)
+        connection = sqlite3.connect(self.path)
+        with connection:
+          connection.execute("CREATE TABLE IF NOT EXISTS documentLayout (documentId TEXT PRIMARY KEY, record BLOB NOT NULL) WITHOUT ROWID")
+        self._connection = connection
+      except (OSError, sqlite3.Error):
+        self._isUnavailable = True
+        alertLog("Failed to open document page layout store.")
+    return self._connection
+
+
+  def _connectQuit(self):
+    ''' Flush when app quits.  Connected on first put after QCoreApplication exists. '''
+    if self._isQuitConnected:
+      return
+    app = QCoreApplication.instance()
+    if app is not None:
+      app.aboutToQuit.connect(self.flush)
+      self._isQuitConnected = True
+
+
+
+documentLayoutStore = DocumentLayoutStore()  # singleton
@@ -0,0 +1,195 @@
+
+import base64
+import json
+import os
+import threading
+
+from PyQt5.QtCore import QByteArray, QSettings, QStandardPaths
+
+from qtPrintFramework.alertLog import alertLog
+
+
+
+class SettingsBackend(object):
+  '''
+  Where settings persist.
+
+  ABC.  Implemented by:
+  - QSettingsBackend: QSettings of the app's organization and name (the default)
+  - MemorySettingsBackend: a dictionary, for tests and for measuring
+  - JSONSettingsBackend: a JSON file per profile
+
+  Settings are keys in groups.  Values are int, float, str, bool, or bytes.
+  A group is read, or written, in one operation.
+
+  Users (Settingsable via SettingsWriter, and other stores) get the current backend when they need it,
+  see settingsBackend().
+
+  Thread safe: SettingsWriter writes from a worker thread.
+  '''
+
+  def read(self, group):
+    ''' Dictionary of key to value, of all keys in group. '''
+    raise NotImplementedError('Deferred')
+
+  def write(self, group, values):
+    ''' Set values (dictionary of key to value) of keys in group, and persist. '''
+    raise NotImplementedError('Deferred')
+
+
+
+class QSettingsBackend(SettingsBackend):
+  '''
+  QSettings, as established on app startup:
+  QCoreApplication.setOrganizationName() etc.
+
+  !!! QSettings of PyQt reads an ini file's values as str: caller converts.
+  '''
+
+  def read(self, group):
+    qsettings = QSettings()
+    qsettings.beginGroup(group)
+    result = {key : self._fromQt(qsettings.value(key)) for key in qsettings.childKeys()}
+    qsettings.endGroup()
+    return result
+
+  def write(self, group, values):
+    qsettings = QSettings()
+    qsettings.beginGroup(group)
+    for key, value in values.items():
+      qsettings.setValue(key, self._toQt(value))
+    qsettings.endGroup()
+    qsettings.sync()
+
+  def _toQt(self, value):
+    # QSettings would store Python bytes as a pickled PyQt object
+    return QByteArray(value) if isinstance(value, bytes) else value
+
+  def _fromQt(self, value):
+    return bytes(value) if isinstance(value, QByteArray) else value
+
+
+
+class MemorySettingsBackend(SettingsBackend):
+  '''
+  Settings in a dictionary, not persisted: for tests, and to measure persistence cost apart from storage.
+  '''
+
+  def __init__(self, groups=None):
+    '''
+    groups: initial dictionary of group to dictionary of key to value
+    '''
+    self._lock = threading.Lock()
+    self._groups = {group : dict(values) for group, values in (groups or {}).items()}
+
+  def read(self, group):
+    with self._lock:
+      return dict(self._groups.get(group, {}))
+
+  def write(self, group, values):
+    with self._lock:
+      self._groups.setdefault(group, {}).update(values)
+
+
+
+class JSONSettingsBackend(SettingsBackend):
+  '''
+  Settings in a JSON file per profile (e.g. per user of a shared machine, or per workspace.)
+
+  Default file: <app's config location>/qtPrintFramework/profiles/<profile>.json
+  Loaded on first use; each write rewrites the file (atomically, by replace.)
+  A file that cannot be read is treated as empty.
+  bytes are stored as base64.
+  '''
+
+  defaultProfile = "default"
+
+
+  def __init__(self, profile=None, path=None):
+    self.profile = profile if profile is not None else JSONSettingsBackend.defaultProfile
+    self._path = path
+    self._lock = threading.Lock()
+    self._groups = None   # None until loaded
+
+
+  @property
+  def path(self):
+    if self._path is None:
+      location = QStandardPaths.writableLocation(QStandardPaths.AppConfigLocation)
+      self._path = os.path.join(location, "qtPrintFramework", "profiles", self.profile + ".json")
+    return self._path
+
+
+  def read(self, group):
+    with self._lock:
+      return dict(self._loadedGroups().get(group, {}))
+
+  def write(self, group, values):
+    with self._lock:
+      self._loadedGroups().setdefault(group, {}).update(values)
+      self._save()
+
+
+  def _loadedGroups(self):
+    ''' Caller holds lock. '''
+    if self._groups is None:
+      try:
+        with open(self.path, 'r') as file:
+          document = json.load(file)
+        self._groups = {group : {key : self._fromJSON(value) for key, value in values.items()}
+                        for group, values in document.items()}
+      except (OSError, ValueError, KeyError, AttributeError, TypeError):
+        # Absent (first use) or unreadable
+        self._groups = {}
+    return self._groups
+
+
+  def _save(self):
+    ''' Caller holds lock. '''
+    document = {group : {key : self._toJSON(value) for key, value in values.items()}
+                for group, values in self._groups.items()}
+    temporaryPath = self.path + ".tmp"
+    try:
+      directory = os.path.dirname(self.path)
+      if directory:
+        os.makedirs(directory, exist_ok=True)
+      with open(temporaryPath, 'w') as file:
+        json.dump(document, file)
+      os.replace(temporaryPath, self.path)
+    except OSError:
+      alertLog("Failed to save settings profile.")
+
+
+  def _toJSON(self, value):
+    if isinstance(value, bytes):
+      return {"bytes" : base64.b64encode(value).decode('ascii')}
+    return value
+
+  def _fromJSON(self, value):
+    if isinstance(value, dict):
+      return base64.b64decode(value["bytes"])
+    return value
+
+
+
+_settingsBackend = None
+
+
+def settingsBackend():
+  '''
+  The current SettingsBackend, default QSettingsBackend (created on first use.)
+  '''
+  global _settingsBackend
+  if _settingsBackend is None:
+    _settingsBackend = QSettingsBackend()
+  return _settingsBackend
+
+
+def setSettingsBackend(backend):
+  '''
+  Make backend current.  None restores the default.
+  Pending writes (see SettingsWriter) go to the backend current when they are flushed: flush first.
+  '''
+  global _settingsBackend
+  assert backend is None or isinstance(backend, SettingsBackend)
+  _settingsBackend = backend
@@ -0,0 +1,181 @@
+
+import atexit
+import threading
+import time
+
+from PyQt5.QtCore import QCoreApplication
+
+from qtPrintFramework.settings.settingsBackend import settingsBackend
+from qtPrintFramework.alertLog import alertLog, debugLog
+
+
+
+class SettingsWriter(object):
+  '''
+  Write-behind, coalescing writer of settings.
+
+  write() only records values (latest value of a key wins) and returns.
+  Values recorded within coalesceWindow seconds of the first pending one
+  are written together, one write per group to the current SettingsBackend, on a worker thread.
+  So a burst of changes (e.g. user dragging through a combo box) is one write, not one per change.
+
+  Final flush: on QCoreApplication.aboutToQuit, and at interpreter exit.
+  Readers of the same settings call flush() first (see Settingsable.fromSettings()),
+  so they never read values older than those written.
+
+  A coalesceWindow of zero means: write synchronously, in write().
+
+  Metrics: writesRequested (calls to write()) versus writesPerformed (flushes that wrote the backend.)
+
+  A write that fails (e.g. disk full) is not lost: its values stay pending (newer values win)
+  and are retried after another coalesceWindow (or on the next flush()); the failure is alerted once, until a write succeeds.
+
+  Thread safe.  (So are settings backends, e.g. QSettings is reentrant: a QSettings per write, in whatever thread.)
+  '''
+
+  defaultCoalesceWindow = 0.5  # seconds
+
+
+  def __init__(self, coalesceWindow=None):
+    if coalesceWindow is None:
+      coalesceWindow = SettingsWriter.defaultCoalesceWindow
+    assert coalesceWindow >= 0
+    self.coalesceWindow = coalesceWindow
+
+    self._condition = threading.Condition()
+    self._pending = {}     # group to dictionary of key to value
+    self._deadline = None  # time.monotonic() when pending must be written, None when nothing pending
+    self._thread = None
+    # Held while writing: writes (worker or flush()) do not interleave, and so a newer write is never overwritten by an older
+    self._writeLock = threading.Lock()
+    self._isQuitConnected = False
+    self._isFailing = False  # last write failed: alerted once, not per retry
+
+    self.writesRequested = 0
+    self.writesPerformed = 0
+
+    atexit.register(self.flush)
+
+
+  @property
+  def isPending(self):
+    with self._condition:
+      return bool(self._pending)
+
+
+  def write(self, group, values):
+    '''
+    Record values (dictionary of key to value) for keys in settings group.
+    Written later (unless coalesceWindow is zero.)
+    '''
+    with self._condition:
+      self.writesRequested += 1
+      self._pending.setdefault(group, {}).update(values)
+      if self._deadline is None:
+        self._deadline = time.monotonic() + self.coalesceWindow
+      self._ensureThread()
+      self._condition.notify()
+
+    if self.coalesceWindow == 0:
+      self.flush()
+    else:
+      self._connectQuit()
+
+
+  def flush(self):
+    '''
+    Write pending values now, in the calling thread.  Returns when written.
+    '''
+    self._writePending()
+
+
+  '''
+  Worker thread
+  '''
+  def _ensureThread(self):
+    ''' Caller holds condition. '''
+    if self._thread is None and self.coalesceWindow > 0:
+      self._thread = threading.Thread(target=self._run, name="SettingsWriter")
+      self._thread.daemon = True  # Final flush is atexit, not by joining
+      self._thread.start()
+
+
+  def _run(self):
+    while True:
+      with self._condition:
+        while self._deadline is None:
+          self._condition.wait()
+        remaining = self._deadline - time.monotonic()
+      if remaining > 0:
+        time.sleep(remaining)  # Coalesce: not woken by later writes
+        continue
+      self._writePending()
+
+
+  def _writePending(self):
+    '''
+    Write pending values.  On failure, keep them pending (and the worker alive.)
+    '''
+    with self._writeLock:
+      pending = self._takePending()
+      try:
+        self._writeNow(pending)
+      except Exception as exception:   # Any backend failure: a settings write must not kill the worker, nor raise at quit
+        self._restorePending(pending)
+        if not self._isFailing:
+          self._isFailing = True
+          alertLog("Failed to write settings: " + str(exception))
+      else:
+        self._isFailing = False
+
+
+  def _restorePending(self, pending):
+    '''
+    Make pending (taken, not written) pending again, to retry after coalesceWindow.
+    Values written meanwhile are newer: they win.
+    '''
+    with self._condition:
+      for group, values in pending.items():
+        merged = dict(values)
+        merged.update(self._pending.get(group, {}))
+        self._pending[group] = merged
+      if self._deadline is None:
+        self._deadline = time.monotonic() + self.coalesceWindow
+      self._condition.notify()
+
+
+  def _takePending(self):
+    with self._condition:
+      result = self._pending
+      self._pending = {}
+      self._deadline = None
+    return result
+
+
+  def _writeNow(self, pending):
+    ''' Caller holds writeLock. '''
+    if not pending:
+      return
+    backend = settingsBackend()
+    for group, values in pending.items():
+      backend.write(group, values)
+    with self._condition:
+      self.writesPerformed += 1
+    debugLog("Settings written.")
+
+
+  def _connectQuit(self):
+    '''
+    Flush when app quits (before QApplication and its settings names are gone.)
+    Connected on first write after QCoreApplication exists.
+    '''
+    if self._isQuitConnected:
+      return
+    app = QCoreApplication.instance()
+    if app is not None:
+      app.aboutToQuit.connect(self.flush)
+      self._isQuitConnected = True
+
+
+
+settingsWriter = SettingsWriter()  # singleton
@@ -0,0 +1,47 @@
+
+
+
+class SyncVerifier(object):
+  '''
+  Knows whether a PageLayout and a PrinterAdaptor were verified in sync,
+  and not changed since.
+
+  Both are Versioned.
+  A sync is recorded as the pair of their versions at the time it was verified.
+  When neither version changed since, a caller may skip the (expensive) strong comparison.
+
+  Counts the checks skipped and performed, for measuring.
+  '''
+
+  def __init__(self):
+    self._syncedVersions = None
+    self.checksSkipped = 0
+    self.checksPerformed = 0
+
+
+  def isSynced(self, pageLayout, printerAdaptor):
+    '''
+    Whether neither changed since last markSynced().
+
+    Counts: a True result is a check skipped, a False result is a check the caller will perform.
+    '''
+    result = self._syncedVersions == (pageLayout.version, printerAdaptor.version)
+    if result:
+      self.checksSkipped += 1
+    else:
+      self.checksPerformed += 1
+    return result
+
+
+  def markSynced(self, pageLayout, printerAdaptor):
+    '''
+    Caller verified (or did its best to make) pageLayout and printerAdaptor in sync.
+    '''
+    self._syncedVersions = (pageLayout.version, printerAdaptor.version)
+
+
+  def invalidate(self):
+    '''
+    Next check is performed, regardless of versions.
+    '''
+    self._syncedVersions = None
@@ -66,6 +66,18 @@ class PageSetupDialog(QDialog):
     
     
     
+  def setValuesFromPageLayout(self, pageLayout):
+    '''
+    Set controls to values of pageLayout, before showing (again.)
+    A dialog may be reused (see PageSetupDialogCache): not show choices the user canceled.
+    A value not in a control's model (e.g. Custom paper) leaves that control as is.
+    '''
+    for attribute, value in ((self.sizeControl, pageLayout.paper.value),
+                             (self.orientationControl, pageLayout.orientation.value)):
+      if attribute.isValueInModel(value):
+        attribute.setValue(value)
+    
+    
   def _createDialogBody(self):
     '''
     Create body of dialog, on self's primitive controls.
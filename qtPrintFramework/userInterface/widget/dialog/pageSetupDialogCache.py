@@ -0,0 +1,92 @@
+
+from collections import OrderedDict
+
+from qtPrintFramework.userInterface.widget.dialog.realPrinterPageSetup import RealPrinterPageSetupDialog
+from qtPrintFramework.alertLog import debugLog
+
+
+
+class PageSetupDialogCache(object):
+  '''
+  RealPrinterPageSetupDialog per printer, keyed by printer name, built once and reused.
+
+  Building a dialog queries the printer's paper sizes, translates, builds combo boxes and lays out a form.
+  A dialog depends only on its printer (title, paper size model), so a built one is shown again,
+  and prewarm() builds one before it is needed (e.g. in idle time, see PrinteredConverser.prewarmPageSetupDialog().)
+
+  At most maxSize dialogs; the least recently used is evicted (and destroyed.)
+  Dialogs are children of parentWidget: a cache per window (owned by its converser.)
+
+  Metrics: hits, misses (built when needed), prewarms (built ahead), evictions.
+
+  Not thread safe: widgets belong to the GUI thread.
+  '''
+
+  defaultMaxSize = 4
+
+
+  def __init__(self, parentWidget, maxSize=None):
+    if maxSize is None:
+      maxSize = PageSetupDialogCache.defaultMaxSize
+    assert maxSize >= 1  # The dialog being shown is never evicted
+    self.maxSize = maxSize
+    self.parentWidget = parentWidget
+    self._dialogs = OrderedDict()  # printer name to dialog, least recently used first
+
+    self.hits = 0
+    self.misses = 0
+    self.prewarms = 0
+    self.evictions = 0
+
+
+  def __len__(self):
+    return len(self._dialogs)
+
+  def __contains__(self, printerName):
+    return printerName in self._dialogs
+
+
+  def dialogFor(self, printerAdaptor):
+    '''
+    Dialog for printer that printerAdaptor adapts: cached, else built now.
+    '''
+    key = printerAdaptor.printerName()
+    try:
+      result = self._dialogs[key]
+      self._dialogs.move_to_end(key)
+      self.hits += 1
+    except KeyError:
+      self.misses += 1
+      result = self._addDialog(key, printerAdaptor)
+    return result
+
+
+  def prewarm(self, printerAdaptor):
+    '''
+    Build dialog for printer that printerAdaptor adapts, unless cached.
+    Not counted as a use: does not make a cached dialog more recent.
+    '''
+    key = printerAdaptor.printerName()
+    if key not in self._dialogs:
+      self.prewarms += 1
+      self._addDialog(key, printerAdaptor)
+      debugLog("Prewarmed page setup dialog.")
+
+
+  def invalidate(self, printerName=None):
+    '''
+    Forget dialog for printerName (all if None), e.g. when its capabilities changed (see PrinterCapabilityCache.)
+    '''
+    for key in list(self._dialogs):
+      if printerName is None or key == printerName:
+        self._dialogs.pop(key).deleteLater()
+
+
+  def _addDialog(self, key, printerAdaptor):
+    result = RealPrinterPageSetupDialog(parentWidget=self.parentWidget, printerAdaptor=printerAdaptor)
+    self._dialogs[key] = result
+    while len(self._dialogs) > self.maxSize:
+      _, evicted = self._dialogs.popitem(last=False)
+      evicted.deleteLater()
+      self.evictions += 1
+    return result
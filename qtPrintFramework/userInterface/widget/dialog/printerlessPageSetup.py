@@ -2,7 +2,8 @@
 
 from qtPrintFramework.userInterface.widget.dialog.pageSetup import PageSetupDialog
 
-from qtPrintFramework.pageLayout.model.pageNameToEnum import pageNameToEnum as singletonPageNameToEnum  # singleton
+# Module, not its attribute: the singleton model is built on first dialog, not at import
+import qtPrintFramework.pageLayout.model.pageNameToEnum as pageNameToEnumModule
 from qtPrintFramework.translations import Translations
 
 
@@ -16,7 +17,8 @@ class PrinterlessPageSetupDialog(PageSetupDialog):
   
   def __init__(self, parentWidget=None):
     
-    paperSizeModel = singletonPageNameToEnum
+    # WAS the model's dictionary, which lacks default() and items() of a model
+    paperSizeModel = pageNameToEnumModule.pageNameToEnumModel  # singleton
     translations = Translations()
     title = translations.PageSetupPDF
     super(PrinterlessPageSetupDialog, self).__init__(parentWidget=parentWidget, title=title, paperSizeModel=paperSizeModel)
@@ -6,9 +6,10 @@ This is free software, covered by the GNU General Public License.
 
 from PyQt5.QtCore import pyqtSignal as Signal
 from PyQt5.QtCore import pyqtSlot as Slot
-from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QComboBox
 
+from qtPrintFramework.userInterface.widget.pageAttributeListModel import PageAttributeListModel
+
 # from qtPrintFramework.pageLayout.model.adaptedModel import AdaptedModel
 
 
@@ -17,7 +18,8 @@ class PageAttributeComboBox(QComboBox):
   Control widget:
   - GUI behaviour of QComboBox
   - adapts QComboBox to have value(), setValue(), valueChanged() API
-  - takes a model that is an enum
+  - takes a model that is an enum (an AdaptedModel)
+  - views it through a shared PageAttributeListModel: value to index is O(1), not a search
   
   QComboBox is too broad for our use: includes editing of text
   AND QComboBox is too narrow for our use: doesn't implement setValue().
@@ -32,8 +34,9 @@ class PageAttributeComboBox(QComboBox):
     QComboBox.__init__(self)
     self.model = model
     
-    ### WAS (unsorted): self.addItems(list(model.values.keys()))
-    self.addItems(model.keys())
+    ### WAS: self.addItems(model.keys()), copying every key, and setItemData() per row to align
+    self.listModel = PageAttributeListModel.shared(model)
+    self.setModel(self.listModel)
 
     
     # connect adapted widget signal to adapter
@@ -66,7 +69,7 @@ class PageAttributeComboBox(QComboBox):
   
   def value(self):
     #print("pageAttributeComboBox.value() returns", self.currentText())
-    return self._adaptNewValue(self.currentText())
+    return self._adaptNewValue(self.currentIndex())
   
   
   def isValueInModel(self, value):
@@ -92,13 +95,15 @@ class PageAttributeComboBox(QComboBox):
   Convert to and from Widget text values to model values.
   '''
   
-  def _adaptNewValue(self, newValue):
+  def _adaptNewValue(self, index):
     '''
-    Adapt Widget's string value to model value, i.e. enum value.
+    Adapt Widget's index to model value, i.e. enum value.
+    Raises IndexError if index is not a row, e.g. -1 when no current item (empty model.)
+    
+    WAS: adapted currentText(), by lookup of name in model.
     '''
-    # assert value is unicode. Use str() to decode
-    convertedValue = self.model.values[str(newValue)] # 
-    #print "Adapted ", newValue, "converted type", type(convertedValue)
+    convertedValue = self.listModel.valueAt(index)
+    #print "Adapted ", index, "converted type", type(convertedValue)
     return convertedValue
   
     
@@ -109,20 +114,12 @@ class PageAttributeComboBox(QComboBox):
      or tuple (0, False)  if searchValue missing from model
     '''
     # searchValue is an enum value or None, and None can be a value in dictionary
-    i = 0
-    foundKey = False
-    ## WAS (unsorted) for _, value in self.model.values.items():
-    for _, value in self.model.items():
-      #print searchValue, value
-      # if searchValue is None and None is in dictionary, or searchValue == value
-      if value is searchValue or value == searchValue:  # !!! is, not ==, to match None
-        foundKey = True
-        break
-      i += 1
+    ## WAS linear search of self.model.items(), which sorted again for a sorted model
+    index = self.listModel.rowOfValue(searchValue)
     
     #OLD assert foundKey, "Missing value: " + str(searchValue) + " in model" + str(self.model) # dict is complete on values
-    if foundKey:
-      result = i, True
+    if index is not None:
+      result = index, True
     else:
       result = 0, False
     return result
@@ -142,17 +139,14 @@ class PageAttributeComboBox(QComboBox):
     
     If aligning right, does this help:
     comboBox.view().setLayoutDirection(Qt.RightToLeft)
+    
+    Items are aligned by the model (computed TextAlignmentRole, not per item data.)
     '''
-    direction = Qt.AlignLeft
+    direction = PageAttributeListModel.textAlignment
     self._alignTextEdit(direction=direction)
     ##self.view().setLayoutDirection(Qt.RightToLeft)
-    self._alignItems(direction)
-  
-  def _alignItems(self, direction):
-    for i in range(0, self.count()):
-      #print("Aligning item")
-      self.setItemData(i, direction, Qt.TextAlignmentRole)
     
+
   def _alignTextEdit(self, direction):
     self.setEditable(True)
     self.lineEdit().setReadOnly(True)
@@ -0,0 +1,122 @@
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QVariant
+
+
+
+class PageAttributeListModel(QAbstractListModel):
+  '''
+  Qt item model (for a view e.g. PageAttributeComboBox) on an AdaptedModel (dictionary from name to enum value.)
+
+  Rows are the source's items() in the source's order (sorted, for an AdaptedSortedModel.)
+
+  Responsibilities:
+  - data for roles: display/edit is name, user is enum value, text alignment is computed (not stored per row)
+  - row of value, value of row: O(1)
+  - refresh from source when source's values are replaced: one reset of the model, not one insert per row
+
+  Shared: see shared(), one instance per source, for all views on that source.
+  '''
+
+  ValueRole = Qt.UserRole
+
+  # Alignment of every item's text: see PageAttributeComboBox._alignSelf()
+  textAlignment = Qt.AlignLeft
+
+
+  def __init__(self, sourceModel=None, parent=None):
+    super(PageAttributeListModel, self).__init__(parent)
+    self._names = ()
+    self._values = ()
+    self._rowForValue = {}
+    self.sourceModel = None
+    if sourceModel is not None:
+      self.setSourceModel(sourceModel)
+
+
+  @classmethod
+  def shared(cls, sourceModel):
+    '''
+    The PageAttributeListModel on sourceModel, created on first request.
+    Many views on a source (e.g. each instance of a dialog) share one model: built once, not per view.
+    
+    Kept as an attribute of sourceModel, so it lives as long as sourceModel
+    (a weak-keyed registry would not do: the list model references its source.)
+    '''
+    result = getattr(sourceModel, '_sharedListModel', None)
+    if result is None:
+      result = cls(sourceModel)
+      sourceModel._sharedListModel = result
+    return result
+
+
+  def setSourceModel(self, sourceModel):
+    if self.sourceModel is not None:
+      self.sourceModel.valuesChanged.disconnect(self.refresh)
+    self.sourceModel = sourceModel
+    # Source emits when its values are replaced
+    sourceModel.valuesChanged.connect(self.refresh)
+    self.refresh()
+
+
+  def refresh(self):
+    '''
+    Rebuild rows from source, after the source's values changed.
+    One model reset: views are told once, not per row.
+    
+    Source's items() is memoized (see AdaptedModel), so this does not sort again.
+    '''
+    self.beginResetModel()
+    items = self.sourceModel.items()
+    self._names = tuple(str(name) for name, _ in items)
+    self._values = tuple(value for _, value in items)
+    # Where two names have same value, first row wins (as formerly did the linear search)
+    rowForValue = {}
+    for row, value in enumerate(self._values):
+      rowForValue.setdefault(value, row)
+    self._rowForValue = rowForValue
+    self.endResetModel()
+
+
+  '''
+  Lookup, O(1)
+  '''
+  def rowOfValue(self, value):
+    ''' row of value, or None if value not in model. '''
+    return self._rowForValue.get(value)
+
+  def valueAt(self, row):
+    '''
+    Value of row.  Raises IndexError if no such row,
+    e.g. -1, a view's current index when it is empty (not Python's last item.)
+    '''
+    self._checkRow(row)
+    return self._values[row]
+
+  def nameAt(self, row):
+    self._checkRow(row)
+    return self._names[row]
+
+  def _checkRow(self, row):
+    if not 0 <= row < len(self._values):
+      raise IndexError("No row {} in PageAttributeListModel of {} rows".format(row, len(self._values)))
+
+
+  '''
+  Reimplemented QAbstractListModel
+  '''
+  def rowCount(self, parent=QModelIndex()):
+    if parent.isValid():
+      return 0  # list, not tree
+    return len(self._names)
+
+
+  def data(self, index, role=Qt.DisplayRole):
+    if not index.isValid() or not 0 <= index.row() < len(self._names):
+      return QVariant()
+    if role in (Qt.DisplayRole, Qt.EditRole):
+      return self._names[index.row()]
+    elif role == Qt.TextAlignmentRole:
+      return int(self.textAlignment)
+    elif role == PageAttributeListModel.ValueRole:
+      return self._values[index.row()]
+    return QVariant()
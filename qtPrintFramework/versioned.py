@@ -0,0 +1,33 @@
+
+from itertools import count
+
+
+# Shared by all Versioned instances: a stamp is unique and increases across instances.
+_versionStamps = count(1)
+
+
+
+class Versioned(object):
+  '''
+  Mixin: a version stamp that changes whenever the state of self changes.
+
+  Inheritor calls touch() whenever it changes state (including when initialized.)
+
+  Stamps come from one counter shared by all instances.
+  So a composite (e.g. PageLayout) can take the max over its parts:
+  replacing a part by a new instance still yields a newer version.
+
+  Compare versions only for equality, or as "newer than", never do arithmetic on them.
+  '''
+
+  _version = 0
+
+  @property
+  def version(self):
+    return self._version
+
+  def touch(self):
+    '''
+    Mark self changed.
+    '''
+    self._version = next(_versionStamps)
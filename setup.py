@@ -8,6 +8,7 @@ setup(name='qtPrintFramework',
       author='Lloyd Konneker',
       author_email='bootch@nc.rr.com',
       url='https://github.com/bootchk/qtPrintFramework',
+      # Requires PyQt5.  Optional: NumPy, only for qtPrintFramework.pageLayout.model.paperSizeBatch
       packages=['qtPrintFramework',
                 'qtPrintFramework.converser',
                 'qtPrintFramework.pageLayout',
@@ -16,6 +17,7 @@ setup(name='qtPrintFramework',
                 'qtPrintFramework.pageLayout.components.paper',
                 'qtPrintFramework.pageLayout.model',
                 'qtPrintFramework.printer',
+                'qtPrintFramework.settings',
                 'qtPrintFramework.userInterface',
                 'qtPrintFramework.userInterface.qml',
                 'qtPrintFramework.userInterface.qml.dialog',
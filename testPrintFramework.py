@@ -70,6 +70,7 @@ class MainWindow(QMainWindow):
     
   def connectPrintConverserSignals(self):
     self.printConverser.userChangedLayout[int].connect(self.changedLayout)
+    self.printConverser.userChangedLayoutChanges.connect(self.changedLayoutChanges)
     # userChangedPrinter
     
     self.printConverser.userAcceptedPrint.connect(self.acceptedPrint)
@@ -88,6 +89,9 @@ class MainWindow(QMainWindow):
     print(">>>Changed layout(paper or orientation), page layout is", self.printConverser.pageLayout)
     pass
     
+  def changedLayoutChanges(self, changeSet):
+    print(">>>Changed layout:", changeSet, "repaginate:", changeSet.isGeometryChanged)
+    
   def acceptedPrint(self):
     print(">>>Accepted print to printable size inch", self.printConverser.printablePageSizeInch())
     pass
@@ -0,0 +1,42 @@
+'''
+Fixtures for tests of qtPrintFramework.
+
+Headless: Qt's offscreen platform, settings in memory, files in pytest's tmp_path.
+'''
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from PyQt5.QtWidgets import QApplication
+
+from qtPrintFramework.settings.settingsBackend import MemorySettingsBackend, setSettingsBackend
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+
+
+
+@pytest.fixture(scope="session")
+def qapp():
+  app = QApplication.instance()
+  if app is None:
+    app = QApplication([])
+  app.setOrganizationName("qtPrintFramework")
+  app.setApplicationName("tests")
+  return app
+
+
+@pytest.fixture(autouse=True)
+def memorySettings():
+  '''
+  Every test has its own, empty, settings: never the user's.
+  '''
+  settingsWriter.flush()
+  backend = MemorySettingsBackend()
+  setSettingsBackend(backend)
+  yield backend
+  settingsWriter.flush()
+  setSettingsBackend(None)
@@ -0,0 +1,64 @@
+
+import threading
+
+import pytest
+
+from qtPrintFramework.printer.printerBackend import printerBackend, setPrinterBackend
+from qtPrintFramework.printer.standInPrinterBackend import StandInPrinterBackend
+from qtPrintFramework.printer.printerSet import PrinterSet
+from qtPrintFramework.printer.capabilityCache import PrinterCapabilityCache
+from qtPrintFramework.printer.capabilityProber import PrinterCapabilityProber
+
+
+
+@pytest.fixture
+def backend(qapp):
+  previous = printerBackend()
+  result = StandInPrinterBackend(printerCount=0)
+  setPrinterBackend(result)
+  yield result
+  setPrinterBackend(previous)
+
+
+@pytest.fixture
+def prober(backend, tmp_path):
+  return PrinterCapabilityProber(printerSet=PrinterSet(), cache=PrinterCapabilityCache(path=str(tmp_path / "cache.json")),
+                                 maxWorkers=2, timeout=0.3)
+
+
+def test_probesAll(backend, prober):
+  for name in ("a", "b", "c"):
+    backend.addPrinter(name)
+  prober.probe(["a", "b", "c"])
+  prober.wait(5)
+  assert not prober.isProbing
+  assert sorted(prober.results) == ["a", "b", "c"]
+  assert prober.timedOutNames == set()
+
+
+def test_slowPrinterTimesOutOthersProbed(backend, prober):
+  backend.addPrinter("slow", capabilityLatency=3.0)
+  backend.addPrinter("a")
+  backend.addPrinter("b")
+  prober.probe(["slow", "a", "b"])
+  prober.wait(2)
+  assert not prober.isProbing
+  assert sorted(prober.results) == ["a", "b"]
+  assert prober.timedOutNames == {"slow"}
+
+
+def test_inFlightPrinterNotQueriedAgain(backend, prober):
+  backend.addPrinter("slow", capabilityLatency=2.0)
+  backend.addPrinter("a")
+  prober.probe(["slow"])
+  prober.wait(2)
+  assert prober.timedOutNames == {"slow"}
+  queries = backend.capabilityQueryCount
+  threadCount = threading.active_count()
+  for _ in range(3):
+    prober.probe(["slow", "a"])
+    prober.wait(2)
+    assert prober.timedOutNames == {"slow"}
+    assert "a" in prober.results
+  assert backend.capabilityQueryCount - queries <= 3    # Only "a" (or from the cache), never "slow" again
+  assert threading.active_count() <= threadCount
@@ -0,0 +1,90 @@
+
+import os
+import sqlite3
+
+import pytest
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+import qtPrintFramework.settings.documentLayoutStore as documentLayoutStoreModule
+from qtPrintFramework.settings.documentLayoutStore import DocumentLayoutStore
+
+
+A4 = PageLayoutRecord(0, 0, (210, 297))
+Legal = PageLayoutRecord(3, 0, (216, 356))
+
+
+@pytest.fixture
+def path(tmp_path):
+  return str(tmp_path / "documentLayouts.sqlite")
+
+
+@pytest.fixture
+def alerts(monkeypatch):
+  result = []
+  monkeypatch.setattr(documentLayoutStoreModule, "alertLog", result.append)
+  return result
+
+
+def test_putIsBatchedAndPersists(path):
+  store = DocumentLayoutStore(path=path, batchSize=3)
+  store.put("a", A4)
+  store.put("b", Legal)
+  assert store.batchesWritten == 0
+  assert store.get("a") == A4  # Sees pending
+  store.put("c", Legal)
+  assert store.batchesWritten == 1
+  store.remove("b")
+  store.close()
+  other = DocumentLayoutStore(path=path)
+  assert other.get("a") == A4
+  assert other.get("b") is None
+  assert other.get("b", default=Legal) == Legal
+
+
+def test_lruEviction(path):
+  store = DocumentLayoutStore(path=path, cacheSize=2)
+  store.put("a", A4)
+  store.put("b", A4)
+  store.get("a")
+  store.put("c", A4)   # Evicts b, least recently used
+  assert list(store._cache) == ["a", "c"]
+  hits = store.hits
+  store.get("b")       # From pending, not cache
+  assert store.hits == hits
+
+
+def test_prefetchFolder(path):
+  store = DocumentLayoutStore(path=path)
+  folder = os.path.join("home", "user")
+  inFolder = [os.path.join(folder, name) for name in ("a.doc", "sub\U0001F600dir", "\U0001F600.doc", "\uffff\U00010000.doc")]
+  notInFolder = [folder + "x.doc", os.path.join("home", "other", "a.doc"), folder]
+  for documentId in inFolder + notInFolder:
+    store.put(documentId, A4)
+  store.close()
+  other = DocumentLayoutStore(path=path)
+  other.prefetchFolder(folder)
+  assert sorted(other._cache) == sorted(inFolder)
+
+
+def test_failedWriteStaysPendingAlertedOnce(path, alerts):
+  store = DocumentLayoutStore(path=path, batchSize=1)
+  store.put("a", A4)
+  # Another connection (e.g. another instance of app) locks the database
+  locker = sqlite3.connect(path, timeout=0)
+  locker.execute("BEGIN EXCLUSIVE")
+  store._connection.execute("PRAGMA busy_timeout=0")
+  store.put("b", Legal)
+  store.put("c", Legal)
+  store.put("b", A4)   # Newer wins
+  assert set(store._pending) == {"b", "c"}
+  assert store.batchesWritten == 1
+  assert len(alerts) == 1
+  locker.rollback()
+  locker.close()
+  store.flush()
+  assert not store._pending
+  store.close()
+  other = DocumentLayoutStore(path=path)
+  assert other.get("b") == A4
+  assert other.get("c") == Legal
+  assert store._isFailing is False
@@ -0,0 +1,57 @@
+
+import pytest
+
+from PyQt5.QtCore import QMarginsF, QRectF
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout, QPageSize
+
+from qtPrintFramework.pageLayout.layoutChangeSet import LayoutChangeSet
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+
+
+A4 = PageLayoutRecord(QPagedPaintDevice.A4, QPageLayout.Portrait, (210, 297))
+CustomA4 = PageLayoutRecord(QPagedPaintDevice.Custom, QPageLayout.Portrait, (210, 297))
+A4Landscape = PageLayoutRecord(QPagedPaintDevice.A4, QPageLayout.Landscape, (297, 210))
+Rect = (0.25, 0.25, 7.77, 11.19)
+
+
+def test_firstChange():
+  changeSet = LayoutChangeSet(None, A4, None, Rect)
+  assert changeSet.changedAttributes == {"paperEnum", "orientation", "integralOrientedSizeMM", "printableRect"}
+
+
+def test_paperNameOnlyIsNotGeometry():
+  changeSet = LayoutChangeSet(A4, CustomA4, Rect, Rect)
+  assert changeSet.isPaperChanged
+  assert not changeSet.isGeometryChanged
+  assert changeSet.changes == {"paperEnum" : (QPagedPaintDevice.A4, QPagedPaintDevice.Custom)}
+
+
+def test_orientationIsGeometry():
+  changeSet = LayoutChangeSet(A4, A4Landscape, Rect, Rect)
+  assert changeSet.isOrientationChanged and changeSet.isGeometryChanged
+  assert not changeSet.isPaperChanged
+
+
+def test_unchanged():
+  changeSet = LayoutChangeSet(A4, A4, Rect, tuple(value + 0.0001 for value in Rect))
+  assert not changeSet.isChanged
+  with pytest.raises(AttributeError):
+    changeSet.unit = QPageLayout.Point
+
+
+@pytest.mark.parametrize("unit", [QPageLayout.Millimeter, QPageLayout.Point, QPageLayout.Pica,
+                                  QPageLayout.Didot, QPageLayout.Cicero])
+def test_convertedRectAsQt(unit):
+  ''' Converts as QPageLayout does (which rounds, to 0.01 and the page size in some units.) '''
+  pageLayout = QPageLayout(QPageSize(QPageSize.A4), QPageLayout.Portrait, QMarginsF(10, 20, 30, 40), QPageLayout.Point)
+  qtRect = pageLayout.paintRect(unit)
+  pointRect = pageLayout.paintRect(QPageLayout.Point)
+  rect = LayoutChangeSet.convertedRect((pointRect.x(), pointRect.y(), pointRect.width(), pointRect.height()),
+                                       QPageLayout.Point, unit)
+  assert rect == pytest.approx((qtRect.x(), qtRect.y(), qtRect.width(), qtRect.height()), rel=0.001, abs=0.01)
+
+
+def test_convertedRectExact():
+  assert LayoutChangeSet.convertedRect((0, 0, 72, 144), QPageLayout.Point, QPageLayout.Inch) == (0, 0, 1, 2)
+  assert LayoutChangeSet.convertedRect((0, 0, 1, 2), QPageLayout.Inch, QPageLayout.Millimeter) == pytest.approx((0, 0, 25.4, 50.8))
+  assert LayoutChangeSet.convertedRect(None, QPageLayout.Inch, QPageLayout.Point) is None
@@ -0,0 +1,141 @@
+
+import pytest
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.pageLayout.components.paper.paperValue import PaperValue
+
+
+
+class Recorder(object):
+  ''' Records emits of a PageLayout and its attributes. '''
+
+  def __init__(self, pageLayout):
+    self.layoutChanged = 0
+    self.paperChanged = []
+    self.orientationChanged = []
+    pageLayout.layoutChanged.connect(self._layoutChanged)
+    pageLayout.paper.valueChanged.connect(self.paperChanged.append)
+    pageLayout.orientation.valueChanged.connect(self.orientationChanged.append)
+
+  def _layoutChanged(self):
+    self.layoutChanged += 1
+
+
+
+@pytest.fixture
+def pageLayout(qapp):
+  from qtPrintFramework.pageLayout.pageLayout import PageLayout
+  result = PageLayout()
+  result.setValuesFromRecord(PageLayoutRecord(QPagedPaintDevice.A4, QPageLayout.Portrait, (210, 297)))
+  return result
+
+
+def test_batchEmitsOnce(pageLayout):
+  recorder = Recorder(pageLayout)
+  with pageLayout.batchUpdate():
+    pageLayout.orientation.value = QPageLayout.Landscape
+    pageLayout.paper.value = QPagedPaintDevice.Letter
+    assert recorder.layoutChanged == 0
+    assert recorder.paperChanged == []
+  assert recorder.layoutChanged == 1
+  assert recorder.paperChanged == [QPagedPaintDevice.Letter]
+  assert recorder.orientationChanged == [QPageLayout.Landscape]
+
+
+def test_nestedBatchEmitsOnceAtOutermost(pageLayout):
+  recorder = Recorder(pageLayout)
+  with pageLayout.batchUpdate():
+    with pageLayout.batchUpdate():
+      pageLayout.paper.value = QPagedPaintDevice.Letter
+    assert recorder.layoutChanged == 0
+  assert recorder.layoutChanged == 1
+
+
+def test_unchangedRecordEmitsNothing(pageLayout):
+  recorder = Recorder(pageLayout)
+  version = pageLayout.version
+  pageLayout.setValuesFromRecord(pageLayout.toRecord())
+  pageLayout.paper.setPaperValue(PaperValue.standard(QPagedPaintDevice.A4))
+  assert recorder.layoutChanged == 0
+  assert recorder.paperChanged == []
+  assert pageLayout.version == version
+
+
+def test_unchangedCustomSizeNotTouched(pageLayout):
+  pageLayout.paper.setPaperValue(PaperValue.custom((100, 200)))
+  version = pageLayout.version
+  recorder = Recorder(pageLayout)
+  pageLayout.paper.setPaperValue(PaperValue.custom((100, 200)))
+  pageLayout.paper.setSize(QSize(100, 200), QPageLayout.Portrait)
+  assert pageLayout.version == version
+  assert recorder.paperChanged == []
+  pageLayout.paper.setSize(QSize(200, 100), QPageLayout.Portrait)
+  assert pageLayout.version != version
+
+
+def test_attributeReplacedInBatchEmits(pageLayout):
+  ''' Attributes replaced (by fromRecord) in a batch emit if their values differ. '''
+  paperChanged = []
+  orientationChanged = []
+  recorder = Recorder(pageLayout)
+  with pageLayout.batchUpdate():
+    pageLayout.fromRecord(PageLayoutRecord(QPagedPaintDevice.Legal, QPageLayout.Portrait, (216, 356)))
+    pageLayout.paper.valueChanged.connect(paperChanged.append)
+    pageLayout.orientation.valueChanged.connect(orientationChanged.append)
+    pageLayout.paper.value = QPagedPaintDevice.Letter   # Not emitted until end of batch
+    assert paperChanged == []
+  assert recorder.layoutChanged == 1
+  assert paperChanged == [QPagedPaintDevice.Letter]
+  assert orientationChanged == []  # Same orientation
+  assert not pageLayout.paper.signalsBlocked()
+  # New instances are connected
+  pageLayout.orientation.value = QPageLayout.Landscape
+  assert recorder.layoutChanged == 2
+
+
+def test_attributeReplacedByEqualInBatchEmitsNothing(pageLayout):
+  recorder = Recorder(pageLayout)
+  with pageLayout.batchUpdate():
+    pageLayout.fromRecord(pageLayout.toRecord())
+  assert recorder.layoutChanged == 0
+
+
+def test_settingEqualValueNotTouched(pageLayout):
+  recorder = Recorder(pageLayout)
+  version = pageLayout.version
+  pageLayout.paper.value = QPagedPaintDevice.A4
+  pageLayout.orientation.value = QPageLayout.Portrait
+  assert pageLayout.version == version
+  assert recorder.layoutChanged == 0
+  assert recorder.paperChanged == [] and recorder.orientationChanged == []
+  pageLayout.orientation.value = QPageLayout.Landscape
+  assert pageLayout.version != version
+  assert recorder.orientationChanged == [QPageLayout.Landscape]
+
+
+def test_settingCustomKeepsSizeNotTouched(pageLayout):
+  pageLayout.paper.setPaperValue(PaperValue.custom((100, 200)))
+  version = pageLayout.version
+  pageLayout.paper.value = QPagedPaintDevice.Custom
+  assert pageLayout.version == version
+  assert pageLayout.paper.paperValue == PaperValue.custom((100, 200))
+
+
+def test_fromUnchangedPrinterEmitsNothing(pageLayout, capsys):
+  from PyQt5.QtPrintSupport import QPrinter
+  from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+  from qtPrintFramework.adaptPageLayoutToPrinter import AdaptorFromPageLayoutToPrinterAdaptor
+  printerAdaptor = PrinterAdaptor(None)
+  printerAdaptor.setOutputFormat(QPrinter.PdfFormat)
+  adaptor = AdaptorFromPageLayoutToPrinterAdaptor()
+  adaptor.toPrinterAdaptor(pageLayout, printerAdaptor)
+  recorder = Recorder(pageLayout)
+  version = pageLayout.version
+  capsys.readouterr()
+  adaptor.fromPrinterAdaptor(pageLayout, printerAdaptor)
+  assert recorder.layoutChanged == 0
+  assert capsys.readouterr().out == ""   # Logs to debugLog, not console
+  assert pageLayout.version == version
@@ -0,0 +1,72 @@
+
+import pickle
+
+import pytest
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+
+
+
+def test_binaryRoundTrip():
+  record = PageLayoutRecord(QPagedPaintDevice.A4, QPageLayout.Landscape, (297, 210), (1.0, 2.0, 3.0, 4.0))
+  data = record.encode()
+  assert len(data) == PageLayoutRecord._struct.size
+  assert PageLayoutRecord.decode(data) == record
+  assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_jsonRoundTrip():
+  record = PageLayoutRecord(QPagedPaintDevice.Letter, QPageLayout.Portrait, (216, 279))
+  assert PageLayoutRecord.fromJSON(record.toJSON()) == record
+  assert PageLayoutRecord.decode(record.toJSON().encode('utf-8')) == record
+
+
+@pytest.mark.parametrize("size, margins", [((70000, 100), None),
+                                           ((-1, 100), None),
+                                           ((100, 100), (1e39, 0.0, 0.0, 0.0))])
+def test_outOfRangeFallsBackToJSON(size, margins):
+  record = PageLayoutRecord(QPagedPaintDevice.Custom, QPageLayout.Portrait, size, margins)
+  data = record.encode()
+  assert data[:1] == b'{'
+  assert PageLayoutRecord.decode(data) == record
+
+
+def test_decodeRejectsGarbage():
+  with pytest.raises(ValueError):
+    PageLayoutRecord.decode(b'\x07garbage')
+  with pytest.raises(ValueError):
+    PageLayoutRecord.decode(b'{"formatVersion":1}')
+
+
+def test_settingsRoundTrip(qapp, memorySettings):
+  from qtPrintFramework.pageLayout.pageLayout import PageLayout
+  pageLayout = PageLayout()
+  pageLayout.setValuesFromRecord(PageLayoutRecord(QPagedPaintDevice.Legal, QPageLayout.Landscape, (356, 216)))
+  pageLayout.toSettings()
+  settingsWriter.flush()
+  assert "pageLayoutRecord" in memorySettings.read("paperlessPrinter")
+  assert PageLayout().toRecord() == pageLayout.toRecord()
+
+
+def test_settingsOutOfRangeRoundTrip(qapp, memorySettings):
+  ''' A record binary cannot hold is written (as JSON) and read back. '''
+  from qtPrintFramework.pageLayout.pageLayout import PageLayout
+  record = PageLayoutRecord(QPagedPaintDevice.Custom, QPageLayout.Portrait, (70000, 100))
+  memorySettings.write("paperlessPrinter", {"pageLayoutRecord" : record.encode()})
+  assert PageLayout().toRecord().integralOrientedSizeMM == (70000, 100)
+
+
+def test_settingsOfFormerVersion(qapp, memorySettings):
+  ''' Without a record key, the four keys of former versions are read. '''
+  from qtPrintFramework.pageLayout.pageLayout import PageLayout
+  memorySettings.write("paperlessPrinter", {"paperEnum" : int(QPagedPaintDevice.Custom),
+                                            "paperOrientation" : int(QPageLayout.Landscape),
+                                            "paperintegralOrientedWidth" : "300",
+                                            "paperintegralOrientedHeight" : "100"})
+  record = PageLayout().toRecord()
+  assert record.paperEnum == QPagedPaintDevice.Custom
+  assert record.orientation == QPageLayout.Landscape
+  assert record.integralOrientedSizeMM == (300, 100)
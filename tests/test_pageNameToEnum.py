@@ -0,0 +1,18 @@
+
+from PyQt5.QtGui import QPagedPaintDevice
+
+from qtPrintFramework.pageLayout.model.pageSizeCatalog import pageSizeCatalog
+
+
+
+def test_pdfPaperSizeModelFromCatalog(qapp):
+  import qtPrintFramework.pageLayout.model.pageNameToEnum as pageNameToEnumModule
+  values = pageNameToEnumModule.pageNameToEnumModel.values
+  for excluded in ("Custom", "LastPageSize", "NPaperSize"):
+    assert excluded not in values
+  # One name per page size: no aliases
+  assert len(set(values.values())) == len(values) == len(pageSizeCatalog())
+  assert values["A4"] == QPagedPaintDevice.A4
+  assert values["Letter"] == QPagedPaintDevice.Letter
+  assert pageNameToEnumModule.pageNameToEnumModel.default() in values.values()
+  assert pageNameToEnumModule.pageNameToEnumModel.keys()[:3] == ("A0", "A1", "A2")
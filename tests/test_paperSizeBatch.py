@@ -0,0 +1,30 @@
+
+import importlib
+import sys
+
+import pytest
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+
+
+def test_withoutNumPyClearError(monkeypatch):
+  monkeypatch.setitem(sys.modules, "numpy", None)   # As if not installed
+  monkeypatch.delitem(sys.modules, "qtPrintFramework.pageLayout.model.paperSizeBatch", raising=False)
+  with pytest.raises(ImportError, match="requires NumPy"):
+    importlib.import_module("qtPrintFramework.pageLayout.model.paperSizeBatch")
+
+
+def test_batchAgreesWithMatcher(qapp):
+  pytest.importorskip("numpy")
+  from qtPrintFramework.pageLayout.model.paperSizeBatch import classifyPageSizes
+  from qtPrintFramework.pageLayout.model.paperSizeMatcher import paperSizeMatcher
+  sizes = [(210.0, 297.0), (297.2, 209.8), (215.9, 279.4), (100.0, 100.0), (float("nan"), 297.0)]
+  enums, _, customMask = classifyPageSizes(sizes)
+  assert list(enums[:3]) == [QPagedPaintDevice.A4, QPagedPaintDevice.A4, QPagedPaintDevice.Letter]
+  assert list(customMask) == [False, False, False, True, True]
+  for (width, height), enum in zip(sizes[:4], enums):
+    expected = paperSizeMatcher.match(width, height)
+    assert enum == (expected if expected is not None else QPagedPaintDevice.Custom)
+  enums, _, _ = classifyPageSizes([(297.0, 210.0)], orientations=QPageLayout.Portrait)
+  assert enums[0] == QPagedPaintDevice.Custom   # No paper is defined 297 wide
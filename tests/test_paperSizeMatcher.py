@@ -0,0 +1,51 @@
+
+import pytest
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+from qtPrintFramework.pageLayout.model.paperSizeMatcher import PaperSizeMatcher
+
+
+
+@pytest.fixture
+def matcher(qapp):
+  from qtPrintFramework.pageLayout.model.paperSizeMatcher import paperSizeMatcher
+  assert paperSizeMatcher.epsilon == PaperSizeMatcher.defaultEpsilon == 0.5
+  return paperSizeMatcher
+
+
+@pytest.mark.parametrize("widthMM, heightMM, expected", [
+  (210.0, 297.0, QPagedPaintDevice.A4),
+  (210.49, 296.51, QPagedPaintDevice.A4),     # Within 0.5
+  (215.9, 279.4, QPagedPaintDevice.Letter),
+  (216.3, 279.0, QPagedPaintDevice.Letter),   # Letter as Qt rounds it through mm
+  (210.5, 297.0, None),                       # Not within: distance must be less than epsilon
+  (211.0, 297.0, None),
+  (100.0, 100.0, None),
+  ])
+def test_matchPortrait(matcher, widthMM, heightMM, expected):
+  assert matcher.match(widthMM, heightMM, QPageLayout.Portrait) == expected
+
+
+def test_matchOrientation(matcher):
+  assert matcher.match(297.0, 210.0, QPageLayout.Landscape) == QPagedPaintDevice.A4
+  assert matcher.match(297.0, 210.0, QPageLayout.Portrait) is None
+  assert matcher.match(297.2, 209.8) == QPagedPaintDevice.A4   # Either orientation
+
+
+def test_matchEpsilon(matcher):
+  assert matcher.match(211.0, 297.0, QPageLayout.Portrait, epsilon=1.5) == QPagedPaintDevice.A4
+  assert matcher.isWithin(QPagedPaintDevice.A4, 210.4, 297.0, QPageLayout.Portrait)
+  assert not matcher.isWithin(QPagedPaintDevice.A4, 210.6, 297.0, QPageLayout.Portrait)
+
+
+def test_equalSizesFirstWins(matcher):
+  ''' A4 and A4Small have the same size: the more common (lower id) wins. '''
+  assert matcher.match(210.0, 297.0, QPageLayout.Portrait) == QPagedPaintDevice.A4
+
+
+def test_nearestDiagnosesMiss(matcher):
+  (enum, distance), = matcher.nearest(211.0, 297.0, QPageLayout.Portrait)
+  assert enum == QPagedPaintDevice.A4
+  assert distance == pytest.approx(1.0)
+  assert matcher.nearest(211.0, 297.0, QPageLayout.Portrait, epsilon=0.5) == []
@@ -0,0 +1,75 @@
+
+import pytest
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.pageLayout.presetLibrary import PageLayoutPreset, PresetApplication, PageLayoutPresetLibrary
+from qtPrintFramework.printer.capabilityCache import PrinterCapabilities
+from qtPrintFramework.settings.settingsWriter import settingsWriter
+
+
+Legal = PageLayoutRecord(QPagedPaintDevice.Legal, QPageLayout.Landscape, (356, 216))
+Labels = PageLayoutRecord(QPagedPaintDevice.Custom, QPageLayout.Portrait, (100, 150))
+
+
+def capabilities(paperSizes, supportsCustomPageSizes):
+  return PrinterCapabilities("printer", "fingerprint", paperSizes, supportsCustomPageSizes, (300, ), paperSizes[0])
+
+
+@pytest.mark.parametrize("record, paperSizes, supportsCustom, expected", [
+  (Legal, (QPagedPaintDevice.A4, QPagedPaintDevice.Legal), False, True),
+  (Legal, (QPagedPaintDevice.A4, ), True, False),
+  (Labels, (QPagedPaintDevice.A4, ), True, True),
+  (Labels, (QPagedPaintDevice.A4, ), False, False),
+  ])
+def test_isSupported(qapp, record, paperSizes, supportsCustom, expected):
+  preset = PageLayoutPreset("preset", record)
+  assert PresetApplication(preset, capabilities(paperSizes, supportsCustom)).isSupported is expected
+
+
+def test_isSupportedUnknown(qapp):
+  ''' Unknown capabilities (e.g. a PDF printer) '''
+  assert PresetApplication(PageLayoutPreset("preset", Legal), None).isSupported is None
+
+
+@pytest.mark.parametrize("name, record", [
+  ("", Legal),
+  ("bad orientation", PageLayoutRecord(QPagedPaintDevice.A4, 7, (210, 297))),
+  ("empty custom", PageLayoutRecord(QPagedPaintDevice.Custom, QPageLayout.Portrait, (0, 150))),
+  ("unknown paper", PageLayoutRecord(9999, QPageLayout.Portrait, (210, 297))),
+  ])
+def test_invalidPresetRejected(qapp, name, record):
+  with pytest.raises(ValueError):
+    PageLayoutPreset(name, record)
+
+
+def test_applyToPrinterAndLayout(qapp):
+  from PyQt5.QtPrintSupport import QPrinter
+  from qtPrintFramework.pageLayout.pageLayout import PageLayout
+  from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+  printerAdaptor = PrinterAdaptor(None)
+  printerAdaptor.setOutputFormat(QPrinter.PdfFormat)
+  pageLayout = PageLayout()
+  library = PageLayoutPresetLibrary()
+  library.add("legal", Legal)
+  library.apply("legal", pageLayout, printerAdaptor)
+  assert pageLayout.toRecord() == Legal
+  snapshot = printerAdaptor.snapshot()
+  assert snapshot.paperValue.value == QPagedPaintDevice.Legal
+  assert snapshot.orientationValue.value == QPageLayout.Landscape
+  # Already applied: no setter
+  assert library.application(library.get("legal"), printerAdaptor).applyTo(printerAdaptor) == 0
+  with pytest.raises(KeyError):
+    library.apply("none", pageLayout)
+
+
+def test_persisted(qapp):
+  library = PageLayoutPresetLibrary()
+  library.add("labels", Labels)
+  library.add("legal", Legal)
+  library.remove("legal")
+  settingsWriter.flush()
+  other = PageLayoutPresetLibrary()
+  assert other.names() == ["labels"]
+  assert other.get("labels").record == Labels
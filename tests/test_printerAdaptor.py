@@ -0,0 +1,34 @@
+
+import pytest
+
+from PyQt5.QtCore import QSizeF
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+from PyQt5.QtPrintSupport import QPrinter
+
+
+
+@pytest.fixture
+def printerAdaptor(qapp):
+  from qtPrintFramework.printer.printerAdaptor import PrinterAdaptor
+  result = PrinterAdaptor(None)
+  result.setOutputFormat(QPrinter.PdfFormat)
+  return result
+
+
+def test_snapshotIsCached(printerAdaptor):
+  snapshot = printerAdaptor.snapshot()
+  assert printerAdaptor.snapshot() is snapshot
+  printerAdaptor.setPageOrientation(QPageLayout.Landscape)
+  assert printerAdaptor.snapshot() is not snapshot
+  assert printerAdaptor.snapshot().orientationValue.value == QPageLayout.Landscape
+
+
+def test_customSnapshotQueriesCounted(printerAdaptor):
+  ''' Snapshot of a Custom paper makes only its counted queries. '''
+  printerAdaptor.setPaperSize(QSizeF(100, 150), QPrinter.Millimeter)
+  printerAdaptor.invalidateSnapshot()
+  qtCallCountBefore = printerAdaptor.qtCallCount
+  snapshot = printerAdaptor.snapshot()
+  assert printerAdaptor.qtCallCount - qtCallCountBefore == 4
+  assert snapshot.paperValue.value == QPagedPaintDevice.Custom
+  assert snapshot.paperValue.integralDefinedSizeMM == (100, 150)
@@ -0,0 +1,57 @@
+
+import pytest
+
+from PyQt5.QtPrintSupport import QPrinter
+
+from qtPrintFramework.printer.printerBackend import printerBackend, setPrinterBackend
+from qtPrintFramework.printer.standInPrinterBackend import StandInPrinterBackend
+from qtPrintFramework.printer.printerAdaptorPool import PrinterAdaptorPool
+
+
+
+@pytest.fixture
+def pool(qapp):
+  previous = printerBackend()
+  backend = StandInPrinterBackend(printerCount=0)
+  for name in ("a", "b", "c"):
+    backend.addPrinter(name)
+  setPrinterBackend(backend)
+  yield PrinterAdaptorPool(maxSize=2)
+  setPrinterBackend(previous)
+
+
+def test_giveBackThenBorrowIsWarm(pool):
+  printerAdaptor = pool.borrow("a")
+  assert pool.misses == 1
+  pool.giveBack(printerAdaptor)
+  assert pool.borrow("a") is printerAdaptor
+  assert pool.hits == 1
+  assert len(pool) == 0     # Never lent twice
+
+
+def test_otherFormatIsOtherKey(pool):
+  printerAdaptor = pool.borrow("a")
+  pool.giveBack(printerAdaptor)
+  assert pool.borrow("", QPrinter.PdfFormat) is not printerAdaptor
+
+
+def test_leastRecentlyReturnedEvicted(pool):
+  a, b, c = pool.borrow("a"), pool.borrow("b"), pool.borrow("c")
+  pool.giveBack(a)
+  pool.giveBack(b)
+  pool.giveBack(c)          # Evicts a
+  assert len(pool) == 2
+  assert pool.evictions == 1
+  assert pool.borrow("b") is b
+  assert pool.borrow("c") is c
+  assert pool.borrow("a") is not a
+
+
+def test_returnedAgainIsMostRecent(pool):
+  a, b = pool.borrow("a"), pool.borrow("b")
+  pool.giveBack(a)
+  pool.giveBack(b)
+  pool.giveBack(pool.borrow("a"))   # a now most recent
+  pool.giveBack(pool.borrow("c"))   # Evicts b
+  assert pool.borrow("a") is a
+  assert pool.borrow("b") is not b
@@ -0,0 +1,76 @@
+
+import threading
+
+from qtPrintFramework.printer.printerSet import PrinterSet
+
+
+
+class FakePrinterInfo(object):
+  def __init__(self, name):
+    self._name = name
+
+  def printerName(self):
+    return self._name
+
+
+class ScriptedPrinterSet(PrinterSet):
+  '''
+  Query answers the next of answers, after its gate opens (if any.)
+  '''
+
+  def __init__(self, answers, gates=None):
+    super(ScriptedPrinterSet, self).__init__(timeToLive=60)
+    self._answers = list(answers)
+    self._gates = list(gates) if gates is not None else []
+    self._answersLock = threading.Lock()
+    self.queryStarted = threading.Event()
+
+  def _queryPrinters(self):
+    with self._answersLock:
+      names = self._answers.pop(0)
+      gate = self._gates.pop(0) if self._gates else None
+      self.queryStarted.set()
+    if gate is not None:
+      gate.wait(5)
+    return tuple(FakePrinterInfo(name) for name in names)
+
+
+
+def test_firstCallQueriesThenCaches(qapp):
+  printers = ScriptedPrinterSet([["a"], ["b"]])
+  assert printers.availablePrinterNames() == ["a"]
+  assert printers.availablePrinterNames() == ["a"]
+  printers.invalidate()
+  assert printers.availablePrinterNames() == ["b"]
+
+
+def test_staleWorkerResultIsDropped(qapp):
+  ''' A worker refresh that finishes after a newer synchronous refresh does not overwrite it. '''
+  workerGate = threading.Event()
+  printers = ScriptedPrinterSet([["old"], ["new"]], gates=[workerGate, None])
+  changed = []
+  printers._refreshed.disconnect()
+  printers._refreshed.connect(changed.append)   # Direct, for the test
+
+  printers.refresh(wait=False)        # Started first, blocks
+  assert printers.queryStarted.wait(5)
+  assert [info.printerName() for info in printers.refresh(wait=True)] == ["new"]
+  worker = printers._refreshThread
+  workerGate.set()
+  worker.join(5)
+  assert printers.availablePrinterNames() == ["new"]
+  assert changed == [False]   # Only the first snapshot, from the synchronous refresh
+
+
+def test_refreshStartedBeforeInvalidateIsDropped(qapp):
+  workerGate = threading.Event()
+  printers = ScriptedPrinterSet([["a"], ["old"], ["new"]], gates=[None, workerGate, None])
+  printers.availablePrinters()
+  printers.queryStarted.clear()
+  printers.refresh(wait=False)
+  assert printers.queryStarted.wait(5)
+  worker = printers._refreshThread
+  printers.invalidate()
+  workerGate.set()
+  worker.join(5)
+  assert printers.availablePrinterNames() == ["new"]
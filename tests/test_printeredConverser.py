@@ -0,0 +1,51 @@
+
+import pytest
+
+from PyQt5.QtGui import QPagedPaintDevice, QPageLayout
+
+import qtPrintFramework.config as config
+from qtPrintFramework.pageLayout.pageLayoutRecord import PageLayoutRecord
+from qtPrintFramework.printer.printerAdaptorPool import printerAdaptorPool
+
+
+Legal = PageLayoutRecord(QPagedPaintDevice.Legal, QPageLayout.Landscape, (356, 216))
+
+
+@pytest.fixture
+def converser(qapp, monkeypatch):
+  from PyQt5.QtWidgets import QWidget
+  from qtPrintFramework.converser.printered import PrinteredConverser
+  monkeypatch.setattr(config, "useQML", False)
+  result = PrinteredConverser(QWidget())
+  yield result
+  result.releasePrinter()
+
+
+def test_releaseThenUsePrinterReconnectsAndReuses(converser):
+  changes = []
+  converser.userChangedLayout.connect(changes.append)
+  printerAdaptor = converser.printerAdaptor
+  converser.releasePrinter()
+  assert converser.printerAdaptor is None
+  converser.pageLayout.setValuesFromRecord(Legal)   # Not propagated, no printer
+  assert changes == []
+
+  hits = printerAdaptorPool.hits
+  converser.usePrinter()
+  assert converser.printerAdaptor is printerAdaptor   # Warm, from the pool
+  assert printerAdaptorPool.hits == hits + 1
+  assert printerAdaptor.snapshot().paperValue.value == QPagedPaintDevice.Legal  # Propagated on use
+
+  converser.pageLayout.setValuesFromRecord(PageLayoutRecord(QPagedPaintDevice.A4, QPageLayout.Portrait, (210, 297)))
+  assert len(changes) == 1
+  assert printerAdaptor.snapshot().paperValue.value == QPagedPaintDevice.A4
+
+
+def test_usedAfterReleaseBorrowsAgain(converser):
+  printerAdaptor = converser.printerAdaptor
+  converser.releasePrinter()
+  converser.pageLayout.setValuesFromRecord(Legal)
+  size = converser.printablePageSizeInch()
+  assert converser.printerAdaptor is printerAdaptor
+  assert size.width() > size.height()   # Landscape, propagated when borrowed again
+  assert converser.printableRectInch() == printerAdaptor.snapshot().printableRectInch
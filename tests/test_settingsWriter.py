@@ -0,0 +1,100 @@
+
+import os
+import subprocess
+import sys
+import time
+
+from qtPrintFramework.settings.settingsBackend import SettingsBackend, MemorySettingsBackend, setSettingsBackend
+from qtPrintFramework.settings.settingsWriter import SettingsWriter
+
+
+
+class FailingSettingsBackend(MemorySettingsBackend):
+  ''' Fails the next failures writes. '''
+
+  def __init__(self, failures=1):
+    super(FailingSettingsBackend, self).__init__()
+    self.failures = failures
+
+  def write(self, group, values):
+    if self.failures > 0:
+      self.failures -= 1
+      raise OSError("disk full")
+    super(FailingSettingsBackend, self).write(group, values)
+
+
+
+def waitUntil(condition, timeout=5.0):
+  deadline = time.monotonic() + timeout
+  while not condition() and time.monotonic() < deadline:
+    time.sleep(0.01)
+  return condition()
+
+
+def test_burstIsOneWrite(memorySettings):
+  writer = SettingsWriter(coalesceWindow=0.1)
+  for index in range(50):
+    writer.write("group", {"key" : index})
+  assert writer.isPending
+  assert waitUntil(lambda: not writer.isPending)
+  assert writer.writesRequested == 50
+  assert writer.writesPerformed == 1
+  assert memorySettings.read("group") == {"key" : 49}
+
+
+def test_flushWritesNow(memorySettings):
+  writer = SettingsWriter(coalesceWindow=60)
+  writer.write("group", {"a" : 1})
+  writer.write("other", {"b" : 2})
+  assert memorySettings.read("group") == {}
+  writer.flush()
+  assert memorySettings.read("group") == {"a" : 1}
+  assert memorySettings.read("other") == {"b" : 2}
+  assert not writer.isPending
+
+
+def test_zeroWindowIsSynchronous(memorySettings):
+  writer = SettingsWriter(coalesceWindow=0)
+  writer.write("group", {"a" : 1})
+  assert memorySettings.read("group") == {"a" : 1}
+  assert writer._thread is None
+
+
+def test_failedWriteStaysPendingAndWorkerSurvives():
+  backend = FailingSettingsBackend(failures=1)
+  setSettingsBackend(backend)
+  writer = SettingsWriter(coalesceWindow=0.05)
+  writer.write("group", {"a" : 1, "b" : 1})
+  # First write fails, retried after coalesceWindow by the same worker
+  assert waitUntil(lambda: backend.read("group") == {"a" : 1, "b" : 1})
+  assert writer._thread.is_alive()
+  writer.write("group", {"b" : 2})
+  assert waitUntil(lambda: backend.read("group") == {"a" : 1, "b" : 2})
+
+
+def test_failedFlushKeepsValuesNewerWin():
+  backend = FailingSettingsBackend(failures=1)
+  setSettingsBackend(backend)
+  writer = SettingsWriter(coalesceWindow=60)
+  writer.write("group", {"a" : 1, "b" : 1})
+  writer.flush()  # Fails: not raised
+  assert writer.isPending
+  writer.write("group", {"b" : 2})
+  writer.flush()
+  assert backend.read("group") == {"a" : 1, "b" : 2}
+
+
+def test_flushOnExit(tmp_path):
+  ''' A pending write is written at interpreter exit (atexit), though the worker is a daemon. '''
+  path = str(tmp_path / "profile.json")
+  script = "\n".join((
+    "from qtPrintFramework.settings.settingsBackend import JSONSettingsBackend, setSettingsBackend",
+    "from qtPrintFramework.settings.settingsWriter import SettingsWriter",
+    "setSettingsBackend(JSONSettingsBackend(path={!r}))".format(path),
+    "writer = SettingsWriter(coalesceWindow=60)",
+    "writer.write('group', {'key' : 'value'})",
+    ))
+  root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+  subprocess.check_call([sys.executable, "-c", script], cwd=root)
+  from qtPrintFramework.settings.settingsBackend import JSONSettingsBackend
+  assert JSONSettingsBackend(path=path).read("group") == {"key" : "value"}